@@ -9,7 +9,13 @@ import cv2
 import numpy as np
 import pandas as pd
 
-from cpp_dlc_live.analysis.metrics import compute_speed_series, compute_summary, normalize_chamber_series
+from cpp_dlc_live.analysis.metrics import (
+    AnalysisView,
+    compute_speed_series,
+    compute_summary,
+    compute_summary_streaming,
+    normalize_chamber_series,
+)
 from cpp_dlc_live.analysis.plots import (
     plot_chamber_time_bars,
     plot_occupancy,
@@ -23,8 +29,24 @@ from cpp_dlc_live.utils.io_utils import (
     ensure_prefixed_filename,
     load_yaml,
     resolve_session_file,
+    save_parquet_if_available,
 )
 
+# Column types written by the realtime CSVRecorder; declaring them skips per-column type inference.
+_LOG_DTYPES = {
+    "t_wall": "float64",
+    "frame_idx": "float64",
+    "x": "float64",
+    "y": "float64",
+    "p": "float64",
+    "chamber_raw": "object",
+    "chamber": "object",
+    "laser_state": "float64",
+    "inference_ms": "float64",
+    "fps_est": "float64",
+}
+_LOG_CHUNK_ROWS = 200_000
+
 
 def analyze_session(
     session_dir: Path,
@@ -75,18 +97,25 @@ def analyze_session(
     )
     logger.info("Analyze options: output_plots=%s fixed_fps_hz=%s cm_per_px=%s", output_plots, fixed_fps_hz, cm_per_px)
 
-    df = pd.read_csv(log_path)
-    if len(df) > 0:
-        df = df.copy()
-        df["chamber"] = normalize_chamber_series(df.get("chamber"), length=len(df))
-
-    df, resolved_start_s, resolved_end_s = _filter_time_range(
-        df=df,
-        fixed_fps_hz=fixed_fps_hz,
-        time_start_s=time_start_s,
-        time_end_s=time_end_s,
-        logger=logger,
+    needs_frame_data = (
+        output_plots or render_overlay_video or time_start_s is not None or time_end_s is not None
     )
+    df: Optional[pd.DataFrame] = None
+    resolved_start_s: Optional[float] = None
+    resolved_end_s: Optional[float] = None
+    if needs_frame_data:
+        df = _read_realtime_log(log_path)
+        if len(df) > 0:
+            df = df.copy()
+            df["chamber"] = normalize_chamber_series(df.get("chamber"), length=len(df))
+
+        df, resolved_start_s, resolved_end_s = _filter_time_range(
+            df=df,
+            fixed_fps_hz=fixed_fps_hz,
+            time_start_s=time_start_s,
+            time_end_s=time_end_s,
+            logger=logger,
+        )
 
     output_dir = _resolve_analysis_output_dir(
         session_dir=session_dir,
@@ -95,18 +124,40 @@ def analyze_session(
         time_end_s=resolved_end_s,
     )
     output_dir.mkdir(parents=True, exist_ok=True)
-    summary = compute_summary(df, cm_per_px=cm_per_px, fixed_fps_hz=fixed_fps_hz)
+    view: Optional[AnalysisView] = None
+    step_dist: Optional[np.ndarray] = None
+    if df is not None:
+        # Coerce the numeric/chamber columns once; summary and every plot reuse the same arrays.
+        view = AnalysisView.from_frame(df)
+        step_dist = view.step_distance()
+        summary = compute_summary(
+            df,
+            cm_per_px=cm_per_px,
+            fixed_fps_hz=fixed_fps_hz,
+            step_dist=step_dist,
+            view=view,
+        )
+    else:
+        # Summary-only runs stream the log so multi-hour sessions never sit fully in memory.
+        summary = _summarize_realtime_log_streaming(log_path, cm_per_px=cm_per_px, fixed_fps_hz=fixed_fps_hz)
 
     file_prefix = detect_session_file_prefix(session_dir)
     summary_name = ensure_prefixed_filename("summary.csv", file_prefix) if file_prefix else "summary.csv"
     summary_path = output_dir / summary_name
-    pd.DataFrame([summary]).to_csv(summary_path, index=False)
+    summary_df = pd.DataFrame([summary])
+    summary_df.to_csv(summary_path, index=False)
     logger.info("Summary written: %s", summary_path)
+    try:
+        summary_parquet = save_parquet_if_available(summary_df, summary_path.with_suffix(".parquet"))
+        if summary_parquet is not None:
+            logger.info("Summary parquet written: %s", summary_parquet)
+    except Exception:
+        logger.exception("Failed to write summary parquet")
     if fixed_fps_hz is not None:
         logger.info("Using fixed FPS for analysis: %.3f Hz", float(fixed_fps_hz))
 
     if output_plots:
-        speed_df = compute_speed_series(df, fixed_fps_hz=fixed_fps_hz)
+        speed_df = compute_speed_series(df, fixed_fps_hz=fixed_fps_hz, step_dist=step_dist, view=view)
         roi_cfg = config.get("roi", {}) if isinstance(config, dict) else {}
         frame_shape = _resolve_frame_shape(session_dir=session_dir, config=config, logger=logger)
 
@@ -155,15 +206,22 @@ def analyze_session(
                         roi_cfg=roi_cfg,
                         out_path=out_path,
                         frame_shape=frame_shape,
+                        view=view,
                     )
                 elif label == "figure2":
-                    plot_position_heatmap(df=df, roi_cfg=roi_cfg, out_path=out_path, frame_shape=frame_shape)
+                    plot_position_heatmap(
+                        df=df,
+                        roi_cfg=roi_cfg,
+                        out_path=out_path,
+                        frame_shape=frame_shape,
+                        view=view,
+                    )
                 elif label == "figure3":
-                    plot_chamber_time_bars(df=df, out_path=out_path, fixed_fps_hz=fixed_fps_hz)
+                    plot_chamber_time_bars(df=df, out_path=out_path, fixed_fps_hz=fixed_fps_hz, view=view)
                 elif label == "speed_over_time":
                     plot_speed(speed_df, out_path=out_path)
                 elif label == "occupancy_over_time":
-                    plot_occupancy(df, out_path=out_path)
+                    plot_occupancy(df, out_path=out_path, view=view)
                 if out_path.exists():
                     plots_written += 1
                 logger.info("Plot written: %s", out_path)
@@ -194,6 +252,27 @@ def analyze_session(
     return summary_path
 
 
+def _read_realtime_log(log_path: Path) -> pd.DataFrame:
+    try:
+        return pd.read_csv(log_path, dtype=_LOG_DTYPES)
+    except (TypeError, ValueError):
+        # Hand-edited or legacy logs may hold non-numeric cells; let pandas infer and coerce later.
+        return pd.read_csv(log_path)
+
+
+def _summarize_realtime_log_streaming(
+    log_path: Path,
+    cm_per_px: Optional[float],
+    fixed_fps_hz: Optional[float],
+) -> dict:
+    try:
+        with pd.read_csv(log_path, dtype=_LOG_DTYPES, chunksize=_LOG_CHUNK_ROWS) as reader:
+            return compute_summary_streaming(reader, cm_per_px=cm_per_px, fixed_fps_hz=fixed_fps_hz)
+    except (TypeError, ValueError):
+        with pd.read_csv(log_path, chunksize=_LOG_CHUNK_ROWS) as reader:
+            return compute_summary_streaming(reader, cm_per_px=cm_per_px, fixed_fps_hz=fixed_fps_hz)
+
+
 def _coerce_optional_positive_float(value: object, field_name: str) -> Optional[float]:
     if value is None:
         return None
@@ -250,7 +329,7 @@ def render_session_overlay_video(
 
     if df is None:
         log_path = resolve_session_file(session_dir, "cpp_realtime_log.csv")
-        df = pd.read_csv(log_path)
+        df = _read_realtime_log(log_path)
     if config is None:
         config = {}
         cfg_path = resolve_session_file(session_dir, "config_used.yaml")
@@ -326,9 +405,8 @@ def render_session_overlay_video(
                     last_target_frame = target_frame
                 frame_i += 1
 
-                vis = frame.copy()
-                if roi is not None:
-                    vis = roi.draw(vis)
+                # `frame` is freshly decoded and not reused, so draw on it directly.
+                vis = roi.draw(frame, out=frame) if roi is not None else frame
 
                 x = _safe_float(row.get("x"))
                 y = _safe_float(row.get("y"))
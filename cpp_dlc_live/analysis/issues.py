@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
-from cpp_dlc_live.utils.io_utils import detect_session_file_prefix, ensure_prefixed_filename, resolve_session_file
+from cpp_dlc_live.utils.io_utils import (
+    detect_session_file_prefix,
+    ensure_prefixed_filename,
+    resolve_session_file,
+    save_json,
+    save_parquet_if_available,
+)
+from cpp_dlc_live.utils.json_utils import JSONDecodeError, json_dumps_sorted, json_loads
 
 
 def analyze_issues(
@@ -53,11 +62,20 @@ def analyze_issues(
     logger.info("Issue summary written: %s", issue_summary_path)
     logger.info("Incident summary written: %s", incident_summary_path)
 
-    return {
+    outputs = {
         "issue_timeline": timeline_path,
         "issue_summary": issue_summary_path,
         "incident_summary": incident_summary_path,
     }
+    try:
+        timeline_parquet = save_parquet_if_available(timeline_df, timeline_path.with_suffix(".parquet"))
+    except Exception:
+        logger.exception("Failed to write issue timeline parquet")
+        timeline_parquet = None
+    if timeline_parquet is not None:
+        logger.info("Issue timeline parquet written: %s", timeline_parquet)
+        outputs["issue_timeline_parquet"] = timeline_parquet
+    return outputs
 
 
 def _load_metadata(session_dir: Path) -> Dict[str, Any]:
@@ -114,8 +132,8 @@ def _read_issue_events(issue_path: Path, logger: logging.Logger) -> List[Dict[st
             if not text:
                 continue
             try:
-                payload = json.loads(text)
-            except json.JSONDecodeError as exc:
+                payload = json_loads(text)
+            except JSONDecodeError as exc:
                 logger.warning("Skip invalid issue JSONL line %d: %s", line_no, exc)
                 events.append(
                     {
@@ -143,6 +161,29 @@ def _read_issue_events(issue_path: Path, logger: logging.Logger) -> List[Dict[st
     return events
 
 
+# Sidecar holding parsed incident rows, reused while the incident_report_*.json set is unchanged.
+_INCIDENT_CACHE_NAME = ".incident_summary_cache.json"
+# Part of the cache key; bump when parsing changes so older sidecars are rebuilt.
+# 2: reports with NaN literals parse instead of becoming JSONDecodeError rows.
+_INCIDENT_CACHE_VERSION = 2
+# Last whole second pandas can hold as a Timestamp (2262-04-11).
+_PANDAS_MAX_EPOCH_S = pd.Timestamp.max.floor("s").timestamp()
+
+_TIMELINE_SOURCE_KEYS = [
+    "t_wall",
+    "event",
+    "level",
+    "frame_idx",
+    "chamber",
+    "to_chamber",
+    "chamber_raw",
+    "laser_state",
+    "to_state",
+    "exception_type",
+    "exception_message",
+]
+
+
 def _build_timeline(events: List[Dict[str, Any]]) -> pd.DataFrame:
     columns = [
         "event_idx",
@@ -160,58 +201,34 @@ def _build_timeline(events: List[Dict[str, Any]]) -> pd.DataFrame:
     if not events:
         return pd.DataFrame(columns=columns)
 
-    rows: List[Dict[str, Any]] = []
-    for idx, event in enumerate(events):
-        t_wall = _to_float(event.get("t_wall"))
-        event_name = str(event.get("event", "unknown"))
-        level = str(event.get("level", "INFO")).upper()
-        frame_idx = _to_int(event.get("frame_idx"))
-        chamber = _opt_str(event.get("chamber"))
-        if chamber is None:
-            chamber = _opt_str(event.get("to_chamber"))
-        if chamber is None:
-            chamber = _opt_str(event.get("chamber_raw"))
-        laser_state = _to_int(event.get("laser_state"))
-        if laser_state is None:
-            laser_state = _to_int(event.get("to_state"))
-        exception_type = _opt_str(event.get("exception_type"))
-        exception_message = _opt_str(event.get("exception_message"))
-
-        details = {
-            k: v
-            for k, v in event.items()
-            if k
-            not in {
-                "t_wall",
-                "event",
-                "level",
-                "frame_idx",
-                "chamber",
-                "to_chamber",
-                "chamber_raw",
-                "laser_state",
-                "to_state",
-                "exception_type",
-                "exception_message",
-            }
-        }
-        rows.append(
-            {
-                "event_idx": idx,
-                "t_wall": t_wall,
-                "t_utc": _epoch_to_utc(t_wall),
-                "level": level,
-                "event": event_name,
-                "frame_idx": frame_idx,
-                "chamber": chamber,
-                "laser_state": laser_state,
-                "exception_type": exception_type,
-                "exception_message": exception_message,
-                "details_json": json.dumps(details, ensure_ascii=False, sort_keys=True),
-            }
-        )
+    # Column-wise extraction: one pandas pass per field instead of one dict per event.
+    raw = pd.DataFrame.from_records(events).reindex(columns=_TIMELINE_SOURCE_KEYS)
+    t_wall = pd.to_numeric(raw["t_wall"], errors="coerce").astype(float)
+    chamber = _opt_str_series(raw["chamber"])
+    chamber = chamber.fillna(_opt_str_series(raw["to_chamber"])).fillna(_opt_str_series(raw["chamber_raw"]))
+    laser_state = _to_int_series(raw["laser_state"]).fillna(_to_int_series(raw["to_state"]))
 
-    return pd.DataFrame(rows, columns=columns)
+    details_json = [
+        json_dumps_sorted({k: v for k, v in event.items() if k not in _TIMELINE_SOURCE_KEYS})
+        for event in events
+    ]
+
+    return pd.DataFrame(
+        {
+            "event_idx": np.arange(len(events)),
+            "t_wall": t_wall,
+            "t_utc": _epoch_series_to_utc(t_wall),
+            "level": raw["level"].where(raw["level"].notna(), "INFO").astype(str).str.upper(),
+            "event": raw["event"].where(raw["event"].notna(), "unknown").astype(str),
+            "frame_idx": _to_int_series(raw["frame_idx"]),
+            "chamber": chamber,
+            "laser_state": laser_state,
+            "exception_type": _opt_str_series(raw["exception_type"]),
+            "exception_message": _opt_str_series(raw["exception_message"]),
+            "details_json": details_json,
+        },
+        columns=columns,
+    )
 
 
 def _build_issue_summary(timeline_df: pd.DataFrame) -> pd.DataFrame:
@@ -227,19 +244,35 @@ def _build_issue_summary(timeline_df: pd.DataFrame) -> pd.DataFrame:
     if timeline_df.empty:
         return pd.DataFrame(columns=columns)
 
-    grouped = (
-        timeline_df.groupby(["event", "level"], dropna=False)
-        .agg(
-            count=("event_idx", "count"),
-            first_t_wall=("t_wall", "min"),
-            last_t_wall=("t_wall", "max"),
-            first_frame_idx=("frame_idx", "min"),
-            last_frame_idx=("frame_idx", "max"),
-        )
-        .reset_index()
-        .sort_values(by=["count", "event", "level"], ascending=[False, True, True])
+    # Sort-and-reduce instead of groupby: issue timelines are small, so pandas'
+    # per-column groupby dispatch dominates the actual arithmetic.
+    keys = pd.MultiIndex.from_arrays(
+        [timeline_df["event"].to_numpy(dtype=object), timeline_df["level"].to_numpy(dtype=object)]
     )
-    return grouped[columns]
+    codes, uniques = keys.factorize()
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    starts = np.r_[0, np.flatnonzero(np.diff(sorted_codes)) + 1]
+    counts = np.diff(np.r_[starts, sorted_codes.size])
+
+    t_wall = pd.to_numeric(timeline_df["t_wall"], errors="coerce").to_numpy(dtype=float)[order]
+    frame_idx = pd.to_numeric(timeline_df["frame_idx"], errors="coerce").to_numpy(dtype=float)[order]
+    group_keys = uniques[sorted_codes[starts]]
+
+    grouped = pd.DataFrame(
+        {
+            "event": group_keys.get_level_values(0),
+            "level": group_keys.get_level_values(1),
+            "count": counts,
+            # fmin/fmax skip NaN like groupby min/max do.
+            "first_t_wall": np.fmin.reduceat(t_wall, starts),
+            "last_t_wall": np.fmax.reduceat(t_wall, starts),
+            "first_frame_idx": pd.array(np.fmin.reduceat(frame_idx, starts), dtype="Int64"),
+            "last_frame_idx": pd.array(np.fmax.reduceat(frame_idx, starts), dtype="Int64"),
+        },
+        columns=columns,
+    )
+    return grouped.sort_values(by=["count", "event", "level"], ascending=[False, True, True], ignore_index=True)
 
 
 def _build_incident_summary(session_dir: Path, logger: logging.Logger) -> pd.DataFrame:
@@ -252,58 +285,98 @@ def _build_incident_summary(session_dir: Path, logger: logging.Logger) -> pd.Dat
         "chamber",
         "laser_state",
     ]
-    rows: List[Dict[str, Any]] = []
+    # Accumulate column-wise so the DataFrame is built without per-row dict inference.
+    data: Dict[str, List[Any]] = {name: [] for name in columns}
+
+    def _add(
+        file: str,
+        time_utc: Optional[str],
+        exception_type: Optional[str],
+        exception_message: Optional[str],
+        frame_idx: Optional[int] = None,
+        chamber: Optional[str] = None,
+        laser_state: Optional[int] = None,
+    ) -> None:
+        data["file"].append(file)
+        data["time_utc"].append(time_utc)
+        data["exception_type"].append(exception_type)
+        data["exception_message"].append(exception_message)
+        data["frame_idx"].append(frame_idx)
+        data["chamber"].append(chamber)
+        data["laser_state"].append(laser_state)
 
     incident_files = list(session_dir.glob("incident_report_*.json"))
     incident_files.extend(session_dir.glob("*_incident_report_*.json"))
-    for path in sorted(set(incident_files)):
+    incident_paths = sorted(set(incident_files))
+    if not incident_paths:
+        return pd.DataFrame(data, columns=columns)
+
+    cache_path = session_dir / _INCIDENT_CACHE_NAME
+    cache_key = _incident_cache_key(incident_paths)
+    cached = _load_incident_cache(cache_path, cache_key, columns)
+    if cached is not None:
+        return pd.DataFrame(cached, columns=columns)
+
+    for path in incident_paths:
         try:
-            with path.open("r", encoding="utf-8") as f:
-                payload = json.load(f)
+            payload = json_loads(path.read_bytes())
         except Exception as exc:
             logger.warning("Skip invalid incident report %s: %s", path, exc)
-            rows.append(
-                {
-                    "file": path.name,
-                    "time_utc": None,
-                    "exception_type": type(exc).__name__,
-                    "exception_message": str(exc),
-                    "frame_idx": None,
-                    "chamber": None,
-                    "laser_state": None,
-                }
-            )
+            _add(path.name, None, type(exc).__name__, str(exc))
             continue
 
         if not isinstance(payload, dict):
-            rows.append(
-                {
-                    "file": path.name,
-                    "time_utc": None,
-                    "exception_type": "InvalidIncidentReport",
-                    "exception_message": f"Unexpected root type: {type(payload).__name__}",
-                    "frame_idx": None,
-                    "chamber": None,
-                    "laser_state": None,
-                }
+            _add(
+                path.name,
+                None,
+                "InvalidIncidentReport",
+                f"Unexpected root type: {type(payload).__name__}",
             )
             continue
 
         ctx = payload.get("last_context", {})
         ctx = ctx if isinstance(ctx, dict) else {}
-        rows.append(
-            {
-                "file": path.name,
-                "time_utc": _opt_str(payload.get("time_utc")),
-                "exception_type": _opt_str(payload.get("exception_type")),
-                "exception_message": _opt_str(payload.get("exception_message")),
-                "frame_idx": _to_int(ctx.get("frame_idx")),
-                "chamber": _opt_str(ctx.get("chamber")),
-                "laser_state": _to_int(ctx.get("laser_state")),
-            }
+        _add(
+            path.name,
+            _opt_str(payload.get("time_utc")),
+            _opt_str(payload.get("exception_type")),
+            _opt_str(payload.get("exception_message")),
+            frame_idx=_to_int(ctx.get("frame_idx")),
+            chamber=_opt_str(ctx.get("chamber")),
+            laser_state=_to_int(ctx.get("laser_state")),
         )
 
-    return pd.DataFrame(rows, columns=columns)
+    try:
+        save_json({"key": cache_key, "columns": data}, cache_path)
+    except Exception as exc:
+        logger.warning("Failed to write incident summary cache %s: %s", cache_path, exc)
+    return pd.DataFrame(data, columns=columns)
+
+
+def _incident_cache_key(paths: List[Path]) -> Dict[str, Any]:
+    names = "\n".join(p.name for p in paths)
+    return {
+        "version": _INCIDENT_CACHE_VERSION,
+        "max_mtime_ns": max(p.stat().st_mtime_ns for p in paths),
+        "names_sha1": hashlib.sha1(names.encode("utf-8")).hexdigest(),
+    }
+
+
+def _load_incident_cache(
+    cache_path: Path, cache_key: Dict[str, Any], columns: List[str]
+) -> Optional[Dict[str, List[Any]]]:
+    if not cache_path.exists():
+        return None
+    try:
+        payload = json_loads(cache_path.read_bytes())
+    except Exception:
+        return None
+    if not isinstance(payload, dict) or payload.get("key") != cache_key:
+        return None
+    data = payload.get("columns")
+    if not isinstance(data, dict) or not all(isinstance(data.get(name), list) for name in columns):
+        return None
+    return data
 
 
 def _resolve_file_prefix(session_dir: Path, metadata: Dict[str, Any]) -> Optional[str]:
@@ -313,24 +386,36 @@ def _resolve_file_prefix(session_dir: Path, metadata: Dict[str, Any]) -> Optiona
     return detect_session_file_prefix(session_dir)
 
 
-def _epoch_to_utc(ts: Optional[float]) -> Optional[str]:
-    if ts is None:
-        return None
-    if ts < 0:
-        return None
+def _epoch_series_to_utc(ts: pd.Series) -> pd.Series:
+    # pandas Timestamps stop in 2262; later (or garbage, e.g. millisecond) epochs go
+    # through datetime one by one and become None where datetime cannot represent them.
+    vectorized = (ts >= 0) & (ts < _PANDAS_MAX_EPOCH_S)
+    stamps = pd.to_datetime(ts.where(vectorized), unit="s", utc=True, errors="coerce").dt.round("us")
+    # Match datetime.isoformat(): microseconds are only printed when non-zero.
+    text = stamps.dt.strftime("%Y-%m-%dT%H:%M:%S.%f+00:00").str.replace(".000000+", "+", regex=False)
+    text = text.astype(object).where(stamps.notna(), None)
+    beyond = ts >= _PANDAS_MAX_EPOCH_S
+    if beyond.any():
+        text[beyond] = [_epoch_to_utc(float(v)) for v in ts[beyond]]
+    return text
+
+
+def _epoch_to_utc(ts: float) -> Optional[str]:
     try:
         return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
     except (OverflowError, OSError, ValueError):
         return None
 
 
-def _to_float(value: Any) -> Optional[float]:
-    if value is None:
-        return None
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
+def _to_int_series(values: pd.Series) -> pd.Series:
+    numeric = pd.to_numeric(values, errors="coerce").astype(float).to_numpy()
+    numeric = np.where(np.isfinite(numeric), np.trunc(numeric), np.nan)
+    return pd.Series(pd.array(numeric, dtype="Int64"), index=values.index)
+
+
+def _opt_str_series(values: pd.Series) -> pd.Series:
+    text = values.map(str, na_action="ignore").astype(object)
+    return text.where(text.notna() & (text != ""), None)
 
 
 def _to_int(value: Any) -> Optional[int]:
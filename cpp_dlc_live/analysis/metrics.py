@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except Exception:  # pragma: no cover - optional runtime fallback
+    njit = None  # type: ignore[assignment]
+
 _VALID_CHAMBERS = {"chamber1", "chamber2", "neutral"}
+# Integer codes used for one-pass chamber accumulation (0 is reserved for unmapped labels).
+_CHAMBER_CODES = {"chamber1": 1, "chamber2": 2, "neutral": 3}
 
 
 def normalize_chamber_series(values: object, length: int) -> pd.Series:
@@ -32,31 +40,78 @@ def normalize_chamber_series(values: object, length: int) -> pd.Series:
     return chamber
 
 
+@dataclass
+class AnalysisView:
+    """Realtime-log columns coerced to NumPy once and shared by metrics and plots.
+
+    `chamber_code` holds normalized chamber labels as integers
+    (1=chamber1, 2=chamber2, 3=neutral); `laser` has missing values as 0.
+    """
+
+    t: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    chamber_code: np.ndarray
+    laser: np.ndarray
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "AnalysisView":
+        n = len(df)
+        chamber = normalize_chamber_series(df.get("chamber"), length=n)
+        return cls(
+            t=_numeric_column(df, "t_wall", n),
+            x=_numeric_column(df, "x", n),
+            y=_numeric_column(df, "y", n),
+            chamber_code=chamber.map(_CHAMBER_CODES).fillna(0).to_numpy(dtype=np.intp),
+            laser=np.nan_to_num(_numeric_column(df, "laser_state", n), nan=0.0),
+        )
+
+    def __len__(self) -> int:
+        return int(self.t.size)
+
+    def dt_seconds(self, fixed_fps_hz: Optional[float] = None) -> np.ndarray:
+        return _dt_from_times(self.t, fixed_fps_hz=fixed_fps_hz)
+
+    def chamber_totals(self, weights: np.ndarray) -> Dict[str, float]:
+        """Sum `weights` per chamber in a single bincount pass."""
+        totals = np.bincount(self.chamber_code, weights=weights, minlength=len(_CHAMBER_CODES) + 1)
+        return {label: float(totals[code]) for label, code in _CHAMBER_CODES.items()}
+
+    def step_distance(self) -> np.ndarray:
+        if self.x.size < 2:
+            return np.array([], dtype=float)
+        return np.hypot(np.diff(self.x), np.diff(self.y))
+
+
 def compute_dt_seconds(df: pd.DataFrame, fixed_fps_hz: Optional[float] = None) -> np.ndarray:
     if "t_wall" not in df.columns or df.empty:
         return np.array([], dtype=float)
+    t = pd.to_numeric(df["t_wall"], errors="coerce").to_numpy(dtype=float)
+    return _dt_from_times(t, fixed_fps_hz=fixed_fps_hz)
 
+
+def _dt_from_times(t: np.ndarray, fixed_fps_hz: Optional[float] = None) -> np.ndarray:
     if fixed_fps_hz is not None:
         fps = float(fixed_fps_hz)
         if fps <= 0:
             raise ValueError("fixed_fps_hz must be > 0")
-        return np.full(len(df), 1.0 / fps, dtype=float)
+        return np.full(len(t), 1.0 / fps, dtype=float)
 
-    t = pd.to_numeric(df["t_wall"], errors="coerce").to_numpy(dtype=float)
     n = len(t)
-    dt = np.zeros(n, dtype=float)
-
     if n <= 1:
-        return dt
-
-    diffs = np.diff(t)
-    diffs = np.where(np.isfinite(diffs), diffs, np.nan)
-    diffs = np.where(diffs >= 0, diffs, 0.0)
-
-    dt[:-1] = np.nan_to_num(diffs, nan=0.0, posinf=0.0, neginf=0.0)
-
-    positive = dt[:-1][dt[:-1] > 0]
-    dt[-1] = float(np.median(positive)) if positive.size else 0.0
+        return np.zeros(n, dtype=float)
+
+    dt = np.empty(n, dtype=np.float64)
+    body = dt[:-1]
+    np.subtract(t[1:], t[:-1], out=body)
+    # Non-finite and negative (clock step back) intervals carry no time.
+    np.nan_to_num(body, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    np.maximum(body, 0.0, out=body)
+
+    # The last frame has no successor; use the median interval. `positive` is
+    # already a private copy, so let median partition it in place.
+    positive = body[body > 0]
+    dt[-1] = float(np.median(positive, overwrite_input=True)) if positive.size else 0.0
     return dt
 
 
@@ -72,31 +127,32 @@ def state_stats_dt(dt: np.ndarray) -> np.ndarray:
     return out
 
 
-def compute_speed_series(df: pd.DataFrame, fixed_fps_hz: Optional[float] = None) -> pd.DataFrame:
+def compute_speed_series(
+    df: pd.DataFrame,
+    fixed_fps_hz: Optional[float] = None,
+    step_dist: Optional[np.ndarray] = None,
+    view: Optional[AnalysisView] = None,
+) -> pd.DataFrame:
     n = len(df)
     if n == 0:
         return pd.DataFrame(columns=["t_wall", "speed_px_s"])
 
-    dt = compute_dt_seconds(df, fixed_fps_hz=fixed_fps_hz)
-    x = pd.to_numeric(df.get("x"), errors="coerce").to_numpy(dtype=float)
-    y = pd.to_numeric(df.get("y"), errors="coerce").to_numpy(dtype=float)
+    view = view if view is not None else AnalysisView.from_frame(df)
+    dt = view.dt_seconds(fixed_fps_hz=fixed_fps_hz)
 
     speed = np.full(n, np.nan, dtype=float)
     if n > 1:
-        dx = np.diff(x)
-        dy = np.diff(y)
-        dist = np.sqrt(dx * dx + dy * dy)
+        dist = step_dist if step_dist is not None else view.step_distance()
         step_dt = dt[:-1]
         valid = np.isfinite(dist) & np.isfinite(step_dt) & (step_dt > 0)
-        tmp = np.full(n - 1, np.nan, dtype=float)
-        tmp[valid] = dist[valid] / step_dt[valid]
-        speed[1:] = tmp
+        np.divide(dist, step_dt, out=speed[1:], where=valid)
 
     return pd.DataFrame(
         {
-            "t_wall": pd.to_numeric(df.get("t_wall"), errors="coerce"),
+            "t_wall": view.t,
             "speed_px_s": speed,
-        }
+        },
+        index=df.index,
     )
 
 
@@ -104,6 +160,8 @@ def compute_summary(
     df: pd.DataFrame,
     cm_per_px: Optional[float] = None,
     fixed_fps_hz: Optional[float] = None,
+    step_dist: Optional[np.ndarray] = None,
+    view: Optional[AnalysisView] = None,
 ) -> Dict[str, Any]:
     if df.empty:
         return {
@@ -119,30 +177,239 @@ def compute_summary(
             "n_samples": 0,
         }
 
-    dt = compute_dt_seconds(df, fixed_fps_hz=fixed_fps_hz)
-    chamber = normalize_chamber_series(df.get("chamber"), length=len(df))
-    dt_state = state_stats_dt(dt)
+    view = view if view is not None else AnalysisView.from_frame(df)
+    if _summary_kernel is not None:
+        return _compute_summary_fused(view, cm_per_px=cm_per_px, fixed_fps_hz=fixed_fps_hz, step_dist=step_dist)
 
-    time_ch1_s = float(dt_state[chamber == "chamber1"].sum())
-    time_ch2_s = float(dt_state[chamber == "chamber2"].sum())
-    time_neutral_s = float(dt_state[chamber == "neutral"].sum())
+    dt = view.dt_seconds(fixed_fps_hz=fixed_fps_hz)
+    dt_state = state_stats_dt(dt)
 
-    x = pd.to_numeric(df.get("x"), errors="coerce").to_numpy(dtype=float)
-    y = pd.to_numeric(df.get("y"), errors="coerce").to_numpy(dtype=float)
+    # Single weighted pass over dt instead of one boolean mask per chamber.
+    chamber_times = view.chamber_totals(dt_state)
 
     distance_px = 0.0
-    if len(df) > 1:
-        dx = np.diff(x)
-        dy = np.diff(y)
-        dist = np.sqrt(dx * dx + dy * dy)
+    if len(view) > 1:
+        dist = step_dist if step_dist is not None else view.step_distance()
         valid = np.isfinite(dist)
         distance_px = float(np.nansum(dist[valid]))
 
     session_duration_s = float(np.nansum(dt))
-    mean_speed_px_s = distance_px / session_duration_s if session_duration_s > 0 else 0.0
+    laser_on_time_s = float(dt_state @ (view.laser > 0.5))
+
+    return _finalize_summary(
+        time_ch1_s=chamber_times["chamber1"],
+        time_ch2_s=chamber_times["chamber2"],
+        time_neutral_s=chamber_times["neutral"],
+        distance_px=distance_px,
+        laser_on_time_s=laser_on_time_s,
+        session_duration_s=session_duration_s,
+        n_samples=len(view),
+        cm_per_px=cm_per_px,
+    )
+
+
+def _compute_summary_fused(
+    view: AnalysisView,
+    cm_per_px: Optional[float],
+    fixed_fps_hz: Optional[float],
+    step_dist: Optional[np.ndarray] = None,
+) -> Dict[str, Any]:
+    fixed_dt = 0.0
+    if fixed_fps_hz is not None:
+        fps = float(fixed_fps_hz)
+        if fps <= 0:
+            raise ValueError("fixed_fps_hz must be > 0")
+        fixed_dt = 1.0 / fps
+
+    out = np.zeros(6, dtype=float)
+    _summary_kernel(view.t, view.x, view.y, view.chamber_code, view.laser, fixed_dt, out)
+    distance_px = float(out[3])
+    if step_dist is not None and len(view) > 1:
+        # A caller-supplied step distance wins over the kernel's own xy sum, as on the numpy path.
+        distance_px = float(np.nansum(step_dist[np.isfinite(step_dist)]))
+    return _finalize_summary(
+        time_ch1_s=float(out[0]),
+        time_ch2_s=float(out[1]),
+        time_neutral_s=float(out[2]),
+        distance_px=distance_px,
+        laser_on_time_s=float(out[5]),
+        session_duration_s=float(out[4]),
+        n_samples=len(view),
+        cm_per_px=cm_per_px,
+    )
 
-    laser = pd.to_numeric(df.get("laser_state", 0), errors="coerce").fillna(0).to_numpy(dtype=float)
-    laser_on_time_s = float(dt_state[laser > 0.5].sum())
+
+def _summary_kernel_py(
+    t: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    chamber_code: np.ndarray,
+    laser: np.ndarray,
+    fixed_dt: float,
+    out: np.ndarray,
+) -> None:
+    """Single-pass summary loop; writes ch1, ch2, neutral, distance_px, duration, laser_on into `out`.
+
+    Mirrors compute_dt_seconds/state_stats_dt: dt is the forward frame interval
+    (negative/non-finite -> 0), the last frame gets the median positive interval,
+    and the first frame carries no state weight. A positive `fixed_dt` replaces
+    every interval.
+    """
+    n = t.shape[0]
+    positive = np.empty(max(n - 1, 0), dtype=np.float64)
+    n_positive = 0
+    for i in range(6):
+        out[i] = 0.0
+
+    for i in range(n - 1):
+        if fixed_dt > 0.0:
+            dt = fixed_dt
+        else:
+            dt = t[i + 1] - t[i]
+            if not np.isfinite(dt) or dt < 0.0:
+                dt = 0.0
+            if dt > 0.0:
+                positive[n_positive] = dt
+                n_positive += 1
+        out[4] += dt
+        if i > 0:
+            code = chamber_code[i]
+            if 1 <= code <= 3:
+                out[code - 1] += dt
+            if laser[i] > 0.5:
+                out[5] += dt
+
+        dist = np.hypot(x[i + 1] - x[i], y[i + 1] - y[i])
+        if np.isfinite(dist):
+            out[3] += dist
+
+    if n == 0:
+        return
+    if fixed_dt > 0.0:
+        last_dt = fixed_dt
+    elif n_positive > 0:
+        last_dt = np.median(positive[:n_positive])
+    else:
+        last_dt = 0.0
+    out[4] += last_dt
+    if n > 1:
+        code = chamber_code[n - 1]
+        if 1 <= code <= 3:
+            out[code - 1] += last_dt
+        if laser[n - 1] > 0.5:
+            out[5] += last_dt
+
+
+_summary_kernel = njit(cache=True)(_summary_kernel_py) if njit is not None else None
+
+
+def compute_summary_streaming(
+    chunks: Iterable[pd.DataFrame],
+    cm_per_px: Optional[float] = None,
+    fixed_fps_hz: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Same result as `compute_summary`, accumulated over DataFrame chunks.
+
+    Only the last row of each chunk is carried into the next one, so peak
+    memory is bounded by the chunk size plus the positive frame intervals
+    needed for the final-frame median dt.
+    """
+    fixed_dt: Optional[float] = None
+    if fixed_fps_hz is not None:
+        fps = float(fixed_fps_hz)
+        if fps <= 0:
+            raise ValueError("fixed_fps_hz must be > 0")
+        fixed_dt = 1.0 / fps
+
+    times = np.zeros(len(_CHAMBER_CODES) + 1, dtype=float)
+    distance_px = 0.0
+    laser_on_time_s = 0.0
+    session_duration_s = 0.0
+    n_samples = 0
+    positive_diffs: List[np.ndarray] = []
+    # Last row of the previous chunk: (t_wall, x, y, chamber_code, laser_on). Its dt is only known once
+    # the next row arrives.
+    pending: Optional[Tuple[float, float, float, int, bool]] = None
+
+    for chunk in chunks:
+        n = len(chunk)
+        if n == 0:
+            continue
+        view = AnalysisView.from_frame(chunk)
+        t, x, y, codes = view.t, view.x, view.y, view.chamber_code
+        laser_on = view.laser > 0.5
+
+        if pending is not None:
+            t = np.r_[pending[0], t]
+            x = np.r_[pending[1], x]
+            y = np.r_[pending[2], y]
+            codes = np.r_[pending[3], codes]
+            laser_on = np.r_[pending[4], laser_on]
+
+        if fixed_dt is not None:
+            dt = np.full(t.size - 1, fixed_dt, dtype=float)
+        else:
+            diffs = np.diff(t)
+            dt = np.where(np.isfinite(diffs) & (diffs >= 0), diffs, 0.0)
+            positive_diffs.append(dt[dt > 0])
+
+        dt_state = dt.copy()
+        if n_samples <= 1 and dt_state.size:
+            # This pass starts at the session's first frame, which state stats exclude (see state_stats_dt).
+            dt_state[0] = 0.0
+        times += np.bincount(codes[:-1], weights=dt_state, minlength=times.size)
+        laser_on_time_s += float(dt_state @ laser_on[:-1])
+        session_duration_s += float(dt.sum())
+
+        dist = np.hypot(np.diff(x), np.diff(y))
+        distance_px += float(dist[np.isfinite(dist)].sum())
+
+        n_samples += n
+        pending = (float(t[-1]), float(x[-1]), float(y[-1]), int(codes[-1]), bool(laser_on[-1]))
+
+    if n_samples == 0 or pending is None:
+        return compute_summary(pd.DataFrame())
+
+    if fixed_dt is not None:
+        last_dt = fixed_dt
+    else:
+        positive = np.concatenate(positive_diffs) if positive_diffs else np.array([], dtype=float)
+        last_dt = float(np.median(positive)) if positive.size else 0.0
+    session_duration_s += last_dt
+    if n_samples > 1:
+        times[pending[3]] += last_dt
+        if pending[4]:
+            laser_on_time_s += last_dt
+
+    return _finalize_summary(
+        time_ch1_s=float(times[_CHAMBER_CODES["chamber1"]]),
+        time_ch2_s=float(times[_CHAMBER_CODES["chamber2"]]),
+        time_neutral_s=float(times[_CHAMBER_CODES["neutral"]]),
+        distance_px=distance_px,
+        laser_on_time_s=laser_on_time_s,
+        session_duration_s=session_duration_s,
+        n_samples=n_samples,
+        cm_per_px=cm_per_px,
+    )
+
+
+def _numeric_column(df: pd.DataFrame, name: str, length: int) -> np.ndarray:
+    if name not in df.columns:
+        return np.full(length, np.nan, dtype=float)
+    return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=float)
+
+
+def _finalize_summary(
+    time_ch1_s: float,
+    time_ch2_s: float,
+    time_neutral_s: float,
+    distance_px: float,
+    laser_on_time_s: float,
+    session_duration_s: float,
+    n_samples: int,
+    cm_per_px: Optional[float],
+) -> Dict[str, Any]:
+    mean_speed_px_s = distance_px / session_duration_s if session_duration_s > 0 else 0.0
 
     distance_cm = np.nan
     mean_speed_cm_s = np.nan
@@ -161,5 +428,5 @@ def compute_summary(
         "mean_speed_cm_s": mean_speed_cm_s,
         "laser_on_time_s": laser_on_time_s,
         "session_duration_s": session_duration_s,
-        "n_samples": int(len(df)),
+        "n_samples": int(n_samples),
     }
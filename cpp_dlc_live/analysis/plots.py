@@ -6,11 +6,12 @@ from typing import Any, Dict, Optional, Tuple
 import matplotlib
 # Use a non-interactive backend so auto-analysis works reliably in headless/GUI-mixed runs.
 matplotlib.use("Agg")
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.collections import LineCollection
 from matplotlib.colors import Normalize
+from matplotlib.figure import Figure
 from matplotlib.patches import Polygon
 
 try:
@@ -18,23 +19,32 @@ try:
 except Exception:  # pragma: no cover - optional runtime fallback
     gaussian_filter = None  # type: ignore[assignment]
 
-from cpp_dlc_live.analysis.metrics import compute_dt_seconds, normalize_chamber_series, state_stats_dt
+from cpp_dlc_live.analysis.metrics import AnalysisView, state_stats_dt
 
 FrameShape = Optional[Tuple[int, int]]
 
+# Line plots are rendered at ~1-2k px wide; more input points just overplot the same pixels.
+_MAX_PLOT_POINTS = 10_000
+
+# Occupancy-plot level (neutral=0, ch1=1, ch2=2) indexed by AnalysisView.chamber_code.
+_OCCUPANCY_LEVELS = np.array([0, 1, 2, 0])
+
 
 def plot_trajectory(
     df: pd.DataFrame,
     roi_cfg: Optional[Dict[str, Any]],
     out_path: Path,
     frame_shape: FrameShape = None,
+    view: Optional[AnalysisView] = None,
 ) -> None:
     """Legacy plain trajectory plot kept for backward compatibility."""
-    x = pd.to_numeric(df.get("x"), errors="coerce")
-    y = pd.to_numeric(df.get("y"), errors="coerce")
+    view = view if view is not None else AnalysisView.from_frame(df)
+    x = view.x.astype(np.float32)
+    y = view.y.astype(np.float32)
 
-    fig, ax = plt.subplots(figsize=_spatial_figsize(frame_shape))
-    ax.plot(x, y, lw=1.0, alpha=0.8, color="tab:blue")
+    fig, ax = _new_figure(figsize=_spatial_figsize(frame_shape))
+    x_plot, y_plot = _downsample_xy(x, y)
+    ax.plot(x_plot, y_plot, lw=1.0, alpha=0.8, color="tab:blue", rasterized=True)
     ax.set_title("Trajectory")
     ax.set_xlabel("x (px)")
     ax.set_ylabel("y (px)")
@@ -43,18 +53,11 @@ def plot_trajectory(
         _draw_roi(ax, roi_cfg.get("chamber1"), "tab:green", "ch1")
         _draw_roi(ax, roi_cfg.get("chamber2"), "tab:orange", "ch2")
         _draw_roi(ax, roi_cfg.get("neutral"), "tab:gray", "neutral")
-    _apply_spatial_axes(
-        ax=ax,
-        frame_shape=frame_shape,
-        x_values=pd.to_numeric(x, errors="coerce").to_numpy(dtype=float),
-        y_values=pd.to_numeric(y, errors="coerce").to_numpy(dtype=float),
-        roi_cfg=roi_cfg,
-    )
+    _apply_spatial_axes(ax=ax, frame_shape=frame_shape, x_values=x, y_values=y, roi_cfg=roi_cfg)
 
     ax.legend(loc="best")
     fig.tight_layout()
     fig.savefig(out_path, dpi=150)
-    plt.close(fig)
 
 
 def plot_trajectory_speed_heatmap(
@@ -63,14 +66,20 @@ def plot_trajectory_speed_heatmap(
     roi_cfg: Optional[Dict[str, Any]],
     out_path: Path,
     frame_shape: FrameShape = None,
+    view: Optional[AnalysisView] = None,
 ) -> None:
     """Figure 1: trajectory with segment color mapped to instantaneous speed."""
-    x = pd.to_numeric(df.get("x"), errors="coerce").to_numpy(dtype=float)
-    y = pd.to_numeric(df.get("y"), errors="coerce").to_numpy(dtype=float)
+    view = view if view is not None else AnalysisView.from_frame(df)
+    x = view.x
+    y = view.y
     speed = pd.to_numeric(speed_df.get("speed_px_s"), errors="coerce").to_numpy(dtype=float)
 
-    fig, ax = plt.subplots(figsize=_spatial_figsize(frame_shape))
-    _draw_speed_colored_trajectory(ax=ax, x=x, y=y, speed=speed)
+    fig, ax = _new_figure(figsize=_spatial_figsize(frame_shape))
+    if speed.size == x.size:
+        keep = _stride_indices(x.size)
+        _draw_speed_colored_trajectory(ax=ax, x=x[keep], y=y[keep], speed=speed[keep])
+    else:
+        _draw_speed_colored_trajectory(ax=ax, x=x, y=y, speed=speed)
     ax.set_title("Figure 1: Trajectory Colored by Speed")
     ax.set_xlabel("x (px)")
     ax.set_ylabel("y (px)")
@@ -85,7 +94,6 @@ def plot_trajectory_speed_heatmap(
 
     fig.tight_layout()
     fig.savefig(out_path, dpi=150)
-    plt.close(fig)
 
 
 def plot_position_heatmap(
@@ -93,15 +101,17 @@ def plot_position_heatmap(
     roi_cfg: Optional[Dict[str, Any]],
     out_path: Path,
     frame_shape: FrameShape = None,
+    view: Optional[AnalysisView] = None,
 ) -> None:
     """Figure 2: 2D occupancy heatmap of positions."""
-    x = pd.to_numeric(df.get("x"), errors="coerce").to_numpy(dtype=float)
-    y = pd.to_numeric(df.get("y"), errors="coerce").to_numpy(dtype=float)
+    view = view if view is not None else AnalysisView.from_frame(df)
+    x = view.x
+    y = view.y
     valid = np.isfinite(x) & np.isfinite(y)
     xv = x[valid]
     yv = y[valid]
 
-    fig, ax = plt.subplots(figsize=_spatial_figsize(frame_shape))
+    fig, ax = _new_figure(figsize=_spatial_figsize(frame_shape))
     x_min, x_max, y_min, y_max = _resolve_spatial_limits(
         frame_shape=frame_shape,
         x_values=x,
@@ -126,7 +136,7 @@ def plot_position_heatmap(
             heat = gaussian_filter(heat, sigma=2.0)
 
         masked = np.ma.masked_less_equal(heat, 0.0)
-        cmap = plt.cm.jet.copy()
+        cmap = matplotlib.colormaps["jet"].copy()
         cmap.set_bad((0.0, 0.0, 0.0, 0.0))
         im = ax.imshow(
             masked,
@@ -155,20 +165,25 @@ def plot_position_heatmap(
 
     fig.tight_layout()
     fig.savefig(out_path, dpi=150)
-    plt.close(fig)
 
 
-def plot_chamber_time_bars(df: pd.DataFrame, out_path: Path, fixed_fps_hz: Optional[float] = None) -> None:
+def plot_chamber_time_bars(
+    df: pd.DataFrame,
+    out_path: Path,
+    fixed_fps_hz: Optional[float] = None,
+    view: Optional[AnalysisView] = None,
+) -> None:
     """Figure 3: chamber1/chamber2 dwell durations and percentages."""
-    dt = state_stats_dt(compute_dt_seconds(df, fixed_fps_hz=fixed_fps_hz))
-    chamber = normalize_chamber_series(df.get("chamber"), length=len(df)).to_numpy(dtype=str)
+    view = view if view is not None else AnalysisView.from_frame(df)
+    dt = state_stats_dt(view.dt_seconds(fixed_fps_hz=fixed_fps_hz))
 
     labels = ["chamber1", "chamber2"]
-    durations = np.array([float(dt[chamber == label].sum()) for label in labels], dtype=float)
+    chamber_times = view.chamber_totals(dt)
+    durations = np.array([chamber_times[label] for label in labels], dtype=float)
     total = float(durations.sum())
     percentages = (durations / total * 100.0) if total > 0 else np.zeros_like(durations)
 
-    fig, axes = plt.subplots(2, 1, figsize=(8, 7), sharex=True)
+    fig, axes = _new_figure(figsize=(8, 7), nrows=2, sharex=True)
 
     axes[0].bar(labels, durations, color=["tab:green", "tab:orange"])
     axes[0].set_title("Figure 3A: Dwell Time in Chambers")
@@ -185,47 +200,98 @@ def plot_chamber_time_bars(df: pd.DataFrame, out_path: Path, fixed_fps_hz: Optio
 
     fig.tight_layout()
     fig.savefig(out_path, dpi=150)
-    plt.close(fig)
 
 
 def plot_speed(speed_df: pd.DataFrame, out_path: Path) -> None:
-    t = pd.to_numeric(speed_df.get("t_wall"), errors="coerce")
-    t = t - float(np.nanmin(t)) if len(t) else t
-    speed = pd.to_numeric(speed_df.get("speed_px_s"), errors="coerce")
+    t = _elapsed_seconds(pd.to_numeric(speed_df.get("t_wall"), errors="coerce").to_numpy(dtype=float))
+    speed = pd.to_numeric(speed_df.get("speed_px_s"), errors="coerce").to_numpy(dtype=float)
 
-    fig, ax = plt.subplots(figsize=(9, 4))
-    ax.plot(t, speed, lw=1.0, color="tab:red")
+    fig, ax = _new_figure(figsize=(9, 4))
+    keep = _peak_preserving_indices(speed)
+    ax.plot(t[keep], speed[keep], lw=1.0, color="tab:red")
     ax.set_title("Figure 4: Speed over Time")
     ax.set_xlabel("Time (s)")
     ax.set_ylabel("Speed (px/s)")
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
-    plt.close(fig)
+    fig.savefig(out_path, dpi=100)
 
 
-def plot_occupancy(df: pd.DataFrame, out_path: Path) -> None:
-    t = pd.to_numeric(df.get("t_wall"), errors="coerce")
-    t = t - float(np.nanmin(t)) if len(t) else t
-    chamber = normalize_chamber_series(df.get("chamber"), length=len(df))
+def plot_occupancy(df: pd.DataFrame, out_path: Path, view: Optional[AnalysisView] = None) -> None:
+    view = view if view is not None else AnalysisView.from_frame(df)
+    t = _elapsed_seconds(view.t)
+    codes = view.chamber_code
 
     # First frame is excluded from state statistics; keep figure consistent.
-    if len(chamber) > 1:
-        t = t.iloc[1:]
-        chamber = chamber.iloc[1:]
+    if codes.size > 1:
+        t = t[1:]
+        codes = codes[1:]
+
+    y = _OCCUPANCY_LEVELS[codes]
 
-    mapping = {"neutral": 0, "chamber1": 1, "chamber2": 2}
-    y = chamber.map(mapping).fillna(0)
+    # A post-step plot is fully described by its change points (plus the final sample).
+    changes = np.ones(y.size, dtype=bool)
+    if y.size > 1:
+        changes[1:-1] = y[1:-1] != y[:-2]
 
-    fig, ax = plt.subplots(figsize=(9, 3))
-    ax.step(t, y, where="post", lw=1.0)
+    fig, ax = _new_figure(figsize=(9, 3))
+    ax.step(t[changes], y[changes], where="post", lw=1.0)
     ax.set_title("Figure 5: Chamber Occupancy")
     ax.set_xlabel("Time (s)")
     ax.set_ylabel("State")
     ax.set_yticks([0, 1, 2])
     ax.set_yticklabels(["neutral", "ch1", "ch2"])
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
-    plt.close(fig)
+    fig.savefig(out_path, dpi=100)
+
+
+def _elapsed_seconds(t: np.ndarray) -> np.ndarray:
+    if t.size and np.isfinite(t).any():
+        t = t - float(np.nanmin(t))
+    return t
+
+
+def _stride_indices(n: int, max_points: int = _MAX_PLOT_POINTS) -> np.ndarray:
+    stride = max(1, -(-n // max_points))
+    idx = np.arange(0, n, stride)
+    if n > 0 and idx[-1] != n - 1:
+        idx = np.append(idx, n - 1)
+    return idx
+
+
+def _downsample_xy(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_points: int = _MAX_PLOT_POINTS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    idx = _stride_indices(len(x), max_points=max_points)
+    return x[idx], y[idx]
+
+
+def _peak_preserving_indices(values: np.ndarray, max_points: int = _MAX_PLOT_POINTS) -> np.ndarray:
+    """Pick per-bucket min and max sample indices so spikes survive downsampling."""
+    n = values.size
+    if n <= max_points:
+        return np.arange(n)
+    bucket = -(-n // max(1, max_points // 2))
+    n_full = (n // bucket) * bucket
+    blocks = values[:n_full].reshape(-1, bucket)
+    nan = np.isnan(blocks)
+    lo = np.argmin(np.where(nan, np.inf, blocks), axis=1)
+    hi = np.argmax(np.where(nan, -np.inf, blocks), axis=1)
+    base = np.arange(blocks.shape[0]) * bucket
+    return np.unique(np.concatenate([base + lo, base + hi, np.arange(n_full, n)]))
+
+
+def _new_figure(
+    figsize: Tuple[float, float],
+    nrows: int = 1,
+    ncols: int = 1,
+    **subplot_kw: Any,
+) -> Tuple[Figure, Any]:
+    # Figure + Agg canvas directly: no pyplot state machine, nothing to close afterwards.
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots(nrows, ncols, **subplot_kw)
 
 
 def _draw_roi(ax: Any, roi_points: Any, color: str, label: str) -> None:
@@ -274,10 +340,11 @@ def _draw_speed_colored_trajectory(ax: Any, x: np.ndarray, y: np.ndarray, speed:
     lc = LineCollection(segments_valid, cmap="turbo", norm=Normalize(vmin=vmin, vmax=vmax))
     lc.set_array(speed_valid)
     lc.set_linewidth(1.5)
+    lc.set_rasterized(True)
     ax.add_collection(lc)
     ax.autoscale()
 
-    cbar = plt.colorbar(lc, ax=ax)
+    cbar = ax.figure.colorbar(lc, ax=ax)
     cbar.set_label("Speed (px/s)")
 
 
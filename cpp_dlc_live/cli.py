@@ -2,21 +2,16 @@ from __future__ import annotations
 
 import argparse
 import copy
+import importlib
+import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-import cv2
-import pandas as pd
-
-from cpp_dlc_live.analysis.analyze import analyze_session
-from cpp_dlc_live.analysis.issues import analyze_issues
-from cpp_dlc_live.realtime.app import RealtimeApp
-from cpp_dlc_live.realtime.camera import CameraConfig, CameraStream
 from cpp_dlc_live.realtime.logging_utils import setup_logging
-from cpp_dlc_live.realtime.roi import calibrate_roi_with_camera, calibrate_roi_with_frame
 from cpp_dlc_live.utils.io_utils import (
     detect_session_file_prefix,
     ensure_prefixed_filename,
@@ -28,6 +23,34 @@ from cpp_dlc_live.utils.io_utils import (
 )
 from cpp_dlc_live.utils.session_prompt import collect_session_info, normalize_laser_on_chambers
 
+if TYPE_CHECKING:
+    from cpp_dlc_live.realtime.camera import CameraStream
+
+# Heavy entry points (cv2, pandas, matplotlib, DLC runtime) are resolved on first
+# use so `--help` and argument errors return without importing them.
+_LAZY_ATTRS: Dict[str, Tuple[str, str]] = {
+    "RealtimeApp": ("cpp_dlc_live.realtime.app", "RealtimeApp"),
+    "analyze_session": ("cpp_dlc_live.analysis.analyze", "analyze_session"),
+    "analyze_issues": ("cpp_dlc_live.analysis.issues", "analyze_issues"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily imported module attribute (honours values patched onto this module)."""
+    if name in globals():
+        return globals()[name]
+    return __getattr__(name)
+
 
 def main(argv: Optional[list[str]] = None) -> None:
     parser = _build_parser()
@@ -195,6 +218,12 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_batch.add_argument("--include_issues", action="store_true", help="Also run analyze_issues for each session")
     p_batch.add_argument("--fail_fast", action="store_true", help="Stop at first failed session")
+    p_batch.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parallel worker processes (1 = sequential, 0 = one per CPU core)",
+    )
     p_batch.add_argument(
         "--report_name",
         default="batch_analysis_report.csv",
@@ -240,7 +269,7 @@ def _cmd_run_realtime(args: argparse.Namespace) -> None:
     logger.info("Config copied to: %s", used_cfg_path)
     logger.info("Config sha256: %s", file_sha256(used_cfg_path))
 
-    app = RealtimeApp(
+    app = _lazy("RealtimeApp")(
         config=config,
         session_dir=session_dir,
         duration_s=args.duration_s,
@@ -426,6 +455,8 @@ def _cmd_run_offline_batch(args: argparse.Namespace) -> None:
         rows.append(row)
 
     report_path = root_dir / str(args.batch_report_name)
+    import pandas as pd
+
     pd.DataFrame(rows).to_csv(report_path, index=False)
     print(report_path)
     if failed > 0:
@@ -483,7 +514,7 @@ def _run_offline_once(
     logger.info("Config sha256: %s", file_sha256(used_cfg_path))
     logger.info("Offline replay mode: source=%s preview=%s", config.get("camera", {}).get("source"), bool(args.preview))
 
-    app = RealtimeApp(
+    app = _lazy("RealtimeApp")(
         config=config,
         session_dir=session_dir,
         duration_s=(float(args.duration_s) if args.duration_s is not None else None),
@@ -507,7 +538,7 @@ def _run_offline_once(
 def _cmd_analyze_session(args: argparse.Namespace) -> None:
     session_dir = Path(args.session_dir)
     logger = setup_logging(session_dir, file_prefix=detect_session_file_prefix(session_dir))
-    summary_path = analyze_session(
+    summary_path = _lazy("analyze_session")(
         session_dir=session_dir,
         cm_per_px_override=args.cm_per_px,
         # Keep backward compatibility with --fixed_fps_hz while preferring the new unified --fixed_fps.
@@ -564,7 +595,7 @@ def _run_auto_analysis(
 def _cmd_analyze_issues(args: argparse.Namespace) -> None:
     session_dir = Path(args.session_dir)
     logger = setup_logging(session_dir, file_prefix=detect_session_file_prefix(session_dir))
-    outputs = analyze_issues(
+    outputs = _lazy("analyze_issues")(
         session_dir=session_dir,
         issue_file_override=args.issue_file,
         logger=logger,
@@ -583,65 +614,123 @@ def _cmd_analyze_batch(args: argparse.Namespace) -> None:
     if not session_dirs:
         raise RuntimeError(f"No valid session folder found under: {root_dir}")
 
+    options: Dict[str, Any] = {
+        "cm_per_px": args.cm_per_px,
+        "fixed_fps_hz": (args.fixed_fps if args.fixed_fps is not None else args.fixed_fps_hz),
+        "no_plots": bool(args.no_plots),
+        "time_start_s": getattr(args, "time_start_s", None),
+        "time_end_s": getattr(args, "time_end_s", None),
+        "render_overlay_video": bool(getattr(args, "render_overlay_video", False)),
+        "overlay_video_filename": getattr(args, "overlay_video_filename", None),
+        "include_issues": bool(args.include_issues),
+    }
+    workers = _resolve_batch_workers(getattr(args, "workers", 1), n_sessions=len(session_dirs))
+    report_path = root_dir / str(args.report_name)
     rows: List[Dict[str, Any]] = []
     failed = 0
 
-    for session_dir in session_dirs:
-        logger = setup_logging(session_dir, file_prefix=detect_session_file_prefix(session_dir))
-        logger.info("Batch analyze started: %s", session_dir)
-        row: Dict[str, Any] = {
-            "session_dir": str(session_dir),
-            "status": "ok",
-            "summary_path": "",
-            "issue_summary_path": "",
-            "issue_timeline_path": "",
-            "incident_summary_path": "",
-            "error": "",
-        }
-        try:
-            summary_path = analyze_session(
-                session_dir=session_dir,
-                cm_per_px_override=args.cm_per_px,
-                fixed_fps_hz_override=(args.fixed_fps if args.fixed_fps is not None else args.fixed_fps_hz),
-                output_plots_override=(False if args.no_plots else None),
-                time_start_s=getattr(args, "time_start_s", None),
-                time_end_s=getattr(args, "time_end_s", None),
-                render_overlay_video=bool(getattr(args, "render_overlay_video", False)),
-                overlay_video_source_override=None,
-                overlay_video_filename_override=getattr(args, "overlay_video_filename", None),
-                logger=logger,
-            )
-            row["summary_path"] = str(summary_path)
+    def _write_report() -> None:
+        import pandas as pd
 
-            if bool(args.include_issues):
-                issue_outputs = analyze_issues(session_dir=session_dir, logger=logger)
-                row["issue_summary_path"] = str(issue_outputs["issue_summary"])
-                row["issue_timeline_path"] = str(issue_outputs["issue_timeline"])
-                row["incident_summary_path"] = str(issue_outputs["incident_summary"])
+        pd.DataFrame(rows).to_csv(report_path, index=False)
+        print(report_path)
 
-            logger.info("Batch analyze finished: %s", session_dir)
-        except Exception as exc:
-            failed += 1
-            row["status"] = "failed"
-            row["error"] = f"{type(exc).__name__}: {exc}"
-            logger.exception("Batch analyze failed: %s", session_dir)
-            if bool(args.fail_fast):
-                rows.append(row)
-                report_path = root_dir / str(args.report_name)
-                pd.DataFrame(rows).to_csv(report_path, index=False)
-                print(report_path)
+    if workers <= 1:
+        for session_dir in session_dirs:
+            try:
+                row = _analyze_batch_session(session_dir, options, reraise=bool(args.fail_fast))
+            except Exception as exc:
+                rows.append(_batch_failed_row(session_dir, exc))
+                _write_report()
                 raise
+            rows.append(row)
+            failed += int(row["status"] != "ok")
+    else:
+        # Sessions are independent, so fan out across processes; rows keep discovery order.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_analyze_batch_session, d, options) for d in session_dirs]
+            for future in futures:
+                row = future.result()
+                rows.append(row)
+                if row["status"] == "ok":
+                    continue
+                failed += 1
+                if bool(args.fail_fast):
+                    for pending in futures:
+                        pending.cancel()
+                    _write_report()
+                    raise RuntimeError(f"Batch analyze failed: {row['session_dir']}: {row['error']}")
 
-        rows.append(row)
-
-    report_path = root_dir / str(args.report_name)
-    pd.DataFrame(rows).to_csv(report_path, index=False)
-    print(report_path)
+    _write_report()
     if failed > 0:
         raise SystemExit(2)
 
 
+def _resolve_batch_workers(value: Any, n_sessions: int) -> int:
+    workers = int(value) if value is not None else 1
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, n_sessions))
+
+
+def _batch_failed_row(session_dir: Path, exc: BaseException) -> Dict[str, Any]:
+    return {
+        "session_dir": str(session_dir),
+        "status": "failed",
+        "summary_path": "",
+        "issue_summary_path": "",
+        "issue_timeline_path": "",
+        "incident_summary_path": "",
+        "error": f"{type(exc).__name__}: {exc}",
+    }
+
+
+def _analyze_batch_session(session_dir: Path, options: Dict[str, Any], reraise: bool = False) -> Dict[str, Any]:
+    """Analyze one batch session and return its report row (module-level so worker processes can run it)."""
+    logger = setup_logging(session_dir, file_prefix=detect_session_file_prefix(session_dir))
+    logger.info("Batch analyze started: %s", session_dir)
+    row: Dict[str, Any] = {
+        "session_dir": str(session_dir),
+        "status": "ok",
+        "summary_path": "",
+        "issue_summary_path": "",
+        "issue_timeline_path": "",
+        "incident_summary_path": "",
+        "error": "",
+    }
+    try:
+        summary_path = _lazy("analyze_session")(
+            session_dir=session_dir,
+            cm_per_px_override=options["cm_per_px"],
+            fixed_fps_hz_override=options["fixed_fps_hz"],
+            output_plots_override=(False if options["no_plots"] else None),
+            time_start_s=options["time_start_s"],
+            time_end_s=options["time_end_s"],
+            render_overlay_video=options["render_overlay_video"],
+            overlay_video_source_override=None,
+            overlay_video_filename_override=options["overlay_video_filename"],
+            logger=logger,
+        )
+        row["summary_path"] = str(summary_path)
+
+        if options["include_issues"]:
+            issue_outputs = _lazy("analyze_issues")(session_dir=session_dir, logger=logger)
+            row["issue_summary_path"] = str(issue_outputs["issue_summary"])
+            row["issue_timeline_path"] = str(issue_outputs["issue_timeline"])
+            row["incident_summary_path"] = str(issue_outputs["incident_summary"])
+
+        logger.info("Batch analyze finished: %s", session_dir)
+    except Exception as exc:
+        logger.exception("Batch analyze failed: %s", session_dir)
+        if reraise:
+            raise
+        row = _batch_failed_row(session_dir, exc)
+    return row
+
+
 def _cmd_calibrate_roi(args: argparse.Namespace) -> None:
+    from cpp_dlc_live.realtime.roi import calibrate_roi_with_camera, calibrate_roi_with_frame
+
     config_path = Path(args.config)
     config = load_yaml(config_path)
 
@@ -682,6 +771,8 @@ def _cmd_calibrate_roi(args: argparse.Namespace) -> None:
 
 
 def _load_calibration_image(image_path: str):
+    import cv2
+
     frame = cv2.imread(image_path)
     if frame is None:
         raise RuntimeError(f"Failed to read image: {image_path}")
@@ -689,6 +780,8 @@ def _load_calibration_image(image_path: str):
 
 
 def _open_calibration_camera(config: Dict[str, Any], camera_source: Optional[str]) -> CameraStream:
+    from cpp_dlc_live.realtime.camera import CameraConfig, CameraStream
+
     cam_cfg = dict(config.get("camera", {}))
     if camera_source is not None:
         cam_cfg["source"] = _parse_source(camera_source)
@@ -1173,7 +1266,7 @@ def _run_auto_analysis_inprocess(
     output_plots: bool,
     logger,
 ) -> Path:
-    summary_path = analyze_session(
+    summary_path = _lazy("analyze_session")(
         session_dir=session_dir,
         cm_per_px_override=None,
         fixed_fps_hz_override=None,
@@ -1188,7 +1281,7 @@ def _run_auto_analysis_inprocess(
         # Retry once with forced output_plots=True to avoid silent no-plot sessions.
         if not generated:
             logger.warning("No auto analysis plots found, retrying once with forced output_plots=True")
-            summary_path = analyze_session(
+            summary_path = _lazy("analyze_session")(
                 session_dir=session_dir,
                 cm_per_px_override=None,
                 fixed_fps_hz_override=None,
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import functools
 import logging
 import math
+import sys
 import time
 import traceback
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Deque, Dict, Optional, Set, Tuple, Union
 
@@ -17,12 +20,38 @@ from cpp_dlc_live.realtime.controller_ni import DryRunLaserController, LaserCont
 from cpp_dlc_live.realtime.debounce import Debouncer
 from cpp_dlc_live.realtime.dlc_runtime import RuntimeBase, build_runtime
 from cpp_dlc_live.realtime.issue_logger import SessionIssueLogger
+from cpp_dlc_live.realtime.pipeline import FramePipeline
+from cpp_dlc_live.realtime.preview import PreviewWorker, poll_key
 from cpp_dlc_live.realtime.recorder import CSVRecorder
-from cpp_dlc_live.realtime.roi import ChamberROI
+from cpp_dlc_live.realtime.roi import CHAMBER_NAMES, Chamber, ChamberROI
+from cpp_dlc_live.realtime.smoothing import RollingMeanXY
+from cpp_dlc_live.realtime.video_writer import AsyncVideoWriter, FFmpegPipeWriter, resolve_hw_encoder
 from cpp_dlc_live.utils.io_utils import ensure_prefixed_filename, file_sha256, save_json
 from cpp_dlc_live.utils.time_utils import utc_now_iso
 
 _VALID_LASER_ON_CHAMBERS = {"chamber1", "chamber2", "neutral"}
+_NON_NEUTRAL_CHAMBERS = frozenset({"chamber1", "chamber2"})
+_NON_NEUTRAL_CODES = frozenset({int(Chamber.CHAMBER1), int(Chamber.CHAMBER2)})
+_UNKNOWN_CODE = int(Chamber.UNKNOWN)
+_NAN = float("nan")
+# Frames referenced outside the pipeline: the loop's current frame, one queued
+# and one rendering in the preview worker, plus one spare.
+_FRAMES_HELD_BY_LOOP = 4
+# Field order of the per-frame context tuple; expanded into a dict only when reported.
+_LAST_CONTEXT_KEYS = (
+    "frame_idx",
+    "t_wall",
+    "elapsed_s",
+    "x",
+    "y",
+    "p",
+    "chamber_raw",
+    "chamber",
+    "laser_state",
+    "desired_laser_state",
+    "inference_ms",
+    "fps_est",
+)
 _LASER_ON_CHAMBER_ALIASES = {
     "ch1": "chamber1",
     "1": "chamber1",
@@ -39,6 +68,27 @@ _LASER_ON_CHAMBER_ALIASES = {
 }
 
 
+class _FrameBufferRing:
+    """Reusable output images, rotated so a frame handed to another thread
+    (preview) is not overwritten by the very next render."""
+
+    def __init__(self, size: int = 2):
+        self._buffers: list[Optional[np.ndarray]] = [None] * max(1, int(size))
+        self._next = 0
+
+    def next_like(self, frame: np.ndarray) -> np.ndarray:
+        return self.next_shaped(frame.shape, frame.dtype)
+
+    def next_shaped(self, shape: Tuple[int, ...], dtype: Any) -> np.ndarray:
+        i = self._next
+        self._next = (i + 1) % len(self._buffers)
+        buf = self._buffers[i]
+        if buf is None or buf.shape != tuple(shape) or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[i] = buf
+        return buf
+
+
 class RealtimeApp:
     def __init__(
         self,
@@ -62,15 +112,27 @@ class RealtimeApp:
         self.logger = logger or logging.getLogger("cpp_dlc_live")
         self._eof_is_normal_stop = False
 
+        # Config sections used by run() and its helpers, looked up once (non-dict values read as {}).
+        self._roi_cfg = _config_section(config, "roi")
+        self._dlc_cfg = _config_section(config, "dlc")
+        self._laser_cfg = _config_section(config, "laser_control")
+        self._camera_cfg = _config_section(config, "camera")
+        # Per-frame policy knobs, resolved once instead of re-read from config every frame.
+        self._strategy_on_neutral = str(self._roi_cfg.get("strategy_on_neutral", "off")).lower().strip()
+        self._laser_enabled = bool(self._laser_cfg.get("enabled", True))
+        self._unknown_policy = str(self._laser_cfg.get("unknown_policy", "off")).lower().strip()
+
     def run(self) -> int:
         camera: Optional[CameraStream] = None
         runtime: Optional[RuntimeBase] = None
         roi: Optional[ChamberROI] = None
         controller: Optional[LaserControllerBase] = None
+        frame_pipeline: Optional[FramePipeline] = None
+        preview_worker: Optional[PreviewWorker] = None
         recorder: Optional[CSVRecorder] = None
         issue_logger: Optional[SessionIssueLogger] = None
-        preview_writer: Optional[cv2.VideoWriter] = None
-        raw_writer: Optional[cv2.VideoWriter] = None
+        preview_writer: Optional[Union[cv2.VideoWriter, FFmpegPipeWriter, AsyncVideoWriter]] = None
+        raw_writer: Optional[Union[cv2.VideoWriter, FFmpegPipeWriter, AsyncVideoWriter]] = None
 
         frame_idx = 0
         processed_frames = 0
@@ -84,16 +146,14 @@ class RealtimeApp:
         raw_frames_written = 0
         raw_writer_opened = False
         raw_video_path: Optional[Path] = None
-        last_context: Dict[str, Any] = {}
-        previous_chamber = "unknown"
+        last_context_values: Tuple[Any, ...] = ()
+        previous_chamber_code = _UNKNOWN_CODE
         previous_laser_state = 0
 
         status_code = 0
         setup_start_wall = time.time()
-        setup_start_monotonic = time.monotonic()
         # Will be reset right before entering the realtime loop so init time is excluded.
         experiment_start_wall = setup_start_wall
-        experiment_start_monotonic = setup_start_monotonic
 
         metadata: Dict[str, Any] = {
             "start_time_utc": utc_now_iso(),
@@ -112,9 +172,14 @@ class RealtimeApp:
         cfg_used = self.session_dir / self._prefixed_filename("config_used.yaml")
         if not cfg_used.exists():
             cfg_used = self.session_dir / "config_used.yaml"
+        config_sha256_future: Optional[Future[str]] = None
         if cfg_used.exists():
             metadata["config_copy"] = str(cfg_used)
-            metadata["config_sha256"] = file_sha256(cfg_used)
+            # Hashed in the background so it does not delay camera startup; filled in at shutdown.
+            metadata["config_sha256"] = None
+            hash_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cpp_dlc_live-hash")
+            config_sha256_future = hash_executor.submit(file_sha256, cfg_used)
+            hash_executor.shutdown(wait=False)
 
         raw_runtime_log_cfg = self.config.get("runtime_logging", {})
         runtime_log_cfg = dict(raw_runtime_log_cfg) if isinstance(raw_runtime_log_cfg, dict) else {}
@@ -141,6 +206,30 @@ class RealtimeApp:
             raise ValueError("fixed_fps must be > 0")
         metadata["fixed_fps"] = fixed_fps
 
+        raw_pipeline_cfg = self.config.get("pipeline", {})
+        pipeline_cfg = dict(raw_pipeline_cfg) if isinstance(raw_pipeline_cfg, dict) else {}
+        pipeline_threaded = bool(pipeline_cfg.get("threaded", True))
+        pipeline_queue_size = max(1, int(pipeline_cfg.get("queue_size", 2)))
+        # macOS only allows GUI calls from the main thread, so the preview thread defaults off there.
+        preview_threaded = bool(pipeline_cfg.get("preview_thread", sys.platform != "darwin"))
+        writer_threaded = bool(pipeline_cfg.get("writer_thread", True))
+        preview_max_width = _optional_int(pipeline_cfg.get("preview_max_width"))
+        if preview_max_width is not None and preview_max_width <= 0:
+            preview_max_width = None
+        drain_to_latest = bool(self._camera_cfg.get("drain_to_latest", False))
+        reuse_frame_buffers = bool(self._camera_cfg.get("reuse_frame_buffers", True))
+        metadata["pipeline"] = {
+            "threaded": pipeline_threaded,
+            "queue_size": pipeline_queue_size,
+            "drain_to_latest": drain_to_latest,
+            "reuse_frame_buffers": reuse_frame_buffers,
+            "preview_thread": preview_threaded,
+            "writer_thread": writer_threaded,
+            "preview_max_width": preview_max_width,
+        }
+        if drain_to_latest and not pipeline_threaded:
+            self.logger.warning("camera.drain_to_latest requires pipeline.threaded=true; frames will not be skipped")
+
         raw_preview_record_cfg = self.config.get("preview_recording", {})
         preview_record_cfg = (
             dict(raw_preview_record_cfg)
@@ -157,13 +246,23 @@ class RealtimeApp:
         preview_codec = preview_codec_raw if len(preview_codec_raw) == 4 else "mp4v"
         preview_fps_override = _optional_float(preview_record_cfg.get("fps"))
         preview_overlay = bool(preview_record_cfg.get("overlay", True))
+        preview_hwaccel = str(preview_record_cfg.get("hwaccel", "off")).strip().lower()
+        preview_hw_encoder = resolve_hw_encoder(preview_hwaccel) if preview_record_requested else None
         metadata["preview_recording"] = {
             "enabled_requested": preview_record_requested,
             "filename": preview_filename,
             "codec": preview_codec,
             "fps_override": preview_fps_override,
             "overlay": preview_overlay,
+            "hwaccel": preview_hwaccel,
+            "hw_encoder": preview_hw_encoder,
         }
+        if preview_record_requested and preview_hwaccel not in ("off", "none", "false", "") and preview_hw_encoder is None:
+            self.logger.warning(
+                "preview_recording.hwaccel=%r unavailable (ffmpeg/encoder probe failed); using codec=%s",
+                preview_hwaccel,
+                preview_codec,
+            )
         if preview_codec != preview_codec_raw:
             self.logger.warning(
                 "Invalid preview_recording.codec=%r, fallback to 'mp4v'",
@@ -181,12 +280,22 @@ class RealtimeApp:
         raw_codec_raw = str(raw_record_cfg.get("codec", "mp4v")).strip()
         raw_codec = raw_codec_raw if len(raw_codec_raw) == 4 else "mp4v"
         raw_fps_override = _optional_float(raw_record_cfg.get("fps"))
+        raw_hwaccel = str(raw_record_cfg.get("hwaccel", "off")).strip().lower()
+        raw_hw_encoder = resolve_hw_encoder(raw_hwaccel) if raw_record_requested else None
         metadata["raw_recording"] = {
             "enabled_requested": raw_record_requested,
             "filename": raw_filename,
             "codec": raw_codec,
             "fps_override": raw_fps_override,
+            "hwaccel": raw_hwaccel,
+            "hw_encoder": raw_hw_encoder,
         }
+        if raw_record_requested and raw_hwaccel not in ("off", "none", "false", "") and raw_hw_encoder is None:
+            self.logger.warning(
+                "raw_recording.hwaccel=%r unavailable (ffmpeg/encoder probe failed); using codec=%s",
+                raw_hwaccel,
+                raw_codec,
+            )
         if raw_codec != raw_codec_raw:
             self.logger.warning(
                 "Invalid raw_recording.codec=%r, fallback to 'mp4v'",
@@ -236,11 +345,11 @@ class RealtimeApp:
                     duration_s=acclimation_actual_s,
                 )
 
-            runtime = build_runtime(self.config.get("dlc", {}), logger=self.logger)
-            roi = ChamberROI.from_config(self.config.get("roi", {}))
+            runtime = build_runtime(self._dlc_cfg, logger=self.logger)
+            roi = ChamberROI.from_config(self._roi_cfg)
             debouncer = Debouncer(
-                required_count=int(self.config.get("roi", {}).get("debounce_frames", 8)),
-                initial_state="unknown",
+                required_count=int(self._roi_cfg.get("debounce_frames", 8)),
+                initial_state=_UNKNOWN_CODE,
             )
 
             recorder = CSVRecorder(
@@ -258,14 +367,14 @@ class RealtimeApp:
                     "fps_est",
                 ],
                 flush_every=200,
+                flush_interval_s=1.0,
             )
 
-            laser_cfg_raw = self.config.get("laser_control", {})
-            laser_cfg = dict(laser_cfg_raw) if isinstance(laser_cfg_raw, dict) else {}
+            laser_cfg = dict(self._laser_cfg)
             laser_on_chambers = self._resolve_laser_on_chambers(laser_cfg)
             controller = self._create_and_start_controller(laser_cfg)
             previous_laser_state = 1 if controller.current_state else 0
-            laser_mode_overlay = _format_laser_mode_overlay(laser_cfg if isinstance(laser_cfg, dict) else {})
+            laser_mode_overlay = _format_laser_mode_overlay(laser_cfg)
 
             issue_logger.log(
                 "runtime_ready",
@@ -275,7 +384,7 @@ class RealtimeApp:
                 laser_mode=laser_cfg.get("mode", "dryrun"),
                 fallback_to_dryrun=laser_cfg.get("fallback_to_dryrun", True),
                 laser_on_chambers=sorted(laser_on_chambers),
-                debounce_frames=self.config.get("roi", {}).get("debounce_frames", 8),
+                debounce_frames=self._roi_cfg.get("debounce_frames", 8),
                 preview_recording_requested=preview_record_requested,
                 raw_recording_requested=raw_record_requested,
             )
@@ -308,7 +417,7 @@ class RealtimeApp:
             # Start experiment timer after all initialization (camera/runtime/controller/ROI/recorder)
             # so requested duration_s matches actual experiment acquisition duration.
             experiment_start_wall = time.time()
-            experiment_start_monotonic = time.monotonic()
+            experiment_start_perf = time.perf_counter()
             metadata["start_time_utc"] = utc_now_iso()
             metadata["start_wall"] = experiment_start_wall
             metadata["setup_duration_s"] = max(0.0, experiment_start_wall - setup_start_wall)
@@ -326,54 +435,106 @@ class RealtimeApp:
 
             timestamps: Deque[float] = deque(maxlen=60)
             inference_ms_window: Deque[float] = deque(maxlen=120)
-            last_heartbeat_monotonic = time.monotonic()
-            smooth_window = max(1, int(self.config.get("dlc", {}).get("smoothing", {}).get("window", 5)))
-            smooth_enabled = bool(self.config.get("dlc", {}).get("smoothing", {}).get("enabled", False))
-            smooth_points: Deque[Tuple[float, float]] = deque(maxlen=smooth_window)
-            last_valid_xy: Optional[Tuple[float, float]] = None
-            last_non_neutral = "unknown"
-            p_thresh = float(self.config.get("dlc", {}).get("p_thresh", 0.6))
-            display_bodyparts = _parse_display_bodyparts(self.config.get("dlc", {}).get("display_bodyparts"))
+            # One perf_counter() read per frame (taken for the FPS window) also drives the
+            # heartbeat and the next iteration's duration check.
+            # Deadlines are absolute perf_counter() values; math.inf disables a check.
+            now_perf = experiment_start_perf
+            stop_perf = experiment_start_perf + self.duration_s if self.duration_s is not None else math.inf
+            next_heartbeat_perf = now_perf + heartbeat_interval_s if heartbeat_interval_s > 0 else math.inf
+            smoothing_cfg = self._dlc_cfg.get("smoothing", {})
+            smooth_window = max(1, int(smoothing_cfg.get("window", 5)))
+            smooth_enabled = bool(smoothing_cfg.get("enabled", False))
+            smoother = RollingMeanXY(window=smooth_window)
+            # Last confident position, held on low-confidence frames. Starts as NaN, so
+            # holding before any confident frame yields NaN with xy_valid False.
+            last_valid_x = last_valid_y = _NAN
+            last_valid_finite = False
+            has_last_valid = False
+            # The chamber FSM runs on Chamber codes; names are looked up only for output.
+            last_non_neutral_code = _UNKNOWN_CODE
+            neutral_candidate_table = self._build_neutral_candidate_table()
+            laser_target_table = self._build_laser_target_table(laser_on_chambers)
+            p_thresh = float(self._dlc_cfg.get("p_thresh", 0.6))
+            # Overlay buffers: one ring for renders on this loop, one owned by the preview thread and
+            # one by the preview encoder thread (which encodes each render before drawing the next).
+            loop_vis_buffers = _FrameBufferRing(size=2)
+            preview_vis_buffers = _FrameBufferRing(size=1)
+            encoder_vis_buffers = _FrameBufferRing(size=1)
+            display_bodyparts = _parse_display_bodyparts(self._dlc_cfg.get("display_bodyparts"))
             metadata["dlc_display_bodyparts"] = display_bodyparts
-
-            self.logger.info("Realtime session started")
+            idle_cfg = self._dlc_cfg.get("idle_decimation") or {}
+            idle_every_n = max(1, int(idle_cfg.get("every_n", 1)))
+            idle_max_stale_ms = max(0.0, float(idle_cfg.get("max_stale_ms", 100.0)))
+
+            frame_pipeline = FramePipeline(
+                camera,
+                runtime,
+                threaded=pipeline_threaded,
+                queue_size=pipeline_queue_size,
+                drain_to_latest=drain_to_latest,
+                idle_every_n=idle_every_n,
+                idle_max_stale_s=idle_max_stale_ms / 1000.0,
+            )
+            if reuse_frame_buffers:
+                camera.set_frame_pool(frame_pipeline.frames_in_flight + _FRAMES_HELD_BY_LOOP)
+            frame_pipeline.start()
+            if self.preview and preview_threaded:
+                # HighGUI windows belong to the thread that created them; hand the
+                # acclimation window over to the preview thread.
+                if acclimation_enabled and acclimation_duration_s > 0:
+                    try:
+                        cv2.destroyWindow("cpp_dlc_live")
+                    except Exception:
+                        pass
+                preview_worker = PreviewWorker("cpp_dlc_live", logger=self.logger)
+                preview_worker.start()
+            self.logger.info(
+                "Realtime session started (pipeline threaded=%s queue_size=%d drain_to_latest=%s)",
+                pipeline_threaded,
+                pipeline_queue_size,
+                drain_to_latest,
+            )
 
             while True:
-                if self.duration_s is not None:
-                    if (time.monotonic() - experiment_start_monotonic) >= self.duration_s:
-                        self.logger.info("Duration reached: %.2f s", self.duration_s)
-                        break
+                if now_perf >= stop_perf:
+                    self.logger.info("Duration reached: %.2f s", self.duration_s)
+                    break
 
-                ok, frame = camera.read()
-                if not ok or frame is None:
+                packet = frame_pipeline.get()
+                if packet is None:
                     if self._eof_is_normal_stop:
                         self.logger.info("Input video reached end-of-stream")
                         break
                     raise RuntimeError("Camera stream ended or frame read failed")
 
-                t_wall = time.time()
+                frame = packet.frame
+                pose = packet.pose
+                t_wall = packet.t_wall
+                inference_ms = packet.inference_ms
                 elapsed_s = max(0.0, t_wall - experiment_start_wall)
-
-                infer_t0 = time.perf_counter()
-                pose = runtime.infer(frame)
-                inference_ms = (time.perf_counter() - infer_t0) * 1000.0
                 inference_ms_window.append(inference_ms)
 
-                if pose.p >= p_thresh:
+                # `xy_valid` gates smoothing and ROI classification; it is False
+                # whenever x/y are NaN (no confident position seen yet).
+                p = pose.p
+                if p >= p_thresh:
                     x, y = pose.x, pose.y
-                    last_valid_xy = (x, y)
+                    xy_valid = math.isfinite(x) and math.isfinite(y)
+                    last_valid_x = x
+                    last_valid_y = y
+                    last_valid_finite = xy_valid
+                    has_last_valid = True
                 else:
                     low_confidence_frames += 1
-                    if last_valid_xy is not None:
-                        x, y = last_valid_xy
-                    else:
-                        x, y = float("nan"), float("nan")
+                    x = last_valid_x
+                    y = last_valid_y
+                    xy_valid = last_valid_finite
                     if low_confidence_frames == 1 or (low_confidence_frames % low_conf_warn_every_n) == 0:
                         warning_count += 1
-                        action = "hold_last_valid" if last_valid_xy is not None else "no_valid_position"
+                        action = "hold_last_valid" if has_last_valid else "no_valid_position"
                         self.logger.warning(
                             "Low confidence frame: p=%.3f < %.3f (frame=%d, action=%s)",
-                            pose.p,
+                            p,
                             p_thresh,
                             frame_idx,
                             action,
@@ -382,29 +543,27 @@ class RealtimeApp:
                             "low_confidence",
                             level="WARNING",
                             frame_idx=frame_idx,
-                            p=float(pose.p),
+                            p=float(p),
                             p_thresh=p_thresh,
                             action=action,
                         )
 
-                if math.isfinite(x) and math.isfinite(y):
-                    smooth_points.append((x, y))
-                    if smooth_enabled and len(smooth_points) > 0:
-                        x = float(np.mean([p[0] for p in smooth_points]))
-                        y = float(np.mean([p[1] for p in smooth_points]))
-
-                if math.isfinite(x) and math.isfinite(y):
-                    chamber_raw = roi.classify(x, y)
+                if xy_valid:
+                    if smooth_enabled:
+                        x, y = smoother.update(float(x), float(y))
+                    chamber_raw_code = roi.classify_code(x, y)
                 else:
-                    chamber_raw = "unknown"
+                    chamber_raw_code = _UNKNOWN_CODE
 
-                chamber_candidate = self._map_neutral_candidate(chamber_raw, last_non_neutral)
-                chamber = debouncer.update(chamber_candidate)
-                if chamber != previous_chamber:
+                chamber_candidate_code = neutral_candidate_table[chamber_raw_code][last_non_neutral_code]
+                chamber_code = debouncer.update(chamber_candidate_code)
+                chamber_raw = CHAMBER_NAMES[chamber_raw_code]
+                chamber = CHAMBER_NAMES[chamber_code]
+                if chamber_code != previous_chamber_code:
                     chamber_transition_count += 1
                     self.logger.info(
                         "Stable chamber transition: %s -> %s (frame=%d, raw=%s)",
-                        previous_chamber,
+                        CHAMBER_NAMES[previous_chamber_code],
                         chamber,
                         frame_idx,
                         chamber_raw,
@@ -413,24 +572,25 @@ class RealtimeApp:
                         "chamber_transition",
                         level="INFO",
                         frame_idx=frame_idx,
-                        from_chamber=previous_chamber,
+                        from_chamber=CHAMBER_NAMES[previous_chamber_code],
                         to_chamber=chamber,
                         chamber_raw=chamber_raw,
                         x=x,
                         y=y,
-                        p=float(pose.p),
+                        p=float(p),
                     )
-                    previous_chamber = chamber
-                if chamber in {"chamber1", "chamber2"}:
-                    last_non_neutral = chamber
-
-                desired_laser_on = self._resolve_laser_target(
-                    chamber,
-                    last_non_neutral,
-                    on_chambers=laser_on_chambers,
-                )
-                controller.set_state(desired_laser_on)
-                laser_state = 1 if controller.current_state else 0
+                    previous_chamber_code = chamber_code
+                if chamber_code in _NON_NEUTRAL_CODES:
+                    last_non_neutral_code = chamber_code
+
+                desired_laser_on = laser_target_table[chamber_code][last_non_neutral_code]
+                # Only touch the DAQ on a change. A switch deferred by a min on/off hold
+                # leaves current_state != desired, so it is retried on the next frame.
+                laser_on = bool(controller.current_state)
+                if bool(desired_laser_on) != laser_on:
+                    controller.set_state(desired_laser_on)
+                    laser_on = bool(controller.current_state)
+                laser_state = 1 if laser_on else 0
                 if laser_state != previous_laser_state:
                     laser_transition_count += 1
                     self.logger.info(
@@ -451,8 +611,12 @@ class RealtimeApp:
                         chamber=chamber,
                     )
                     previous_laser_state = laser_state
+                if idle_every_n > 1:
+                    # Idle: laser off and no chamber transition pending in the debouncer.
+                    frame_pipeline.set_idle(not laser_on and chamber_candidate_code == chamber_code)
 
-                timestamps.append(time.perf_counter())
+                now_perf = time.perf_counter()
+                timestamps.append(now_perf)
                 fps_est = self._estimate_fps(timestamps)
 
                 if inference_warn_ms > 0 and inference_ms >= inference_warn_ms:
@@ -472,39 +636,41 @@ class RealtimeApp:
                         fps_est=fps_est,
                     )
 
-                recorder.write_row(
-                    {
-                        "t_wall": t_wall,
-                        "frame_idx": frame_idx,
-                        "x": x,
-                        "y": y,
-                        "p": pose.p,
-                        "chamber_raw": chamber_raw,
-                        "chamber": chamber,
-                        "laser_state": laser_state,
-                        "inference_ms": inference_ms,
-                        "fps_est": fps_est,
-                    }
+                # Positional, in the fieldnames order declared when the recorder was created.
+                recorder.write_values(
+                    t_wall,
+                    frame_idx,
+                    x,
+                    y,
+                    p,
+                    chamber_raw,
+                    chamber,
+                    laser_state,
+                    inference_ms,
+                    fps_est,
                 )
                 processed_frames += 1
-                last_context = {
-                    "frame_idx": frame_idx,
-                    "t_wall": t_wall,
-                    "elapsed_s": elapsed_s,
-                    "x": x,
-                    "y": y,
-                    "p": float(pose.p),
-                    "chamber_raw": chamber_raw,
-                    "chamber": chamber,
-                    "laser_state": laser_state,
-                    "desired_laser_state": int(bool(desired_laser_on)),
-                    "inference_ms": inference_ms,
-                    "fps_est": fps_est,
-                }
+                # A tuple is cheaper to build every frame than a dict; see _LAST_CONTEXT_KEYS.
+                last_context_values = (
+                    frame_idx,
+                    t_wall,
+                    elapsed_s,
+                    x,
+                    y,
+                    p,
+                    chamber_raw,
+                    chamber,
+                    laser_state,
+                    desired_laser_on,
+                    inference_ms,
+                    fps_est,
+                )
 
-                now_monotonic = time.monotonic()
-                if heartbeat_interval_s > 0 and (now_monotonic - last_heartbeat_monotonic) >= heartbeat_interval_s:
-                    avg_inference_ms = float(np.mean(inference_ms_window)) if inference_ms_window else 0.0
+                if now_perf >= next_heartbeat_perf:
+                    # Averaged only when a heartbeat fires; keeping a running sum would cost every frame.
+                    avg_inference_ms = (
+                        sum(inference_ms_window) / len(inference_ms_window) if inference_ms_window else 0.0
+                    )
                     self.logger.info(
                         "Heartbeat: frame=%d chamber=%s laser=%d fps=%.2f infer_avg=%.2fms low_conf=%d warnings=%d",
                         frame_idx,
@@ -525,6 +691,7 @@ class RealtimeApp:
                         inference_avg_ms=avg_inference_ms,
                         low_confidence_frames=low_confidence_frames,
                         warning_count=warning_count,
+                        dropped_frames=frame_pipeline.dropped_frames,
                     )
                     if fps_warn_below > 0 and fps_est > 0 and fps_est < fps_warn_below:
                         warning_count += 1
@@ -541,16 +708,18 @@ class RealtimeApp:
                             fps_est=fps_est,
                             threshold_fps=fps_warn_below,
                     )
-                    last_heartbeat_monotonic = now_monotonic
+                    next_heartbeat_perf = now_perf + heartbeat_interval_s
 
                 overlay_frame: Optional[np.ndarray] = None
+                render_overlay: Optional[functools.partial[np.ndarray]] = None
                 if self.preview or (preview_record_enabled and preview_overlay):
-                    overlay_frame = self._render_preview_frame(
+                    render_overlay = functools.partial(
+                        self._render_preview_frame,
                         frame=frame,
                         roi=roi,
                         x=x,
                         y=y,
-                        control_p=float(pose.p),
+                        control_p=float(p),
                         control_bodypart=str(pose.bodypart),
                         keypoints=pose.keypoints,
                         display_bodyparts=display_bodyparts,
@@ -560,13 +729,23 @@ class RealtimeApp:
                         fps_est=fps_est,
                         inference_ms=inference_ms,
                         elapsed_s=elapsed_s,
+                        max_width=preview_max_width,
                     )
+                    # Drawing stays on the control loop only for the main-thread preview window or an
+                    # unthreaded overlay writer; otherwise the preview/encoder threads render their own copy.
+                    if (self.preview and preview_worker is None) or (
+                        preview_record_enabled and preview_overlay and not writer_threaded
+                    ):
+                        overlay_frame = render_overlay(buffers=loop_vis_buffers)
 
                 if preview_record_enabled:
                     frame_to_write = overlay_frame if preview_overlay and overlay_frame is not None else frame
                     if preview_writer is None:
                         h, w = frame_to_write.shape[:2]
-                        fps_cfg = _optional_float(self.config.get("camera", {}).get("fps_target"))
+                        if preview_overlay:
+                            # The overlay may still be drawn (downscaled) on the encoder thread.
+                            w, h = _scaled_frame_size(w, h, preview_max_width)
+                        fps_cfg = _optional_float(self._camera_cfg.get("fps_target"))
                         # Global fixed_fps has higher priority than preview_recording.fps.
                         preview_fps_effective = fixed_fps if fixed_fps is not None else preview_fps_override
                         preview_fps_source_label = "fixed_fps(global)" if fixed_fps is not None else "preview_recording.fps"
@@ -579,12 +758,12 @@ class RealtimeApp:
 
                         preview_video_path = self._resolve_preview_video_path(preview_filename)
                         preview_video_path.parent.mkdir(parents=True, exist_ok=True)
-                        fourcc = cv2.VideoWriter_fourcc(*preview_codec)
-                        candidate = cv2.VideoWriter(
-                            str(preview_video_path),
-                            fourcc,
+                        candidate = self._open_video_writer(
+                            preview_video_path,
+                            preview_codec,
                             float(fps_for_writer),
                             (int(w), int(h)),
+                            preview_hw_encoder,
                         )
                         if not candidate.isOpened():
                             warning_count += 1
@@ -606,7 +785,7 @@ class RealtimeApp:
                                 height=h,
                             )
                         else:
-                            preview_writer = candidate
+                            preview_writer = AsyncVideoWriter(candidate) if writer_threaded else candidate
                             preview_writer_opened = True
                             metadata["preview_recording"]["resolved_path"] = str(preview_video_path)
                             metadata["preview_recording"]["fps_actual"] = float(fps_for_writer)
@@ -631,13 +810,20 @@ class RealtimeApp:
                                 overlay=preview_overlay,
                             )
                     if preview_writer is not None:
-                        preview_writer.write(frame_to_write)
+                        if preview_overlay and overlay_frame is None and render_overlay is not None:
+                            # Threaded writer: the overlay is drawn on the encoder thread, onto its own frame copy.
+                            preview_writer.write(
+                                frame,
+                                render=functools.partial(render_overlay, in_place=True, buffers=encoder_vis_buffers),
+                            )
+                        else:
+                            preview_writer.write(frame_to_write)
                         preview_frames_written += 1
 
                 if raw_record_enabled:
                     if raw_writer is None:
                         h_raw, w_raw = frame.shape[:2]
-                        fps_cfg = _optional_float(self.config.get("camera", {}).get("fps_target"))
+                        fps_cfg = _optional_float(self._camera_cfg.get("fps_target"))
                         # Global fixed_fps has higher priority than raw_recording.fps.
                         raw_fps_effective = fixed_fps if fixed_fps is not None else raw_fps_override
                         raw_fps_source_label = "fixed_fps(global)" if fixed_fps is not None else "raw_recording.fps"
@@ -650,12 +836,12 @@ class RealtimeApp:
 
                         raw_video_path = self._resolve_preview_video_path(raw_filename)
                         raw_video_path.parent.mkdir(parents=True, exist_ok=True)
-                        raw_fourcc = cv2.VideoWriter_fourcc(*raw_codec)
-                        raw_candidate = cv2.VideoWriter(
-                            str(raw_video_path),
-                            raw_fourcc,
+                        raw_candidate = self._open_video_writer(
+                            raw_video_path,
+                            raw_codec,
                             float(fps_for_raw_writer),
                             (int(w_raw), int(h_raw)),
+                            raw_hw_encoder,
                         )
                         if not raw_candidate.isOpened():
                             warning_count += 1
@@ -677,7 +863,7 @@ class RealtimeApp:
                                 height=h_raw,
                             )
                         else:
-                            raw_writer = raw_candidate
+                            raw_writer = AsyncVideoWriter(raw_candidate) if writer_threaded else raw_candidate
                             raw_writer_opened = True
                             metadata["raw_recording"]["resolved_path"] = str(raw_video_path)
                             metadata["raw_recording"]["fps_actual"] = float(fps_for_raw_writer)
@@ -703,9 +889,16 @@ class RealtimeApp:
                         raw_writer.write(frame)
                         raw_frames_written += 1
 
-                if self.preview:
+                if preview_worker is not None:
+                    if overlay_frame is not None:
+                        preview_worker.submit(overlay_frame)
+                    elif render_overlay is not None:
+                        preview_worker.submit(functools.partial(render_overlay, buffers=preview_vis_buffers))
+                    if preview_worker.exit_requested.is_set():
+                        break
+                elif self.preview:
                     cv2.imshow("cpp_dlc_live", overlay_frame if overlay_frame is not None else frame)
-                    key = cv2.waitKey(1) & 0xFF
+                    key = poll_key()
                     if key in (ord("q"), 27):
                         self.logger.info("Preview exit key pressed")
                         break
@@ -717,7 +910,7 @@ class RealtimeApp:
         except KeyboardInterrupt:
             status_code = 0
             self.logger.info("Realtime session interrupted by user (Ctrl-C)")
-            issue_logger.log("session_interrupted", level="INFO", last_context=last_context)
+            issue_logger.log("session_interrupted", level="INFO", last_context=_last_context_dict(last_context_values))
             if controller is not None:
                 try:
                     controller.set_state(False)
@@ -732,9 +925,9 @@ class RealtimeApp:
                 level="ERROR",
                 exception_type=type(exc).__name__,
                 exception_message=str(exc),
-                last_context=last_context,
+                last_context=_last_context_dict(last_context_values),
             )
-            self._write_incident_report(exc, traceback.format_exc(), last_context)
+            self._write_incident_report(exc, traceback.format_exc(), _last_context_dict(last_context_values))
             if controller is not None:
                 try:
                     controller.set_state(False)
@@ -742,6 +935,26 @@ class RealtimeApp:
                     self.logger.exception("Failed to force laser OFF during exception handling")
 
         finally:
+            # Laser OFF before any teardown below: thread joins can wait seconds and releases can raise.
+            if controller is not None:
+                try:
+                    controller.set_state(False)
+                except Exception:
+                    self.logger.debug("Ignoring laser OFF error during shutdown", exc_info=True)
+
+            # Worker threads may still be reading from the camera; stop them before release.
+            if frame_pipeline is not None:
+                try:
+                    frame_pipeline.stop()
+                except Exception:
+                    self.logger.exception("Failed to stop frame pipeline cleanly")
+
+            if preview_worker is not None:
+                try:
+                    preview_worker.stop()
+                except Exception:
+                    self.logger.exception("Failed to stop preview thread cleanly")
+
             if recorder is not None:
                 recorder.close()
 
@@ -770,10 +983,6 @@ class RealtimeApp:
                     )
 
             if controller is not None:
-                try:
-                    controller.set_state(False)
-                except Exception:
-                    self.logger.debug("Ignoring laser OFF error during shutdown", exc_info=True)
                 try:
                     controller.stop()
                 except Exception:
@@ -788,6 +997,12 @@ class RealtimeApp:
                 except Exception:
                     pass
 
+            if config_sha256_future is not None:
+                try:
+                    metadata["config_sha256"] = config_sha256_future.result()
+                except Exception:
+                    self.logger.exception("Failed to hash config copy: %s", cfg_used)
+
             end_wall = time.time()
             metadata.update(
                 {
@@ -807,6 +1022,8 @@ class RealtimeApp:
                         "issue_events_file": issue_events_file if issue_enabled else None,
                         "preview_frames_written": preview_frames_written,
                         "raw_frames_written": raw_frames_written,
+                        "dropped_frames": (frame_pipeline.dropped_frames if frame_pipeline is not None else 0),
+                        "decimated_frames": (frame_pipeline.decimated_frames if frame_pipeline is not None else 0),
                     },
                     "preview_recording_result": {
                         "enabled_requested": preview_record_requested,
@@ -822,7 +1039,7 @@ class RealtimeApp:
                         "resolved_path": str(raw_video_path) if raw_video_path is not None else None,
                         "frames_written": raw_frames_written,
                     },
-                    "last_context": last_context,
+                    "last_context": _last_context_dict(last_context_values),
                 }
             )
             metadata_path = self.session_dir / self._prefixed_filename("metadata.json")
@@ -860,7 +1077,7 @@ class RealtimeApp:
                     raise RuntimeError("Camera stream ended or frame read failed during acclimation")
                 overlay = self._render_acclimation_frame(frame, remaining_s=remaining_s)
                 cv2.imshow("cpp_dlc_live", overlay)
-                key = cv2.waitKey(1) & 0xFF
+                key = poll_key()
                 if key in (ord("q"), 27):
                     self.logger.info("Preview exit key pressed during acclimation")
                     raise KeyboardInterrupt
@@ -871,7 +1088,7 @@ class RealtimeApp:
         return max(0.0, time.monotonic() - start)
 
     def _create_camera(self, fixed_fps: Optional[float] = None) -> CameraStream:
-        cam_cfg = dict(self.config.get("camera", {}))
+        cam_cfg = dict(self._camera_cfg)
         if self.camera_source_override is not None:
             cam_cfg["source"] = self.camera_source_override
         if fixed_fps is not None:
@@ -901,6 +1118,9 @@ class RealtimeApp:
             gain=_optional_float(cam_cfg.get("gain")),
             flip=bool(cam_cfg.get("flip", False)),
             rotate_deg=int(cam_cfg.get("rotate_deg", 0)),
+            backend=str(cam_cfg.get("backend") or "auto"),
+            buffer_size=_optional_int(cam_cfg.get("buffer_size")),
+            hw_decode=bool(cam_cfg.get("hw_decode", False)),
         )
         return CameraStream(cfg)
 
@@ -973,20 +1193,20 @@ class RealtimeApp:
         return resolved
 
     def _resolve_laser_target(self, chamber: str, last_non_neutral: str, on_chambers: Optional[Set[str]] = None) -> bool:
-        laser_cfg = self.config.get("laser_control", {})
-        if not isinstance(laser_cfg, dict):
-            laser_cfg = {}
-        if not bool(laser_cfg.get("enabled", True)):
+        if not self._laser_enabled:
             return False
 
-        resolved_on_chambers = on_chambers if on_chambers is not None else self._resolve_laser_on_chambers(laser_cfg)
-        if chamber in {"chamber1", "chamber2"}:
+        if on_chambers is not None:
+            resolved_on_chambers = on_chambers
+        else:
+            resolved_on_chambers = self._resolve_laser_on_chambers(self._laser_cfg)
+        if chamber in _NON_NEUTRAL_CHAMBERS:
             return chamber in resolved_on_chambers
 
         if chamber == "neutral":
-            strategy = str(self.config.get("roi", {}).get("strategy_on_neutral", "off")).lower().strip()
+            strategy = self._strategy_on_neutral
             if strategy == "hold_last":
-                if last_non_neutral in {"chamber1", "chamber2"}:
+                if last_non_neutral in _NON_NEUTRAL_CHAMBERS:
                     return last_non_neutral in resolved_on_chambers
                 return self._resolve_unknown_policy(last_non_neutral, resolved_on_chambers)
             if strategy == "unknown":
@@ -996,8 +1216,7 @@ class RealtimeApp:
         return self._resolve_unknown_policy(last_non_neutral, resolved_on_chambers)
 
     def _resolve_unknown_policy(self, last_non_neutral: str, on_chambers: Set[str]) -> bool:
-        unknown_policy = str(self.config.get("laser_control", {}).get("unknown_policy", "off")).lower().strip()
-        if unknown_policy == "hold_last":
+        if self._unknown_policy == "hold_last":
             return last_non_neutral in on_chambers
         return False
 
@@ -1005,15 +1224,29 @@ class RealtimeApp:
         if chamber_raw != "neutral":
             return chamber_raw
 
-        strategy = str(self.config.get("roi", {}).get("strategy_on_neutral", "off")).lower().strip()
+        strategy = self._strategy_on_neutral
         if strategy == "hold_last":
-            if last_non_neutral in {"chamber1", "chamber2"}:
+            if last_non_neutral in _NON_NEUTRAL_CHAMBERS:
                 return last_non_neutral
             return "unknown"
         if strategy == "unknown":
             return "unknown"
         return "neutral"
 
+    def _build_neutral_candidate_table(self) -> Tuple[Tuple[int, ...], ...]:
+        """Tabulate `_map_neutral_candidate` as table[raw_code][last_non_neutral_code]."""
+        return tuple(
+            tuple(CHAMBER_NAMES.index(self._map_neutral_candidate(raw, last)) for last in CHAMBER_NAMES)
+            for raw in CHAMBER_NAMES
+        )
+
+    def _build_laser_target_table(self, on_chambers: Set[str]) -> Tuple[Tuple[bool, ...], ...]:
+        """Tabulate `_resolve_laser_target` as table[chamber_code][last_non_neutral_code]."""
+        return tuple(
+            tuple(self._resolve_laser_target(chamber, last, on_chambers=on_chambers) for last in CHAMBER_NAMES)
+            for chamber in CHAMBER_NAMES
+        )
+
     @staticmethod
     def _estimate_fps(timestamps: Deque[float]) -> float:
         if len(timestamps) < 2:
@@ -1039,8 +1272,24 @@ class RealtimeApp:
         fps_est: float,
         inference_ms: float,
         elapsed_s: float,
+        buffers: Optional[_FrameBufferRing] = None,
+        in_place: bool = False,
+        max_width: Optional[int] = None,
     ) -> np.ndarray:
-        vis = roi.draw(frame)
+        scale = 1.0
+        if max_width is not None and frame.shape[1] > max_width:
+            # Downscale before drawing; the resize doubles as the copy into the output buffer.
+            h, w = frame.shape[:2]
+            size = _scaled_frame_size(w, h, max_width)
+            scale = size[0] / w
+            dst = buffers.next_shaped((size[1], size[0]) + frame.shape[2:], frame.dtype) if buffers is not None else None
+            frame = cv2.resize(frame, size, dst=dst, interpolation=cv2.INTER_LINEAR)
+            in_place = True
+        if in_place:
+            out: Optional[np.ndarray] = frame
+        else:
+            out = buffers.next_like(frame) if buffers is not None else None
+        vis = roi.draw(frame, out=out, scale=scale)
         for name, (px, py, pp), is_control in _resolve_preview_points(
             keypoints=keypoints,
             display_bodyparts=display_bodyparts,
@@ -1049,6 +1298,8 @@ class RealtimeApp:
         ):
             if not (math.isfinite(px) and math.isfinite(py)):
                 continue
+            px *= scale
+            py *= scale
             color = (255, 255, 255) if is_control else _bodypart_color(name)
             radius = 5 if is_control else 4
             cv2.circle(vis, (int(px), int(py)), radius, color, -1)
@@ -1062,28 +1313,16 @@ class RealtimeApp:
                 1,
             )
 
-        cv2.putText(vis, f"chamber: {chamber}", (10, 24), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(vis, f"laser: {laser_state}", (10, 52), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(
-            vis,
+        hud_lines = (
+            f"chamber: {chamber}",
+            f"laser: {laser_state}",
             f"laser_mode: {laser_mode_text}",
-            (10, 80),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.7,
-            (255, 255, 255),
-            2,
-        )
-        cv2.putText(vis, f"fps: {fps_est:.1f}", (10, 108), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(vis, f"infer_ms: {inference_ms:.1f}", (10, 136), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(
-            vis,
+            f"fps: {fps_est:.1f}",
+            f"infer_ms: {inference_ms:.1f}",
             f"time: {RealtimeApp._format_elapsed_hhmmss(elapsed_s)}",
-            (10, 164),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.7,
-            (255, 255, 255),
-            2,
         )
+        for text, origin in zip(hud_lines, _HUD_ORIGINS):
+            cv2.putText(vis, text, origin, cv2.FONT_HERSHEY_SIMPLEX, 0.7, _HUD_COLOR, 2)
         return vis
 
     @staticmethod
@@ -1115,6 +1354,22 @@ class RealtimeApp:
             return path
         return self.session_dir / path
 
+    def _open_video_writer(
+        self,
+        path: Path,
+        codec: str,
+        fps: float,
+        frame_size: Tuple[int, int],
+        hw_encoder: Optional[str] = None,
+    ) -> Union[cv2.VideoWriter, FFmpegPipeWriter]:
+        """Open a hardware ffmpeg writer when `hw_encoder` is set, else (or on failure) a cv2 writer."""
+        if hw_encoder is not None:
+            hw_writer = FFmpegPipeWriter(path, fps, frame_size, hw_encoder)
+            if hw_writer.isOpened():
+                return hw_writer
+            self.logger.warning("Failed to start ffmpeg %s writer for %s; falling back to codec=%s", hw_encoder, path, codec)
+        return cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*codec), fps, frame_size)
+
     @staticmethod
     def _resolve_preview_writer_fps(
         preview_fps_override: Optional[float],
@@ -1167,6 +1422,27 @@ class RealtimeApp:
         return ensure_prefixed_filename(base_name, self.file_prefix)
 
 
+def _last_context_dict(values: Tuple[Any, ...]) -> Dict[str, Any]:
+    if not values:
+        return {}
+    context = dict(zip(_LAST_CONTEXT_KEYS, values))
+    context["p"] = float(context["p"])
+    context["desired_laser_state"] = int(bool(context["desired_laser_state"]))
+    return context
+
+
+def _scaled_frame_size(width: int, height: int, max_width: Optional[int]) -> Tuple[int, int]:
+    """(width, height) of a preview frame limited to `max_width`, keeping the aspect ratio."""
+    if max_width is None or width <= max_width:
+        return int(width), int(height)
+    return int(max_width), max(1, int(round(height * max_width / width)))
+
+
+def _config_section(config: Dict[str, Any], name: str) -> Dict[str, Any]:
+    section = config.get(name, {})
+    return section if isinstance(section, dict) else {}
+
+
 def _optional_int(v: Any) -> Optional[int]:
     return int(v) if v is not None else None
 
@@ -1244,6 +1520,13 @@ def _resolve_preview_points(
     return selected
 
 
+# Preview HUD text rows (top-left, 28 px apart). Labels are drawn with putText each
+# frame: with OpenCV's anti-aliased Hershey glyphs, blending a cached label sprite
+# costs more than rasterizing the short strings.
+_HUD_COLOR = (255, 255, 255)
+_HUD_ORIGINS = ((10, 24), (10, 52), (10, 80), (10, 108), (10, 136), (10, 164))
+
+
 def _bodypart_color(name: str) -> Tuple[int, int, int]:
     palette = [
         (0, 255, 0),
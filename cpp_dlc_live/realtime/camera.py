@@ -3,11 +3,26 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 import time
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 
+# camera.backend name -> cv2 capture API; names missing from this OpenCV build are skipped.
+_CAPTURE_BACKENDS: Dict[str, int] = {
+    name: getattr(cv2, const)
+    for name, const in (
+        ("auto", "CAP_ANY"),
+        ("ffmpeg", "CAP_FFMPEG"),
+        ("gstreamer", "CAP_GSTREAMER"),
+        ("v4l2", "CAP_V4L2"),
+        ("dshow", "CAP_DSHOW"),
+        ("msmf", "CAP_MSMF"),
+        ("avfoundation", "CAP_AVFOUNDATION"),
+    )
+    if hasattr(cv2, const)
+}
+
 
 @dataclass
 class CameraConfig:
@@ -22,6 +37,9 @@ class CameraConfig:
     gain: Optional[float] = None
     flip: bool = False
     rotate_deg: int = 0
+    backend: str = "auto"
+    buffer_size: Optional[int] = None
+    hw_decode: bool = False
 
 
 class CameraStream:
@@ -31,6 +49,13 @@ class CameraStream:
         self._throttle_period_s: Optional[float] = None
         self._next_frame_deadline: Optional[float] = None
         self._throttle_reason: Optional[str] = None
+        self._frame_pool: List[Optional[np.ndarray]] = []
+        # Output buffers for flip and rotation, parallel to _frame_pool (same slot index).
+        self._flip_pool: List[Optional[np.ndarray]] = []
+        self._rotate_pool: List[Optional[np.ndarray]] = []
+        self._frame_pool_next = 0
+        # (height, width, map1, map2) for arbitrary-angle rotation, built on the first frame.
+        self._rotate_maps: Optional[Tuple[int, int, np.ndarray, np.ndarray]] = None
 
         if cfg.fps_target is not None and float(cfg.fps_target) > 0:
             # For file input, allow explicit fast offline replay by disabling realtime throttle.
@@ -42,9 +67,12 @@ class CameraStream:
                 self._throttle_period_s = 1.0 / float(cfg.fps_target)
                 self._throttle_reason = "enforce_fps"
 
-        self.cap = cv2.VideoCapture(cfg.source)
+        self.cap = self._open_capture()
         if not self.cap.isOpened():
             raise RuntimeError(f"Failed to open camera/video source: {cfg.source}")
+        if cfg.buffer_size is not None and not self._source_is_file:
+            # Smaller driver queue = fewer stale frames ahead of the newest one; ignored by backends without it.
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, int(cfg.buffer_size))
 
         if cfg.width is not None:
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, int(cfg.width))
@@ -54,25 +82,65 @@ class CameraStream:
             self.cap.set(cv2.CAP_PROP_FPS, float(cfg.fps_target))
         self._apply_exposure_settings()
 
+    def set_frame_pool(self, size: int) -> None:
+        """Decode into a ring of `size` reused buffers instead of a fresh array per frame.
+
+        A frame returned by `read()` is overwritten `size` reads later, so `size`
+        must exceed the number of frames the caller keeps alive at once. 0 disables.
+        Flip and rotation then also write into per-slot buffers (`dst=`).
+        """
+        size = max(0, int(size))
+        self._frame_pool = [None] * size
+        self._flip_pool = [None] * size if self.cfg.flip and int(self.cfg.rotate_deg) % 360 in (0, 90) else []
+        self._rotate_pool = [None] * size if int(self.cfg.rotate_deg) % 360 else []
+        self._frame_pool_next = 0
+
     def read(self) -> Tuple[bool, Optional[np.ndarray]]:
-        ok, frame = self.cap.read()
+        i = 0
+        if self._frame_pool:
+            i = self._frame_pool_next
+            self._frame_pool_next = (i + 1) % len(self._frame_pool)
+            ok, frame = self.cap.read(self._frame_pool[i])
+            if ok and frame is not None:
+                self._frame_pool[i] = frame
+        else:
+            ok, frame = self.cap.read()
         if not ok or frame is None:
             return False, None
 
-        if self.cfg.flip:
-            frame = cv2.flip(frame, 1)
-
         rotate = int(self.cfg.rotate_deg) % 360
-        if rotate == 90:
-            frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-        elif rotate == 180:
-            frame = cv2.rotate(frame, cv2.ROTATE_180)
-        elif rotate == 270:
-            frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
-        elif rotate not in (0,):
-            h, w = frame.shape[:2]
-            m = cv2.getRotationMatrix2D((w / 2, h / 2), rotate, 1.0)
-            frame = cv2.warpAffine(frame, m, (w, h))
+        if self.cfg.flip and rotate not in (0, 90):
+            # Mirror + rotation fused into one pass over the frame.
+            dst = self._rotate_pool[i] if self._rotate_pool else None
+            if rotate == 180:
+                frame = cv2.flip(frame, 0, dst=dst)
+            elif rotate == 270:
+                frame = cv2.transpose(frame, dst=dst)
+            else:
+                map1, map2 = self._rotation_maps(frame.shape[0], frame.shape[1], rotate, mirror=True)
+                frame = cv2.remap(frame, map1, map2, cv2.INTER_LINEAR, dst=dst)
+            if self._rotate_pool:
+                self._rotate_pool[i] = frame
+            rotate = 0
+        elif self.cfg.flip:
+            dst = self._flip_pool[i] if self._flip_pool else None
+            frame = cv2.flip(frame, 1, dst=dst)
+            if self._flip_pool:
+                self._flip_pool[i] = frame
+
+        if rotate:
+            dst = self._rotate_pool[i] if self._rotate_pool else None
+            if rotate == 90:
+                frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE, dst=dst)
+            elif rotate == 180:
+                frame = cv2.rotate(frame, cv2.ROTATE_180, dst=dst)
+            elif rotate == 270:
+                frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE, dst=dst)
+            else:
+                map1, map2 = self._rotation_maps(frame.shape[0], frame.shape[1], rotate)
+                frame = cv2.remap(frame, map1, map2, cv2.INTER_LINEAR, dst=dst)
+            if self._rotate_pool:
+                self._rotate_pool[i] = frame
 
         self._apply_realtime_throttle_if_needed()
         return True, frame
@@ -120,6 +188,27 @@ class CameraStream:
         self.cap.set(cv2.CAP_PROP_GAIN, float(value))
         return float(self.cap.get(cv2.CAP_PROP_GAIN) or 0.0)
 
+    def _rotation_maps(self, h: int, w: int, rotate: int, mirror: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Fixed-point remap tables equivalent to `warpAffine` with a rotation about the centre.
+
+        With `mirror`, the tables also apply the horizontal flip that precedes the
+        rotation, so both happen in one remap. The flip and angle are fixed per
+        session, so the per-pixel source coordinates are computed once (and again
+        only if the frame size changes).
+        """
+        cached = self._rotate_maps
+        if cached is not None and cached[0] == h and cached[1] == w:
+            return cached[2], cached[3]
+        inv = cv2.invertAffineTransform(cv2.getRotationMatrix2D((w / 2, h / 2), rotate, 1.0))
+        xs, ys = np.meshgrid(np.arange(w, dtype=np.float32), np.arange(h, dtype=np.float32))
+        map_x = (inv[0, 0] * xs + inv[0, 1] * ys + inv[0, 2]).astype(np.float32)
+        map_y = (inv[1, 0] * xs + inv[1, 1] * ys + inv[1, 2]).astype(np.float32)
+        if mirror:
+            map_x = (w - 1) - map_x
+        map1, map2 = cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+        self._rotate_maps = (h, w, map1, map2)
+        return map1, map2
+
     def _apply_realtime_throttle_if_needed(self) -> None:
         if self._throttle_period_s is None:
             return
@@ -139,6 +228,19 @@ class CameraStream:
             next_deadline = now + self._throttle_period_s
         self._next_frame_deadline = next_deadline
 
+    def _open_capture(self) -> cv2.VideoCapture:
+        backend = str(self.cfg.backend or "auto").strip().lower()
+        if backend not in _CAPTURE_BACKENDS:
+            raise ValueError(
+                f"Unsupported camera.backend '{self.cfg.backend}' (available: {', '.join(sorted(_CAPTURE_BACKENDS))})"
+            )
+        api = _CAPTURE_BACKENDS[backend]
+        hw_prop = getattr(cv2, "CAP_PROP_HW_ACCELERATION", None)
+        if self.cfg.hw_decode and hw_prop is not None:
+            # OpenCV >= 4.5.2; falls back to software decoding when no accelerator is available.
+            return cv2.VideoCapture(self.cfg.source, api, [hw_prop, cv2.VIDEO_ACCELERATION_ANY])
+        return cv2.VideoCapture(self.cfg.source, api)
+
     def _apply_exposure_settings(self) -> None:
         if self.cfg.auto_exposure is not None:
             self.set_auto_exposure(bool(self.cfg.auto_exposure))
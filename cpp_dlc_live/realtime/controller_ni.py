@@ -11,13 +11,21 @@ class LaserControllerError(RuntimeError):
     pass
 
 
+# (nidaqmx, AcquisitionType) after the first successful import; failures are not cached.
+_NIDAQMX_CACHE: Optional[Tuple[Any, Any]] = None
+
+
 def _import_nidaqmx() -> Tuple[Any, Any]:
+    global _NIDAQMX_CACHE
+    if _NIDAQMX_CACHE is not None:
+        return _NIDAQMX_CACHE
     try:
         import nidaqmx  # type: ignore
         from nidaqmx.constants import AcquisitionType  # type: ignore
     except Exception as exc:
         raise LaserControllerError("nidaqmx is not installed or NI-DAQmx driver is unavailable") from exc
-    return nidaqmx, AcquisitionType
+    _NIDAQMX_CACHE = (nidaqmx, AcquisitionType)
+    return _NIDAQMX_CACHE
 
 
 def _set_pulse_terminal(task: Any, pulse_term: Optional[str]) -> None:
@@ -46,8 +54,9 @@ class DryRunLaserController(LaserControllerBase):
 
     def set_state(self, on: bool) -> None:
         target = bool(on)
-        if target != self.current_state:
-            self.logger.debug("DryRun laser state -> %s", int(target))
+        if target == self.current_state:
+            return
+        self.logger.debug("DryRun laser state -> %s", int(target))
         self.current_state = target
 
     def stop(self) -> None:
@@ -84,9 +93,13 @@ class NILaserControllerContinuous(LaserControllerBase):
     def set_state(self, on: bool) -> None:
         if self._do_task is None:
             raise LaserControllerError("Continuous NI controller is not started")
+        target = bool(on)
+        # The line was driven to current_state by the last successful write (or start()).
+        if target == self.current_state:
+            return
         try:
-            self._do_task.write(bool(on))
-            self.current_state = bool(on)
+            self._do_task.write(target)
+            self.current_state = target
         except Exception as exc:
             raise LaserControllerError("Failed to set continuous laser state") from exc
 
@@ -161,9 +174,13 @@ class NILaserControllerGated(LaserControllerBase):
     def set_state(self, on: bool) -> None:
         if self._enable_task is None:
             raise LaserControllerError("Gated NI controller is not started")
+        target = bool(on)
+        # The enable line was driven to current_state by the last successful write (or start()).
+        if target == self.current_state:
+            return
         try:
-            self._enable_task.write(bool(on))
-            self.current_state = bool(on)
+            self._enable_task.write(target)
+            self.current_state = target
         except Exception as exc:
             raise LaserControllerError("Failed to set gated laser state") from exc
 
@@ -248,17 +265,19 @@ class NILaserControllerStartStop(LaserControllerBase):
             raise LaserControllerError("StartStop NI controller is not started")
 
         target = bool(on)
+        if target == self._counter_running:
+            return
         now = time.monotonic()
 
         try:
-            if target and not self._counter_running:
+            if target:
                 if (now - self._last_switch) < self.min_off_s:
                     return
                 self._counter_task.start()
                 self._counter_running = True
                 self.current_state = True
                 self._last_switch = now
-            elif (not target) and self._counter_running:
+            else:
                 if (now - self._last_switch) < self.min_on_s:
                     return
                 self._counter_task.stop()
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Hashable
 
 
 @dataclass
 class Debouncer:
     required_count: int
-    initial_state: str = "unknown"
+    initial_state: Hashable = "unknown"
 
     def __post_init__(self) -> None:
         if self.required_count < 1:
@@ -16,10 +17,10 @@ class Debouncer:
         self._candidate_count = 0
 
     @property
-    def stable_state(self) -> str:
+    def stable_state(self) -> Hashable:
         return self._stable_state
 
-    def update(self, candidate_state: str) -> str:
+    def update(self, candidate_state: Hashable) -> Hashable:
         if self.required_count == 1:
             self._stable_state = candidate_state
             self._candidate_state = candidate_state
@@ -7,7 +7,12 @@ from typing import Any, Dict, List, Optional
 
 import cv2
 import numpy as np
-import yaml
+
+from cpp_dlc_live.utils.io_utils import load_yaml
+
+
+# MockDLCRuntime auto-downsampling keeps at least this many pixels on the short side.
+_MOCK_MIN_SIDE = 240
 
 
 @dataclass
@@ -28,19 +33,42 @@ class RuntimeBase:
 
 
 class MockDLCRuntime(RuntimeBase):
-    def __init__(self, bodypart: str = "center"):
+    """Otsu-threshold centroid tracker used when DLCLive is unavailable.
+
+    `downsample=None` shrinks large frames (INTER_AREA) so the short side stays
+    at least `_MOCK_MIN_SIDE` pixels before thresholding; the centroid is mapped
+    back to full-resolution pixel coordinates using the actual per-axis resize
+    ratios. `downsample=1` always uses the full-resolution path; larger values are
+    clamped so the resized frame keeps at least one pixel per side.
+    """
+
+    def __init__(self, bodypart: str = "center", downsample: Optional[int] = None):
         self.bodypart = bodypart
+        self.downsample = None if downsample is None else max(1, int(downsample))
 
     def infer(self, frame: np.ndarray) -> PoseResult:
+        h, w = frame.shape[:2]
+        scale = self.downsample if self.downsample is not None else max(1, min(h, w) // _MOCK_MIN_SIDE)
+        # Never shrink a side below one pixel.
+        scale = max(1, min(scale, h, w))
+        sx = sy = 1.0
+        if scale > 1:
+            small_w, small_h = w // scale, h // scale
+            # w // scale drops the remainder, so the real per-axis ratios are slightly above `scale`.
+            sx, sy = w / small_w, h / small_h
+            frame = cv2.resize(frame, (small_w, small_h), interpolation=cv2.INTER_AREA)
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         _, mask = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
         m = cv2.moments(mask)
         if m["m00"] > 0:
             x = float(m["m10"] / m["m00"])
             y = float(m["m01"] / m["m00"])
+            if scale > 1:
+                # Pixel centres of the small image map to (i + 0.5) * ratio - 0.5 at full resolution.
+                x = (x + 0.5) * sx - 0.5
+                y = (y + 0.5) * sy - 0.5
             p = 1.0
         else:
-            h, w = gray.shape
             x = float(w / 2)
             y = float(h / 2)
             p = 0.0
@@ -85,6 +113,13 @@ class DLCLiveRuntime(RuntimeBase):
         self._model_cfg = _load_model_cfg(model_path)
         self._bodyparts = _extract_bodyparts(self._model_cfg)
         self._snapshot = _extract_snapshot(self._model_cfg)
+        # Bodypart lookups resolved once; infer() only indexes pose rows.
+        self._target_rows, self._resolved_bodypart = _resolve_bodypart_rows(self._bodyparts, self.bodypart)
+        # Keep a "center" alias when center is synthesized from nose/tailbase midpoint.
+        self._center_alias = (
+            self.bodypart.strip().lower() == "center" and self._resolved_bodypart == "nose_tailbase_midpoint"
+        )
+        self._keypoint_names: List[str] = []
         processor = Processor()
 
         # Prefer explicit backend selection for DLC 3.0 PyTorch models.
@@ -107,13 +142,15 @@ class DLCLiveRuntime(RuntimeBase):
         if pose.ndim != 2 or pose.shape[1] < 3:
             raise RuntimeError(f"Unexpected pose shape: {pose.shape}")
 
-        x, y, p, resolved = _select_bodypart(pose, self._bodyparts, self.bodypart)
-        keypoints = _extract_keypoints(pose=pose, bodyparts=self._bodyparts)
+        resolved = self._resolved_bodypart
+        x, y, p = _pose_at_rows(pose, self._target_rows)
+        if len(self._keypoint_names) != pose.shape[0]:
+            self._keypoint_names = _keypoint_names(self._bodyparts, int(pose.shape[0]))
+        keypoints = dict(zip(self._keypoint_names, map(tuple, pose[:, :3].tolist())))
         if resolved not in keypoints:
-            keypoints[resolved] = (float(x), float(y), float(p))
-        # Keep a "center" alias when center is synthesized from nose/tailbase midpoint.
-        if self.bodypart.strip().lower() == "center" and resolved == "nose_tailbase_midpoint":
-            keypoints.setdefault("center", (float(x), float(y), float(p)))
+            keypoints[resolved] = (x, y, p)
+        if self._center_alias:
+            keypoints.setdefault("center", (x, y, p))
         return PoseResult(
             x=float(x),
             y=float(y),
@@ -135,7 +172,89 @@ class DLCLiveRuntime(RuntimeBase):
         }
 
 
+class PoseCacheRuntime(RuntimeBase):
+    """Reuse the last pose for frames that are near-duplicates of the last inferred frame.
+
+    Each frame is reduced to a small grayscale signature (`signature_size` squared
+    pixels). When its mean absolute difference from the signature of the last
+    frame actually sent to `runtime` is at most `threshold` grey levels, the
+    previous `PoseResult` is returned without running inference. At most
+    `max_reuse` consecutive frames reuse a pose, which bounds its staleness.
+    """
+
+    def __init__(
+        self,
+        runtime: RuntimeBase,
+        threshold: float = 1.0,
+        max_reuse: int = 3,
+        signature_size: int = 16,
+    ):
+        self.runtime = runtime
+        self.threshold = float(threshold)
+        self.max_reuse = max(0, int(max_reuse))
+        self.signature_size = max(1, int(signature_size))
+        self.hits = 0
+        self.misses = 0
+        self._last_signature: Optional[np.ndarray] = None
+        self._last_pose: Optional[PoseResult] = None
+        self._reused = 0
+
+    def infer(self, frame: np.ndarray) -> PoseResult:
+        signature = self._signature(frame)
+        if self._last_pose is not None and self._reused < self.max_reuse and signature.shape == self._last_signature.shape:
+            diff = cv2.norm(signature, self._last_signature, cv2.NORM_L1) / signature.size
+            if diff <= self.threshold:
+                self._reused += 1
+                self.hits += 1
+                return self._last_pose
+        pose = self.runtime.infer(frame)
+        self._last_signature = signature
+        self._last_pose = pose
+        self._reused = 0
+        self.misses += 1
+        return pose
+
+    def model_info(self) -> Dict[str, Any]:
+        info = dict(self.runtime.model_info())
+        info["pose_cache"] = {
+            "threshold": self.threshold,
+            "max_reuse": self.max_reuse,
+            "signature_size": self.signature_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+        return info
+
+    def _signature(self, frame: np.ndarray) -> np.ndarray:
+        # Stride-subsample before INTER_AREA so the signature costs well under 1 ms on full-HD frames.
+        step = max(1, min(frame.shape[0], frame.shape[1]) // (self.signature_size * 4))
+        small = np.ascontiguousarray(frame[::step, ::step])
+        small = cv2.resize(small, (self.signature_size, self.signature_size), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
+
+
 def build_runtime(dlc_cfg: Dict[str, Any], logger: Optional[logging.Logger] = None) -> RuntimeBase:
+    runtime = _build_model_runtime(dlc_cfg, logger)
+    cache_cfg = dlc_cfg.get("cache") or {}
+    if not _as_bool(cache_cfg.get("enabled"), default=False):
+        return runtime
+    cached = PoseCacheRuntime(
+        runtime,
+        threshold=float(cache_cfg.get("threshold", 1.0)),
+        max_reuse=int(cache_cfg.get("max_reuse", 3)),
+    )
+    if logger:
+        logger.info(
+            "Pose cache enabled (threshold=%.2f grey levels, max_reuse=%d frames)",
+            cached.threshold,
+            cached.max_reuse,
+        )
+    return cached
+
+
+def _build_model_runtime(dlc_cfg: Dict[str, Any], logger: Optional[logging.Logger] = None) -> RuntimeBase:
     bodypart = str(dlc_cfg.get("bodypart", "center"))
     backend = _normalize_backend(dlc_cfg.get("backend", "auto"))
     device = _normalize_device(dlc_cfg.get("device", "auto"))
@@ -199,10 +318,8 @@ def _load_model_cfg(model_path: str) -> Dict[str, Any]:
         if not p.exists():
             continue
         try:
-            with p.open("r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
-            if isinstance(cfg, dict):
-                return cfg
+            # load_yaml keeps the parsed file while its mtime/size are unchanged, so re-creating a runtime skips the parse.
+            return load_yaml(p)
         except Exception:
             continue
     return {}
@@ -252,13 +369,14 @@ def _extract_snapshot(model_cfg: Dict[str, Any]) -> Optional[str]:
 
 
 def _extract_keypoints(pose: np.ndarray, bodyparts: List[str]) -> Dict[str, tuple[float, float, float]]:
-    points: Dict[str, tuple[float, float, float]] = {}
     n = int(pose.shape[0]) if pose.ndim >= 2 else 0
-    for idx in range(n):
-        row = pose[idx]
-        name = bodyparts[idx] if idx < len(bodyparts) else f"kp{idx}"
-        points[str(name)] = (float(row[0]), float(row[1]), float(row[2]))
-    return points
+    if n == 0:
+        return {}
+    return dict(zip(_keypoint_names(bodyparts, n), map(tuple, pose[:, :3].tolist())))
+
+
+def _keypoint_names(bodyparts: List[str], n: int) -> List[str]:
+    return [str(bodyparts[idx]) if idx < len(bodyparts) else f"kp{idx}" for idx in range(n)]
 
 
 def _normalize_bodypart_names(raw_names: Any) -> List[str]:
@@ -276,27 +394,31 @@ def _normalize_bodypart_names(raw_names: Any) -> List[str]:
 
 
 def _select_bodypart(pose: np.ndarray, bodyparts: List[str], target: str) -> tuple[float, float, float, str]:
-    target = target.strip()
+    rows, name = _resolve_bodypart_rows(bodyparts, target)
+    x, y, p = _pose_at_rows(pose, rows)
+    return x, y, p, name
+
 
-    def pick(idx: int, name: str) -> tuple[float, float, float, str]:
-        row = pose[idx]
-        return float(row[0]), float(row[1]), float(row[2]), name
-
-    if bodyparts and target in bodyparts:
-        return pick(bodyparts.index(target), target)
-
-    if bodyparts and target == "center":
-        if "center" in bodyparts:
-            return pick(bodyparts.index("center"), "center")
-        if "nose" in bodyparts and "tailbase" in bodyparts:
-            nose = pose[bodyparts.index("nose")]
-            tail = pose[bodyparts.index("tailbase")]
-            x = float((nose[0] + tail[0]) / 2.0)
-            y = float((nose[1] + tail[1]) / 2.0)
-            p = float(min(nose[2], tail[2]))
-            return x, y, p, "nose_tailbase_midpoint"
-
-    return pick(0, bodyparts[0] if bodyparts else "index0")
+def _resolve_bodypart_rows(bodyparts: List[str], target: str) -> tuple[tuple[int, ...], str]:
+    """Pose rows for `target` and the resolved name; two rows mean the nose/tailbase midpoint."""
+    target = target.strip()
+    index: Dict[str, int] = {}
+    for i, name in enumerate(bodyparts):
+        index.setdefault(name, i)
+    if target in index:
+        return (index[target],), target
+    if target == "center" and "nose" in index and "tailbase" in index:
+        return (index["nose"], index["tailbase"]), "nose_tailbase_midpoint"
+    return (0,), bodyparts[0] if bodyparts else "index0"
+
+
+def _pose_at_rows(pose: np.ndarray, rows: tuple[int, ...]) -> tuple[float, float, float]:
+    if len(rows) == 1:
+        row = pose[rows[0]]
+        return float(row[0]), float(row[1]), float(row[2])
+    nose = pose[rows[0]]
+    tail = pose[rows[1]]
+    return float((nose[0] + tail[0]) / 2.0), float((nose[1] + tail[1]) / 2.0), float(min(nose[2], tail[2]))
 
 
 def _normalize_backend(value: Any) -> str:
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-import json
+import queue
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+
+from cpp_dlc_live.utils.json_utils import json_dumps_bytes
+
+# Exact types json.dumps encodes as-is; a record holding only these needs no conversion.
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 def _json_safe(value: Any) -> Any:
@@ -17,29 +23,76 @@ def _json_safe(value: Any) -> Any:
 
 
 class SessionIssueLogger:
-    """Structured runtime issue logger for post-hoc troubleshooting."""
+    """Structured runtime issue logger for post-hoc troubleshooting.
+
+    `log()` snapshots the record and queues it; a background thread encodes
+    queued records (orjson when installed) and appends them to the JSONL file
+    in batches (one write and flush per batch), so the realtime loop never
+    blocks on disk. `close()`
+    writes everything still queued; a write error on the background thread is
+    re-raised from the next `log()` or `close()`.
+    """
 
     def __init__(self, path: Path, enabled: bool = True):
         self.path = Path(path)
         self.enabled = bool(enabled)
         self._file = None
+        self._queue: "queue.SimpleQueue[Optional[Dict[str, Any]]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
         if self.enabled:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            self._file = self.path.open("a", encoding="utf-8")
+            self._file = self.path.open("ab")
+            self._thread = threading.Thread(target=self._writer_loop, name="cpp_dlc_live-issues", daemon=True)
+            self._thread.start()
 
     def log(self, event: str, level: str = "INFO", **fields: Any) -> None:
         if not self.enabled or self._file is None:
             return
+        if self._error is not None:
+            raise self._error
         record: Dict[str, Any] = {
             "t_wall": time.time(),
             "event": str(event),
             "level": str(level).upper(),
         }
         record.update(fields)
-        self._file.write(json.dumps(_json_safe(record), ensure_ascii=False) + "\n")
-        self._file.flush()
+        # Converted here, not on the writer thread, so later mutation of caller objects cannot leak in.
+        # Flat records of scalars (heartbeats, warnings) are already safe and are queued as built.
+        if not all(type(v) in _JSON_SCALAR_TYPES for v in record.values()):
+            record = _json_safe(record)
+        self._queue.put(record)
 
     def close(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
         if self._file is not None:
             self._file.close()
             self._file = None
+        if self._error is not None:
+            raise self._error
+
+    def _writer_loop(self) -> None:
+        while True:
+            record = self._queue.get()
+            lines: List[bytes] = []
+            done = False
+            while True:
+                if record is None:
+                    done = True
+                    break
+                lines.append(json_dumps_bytes(record) + b"\n")
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if lines and self._error is None:
+                try:
+                    self._file.write(b"".join(lines))
+                    self._file.flush()
+                except BaseException as exc:
+                    self._error = exc
+            if done:
+                return
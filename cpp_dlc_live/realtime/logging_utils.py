@@ -1,20 +1,32 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from cpp_dlc_live.utils.io_utils import ensure_prefixed_filename
 
+# One background listener per configured logger; replaced when setup_logging runs again.
+_LISTENERS: Dict[str, QueueListener] = {}
+
 
 def setup_logging(
     session_dir: Path,
     logger_name: str = "cpp_dlc_live",
     file_prefix: Optional[str] = None,
 ) -> logging.Logger:
+    """Configure console (INFO) and run.log (DEBUG) output for `logger_name`.
+
+    The logger itself only gets a QueueHandler; console and file writes happen on
+    a QueueListener thread, so logging from the realtime loop never blocks on I/O.
+    """
     logger = logging.getLogger(logger_name)
     logger.setLevel(logging.DEBUG)
 
+    stop_logging(logger_name)
     for h in list(logger.handlers):
         logger.removeHandler(h)
 
@@ -31,7 +43,30 @@ def setup_logging(
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(fmt)
 
-    logger.addHandler(console)
-    logger.addHandler(file_handler)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console, file_handler, respect_handler_level=True)
+    listener.start()
+    _LISTENERS[logger_name] = listener
+
+    logger.addHandler(QueueHandler(log_queue))
     logger.propagate = False
     return logger
+
+
+def stop_logging(logger_name: str = "cpp_dlc_live") -> None:
+    """Flush pending records and stop the background listener for `logger_name`, if any."""
+    listener = _LISTENERS.pop(logger_name, None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _stop_all_listeners() -> None:
+    for name in list(_LISTENERS):
+        stop_logging(name)
+
+
+# Registered after `logging` itself, so this runs first at exit and queued records are written.
+atexit.register(_stop_all_listeners)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from cpp_dlc_live.realtime.camera import CameraStream
+from cpp_dlc_live.realtime.dlc_runtime import PoseResult, RuntimeBase
+
+# Marks end-of-stream in the stage queues.
+_EOS = object()
+
+
+@dataclass
+class FramePacket:
+    frame: np.ndarray
+    t_wall: float
+    pose: PoseResult
+    inference_ms: float
+
+
+class _StageFailure:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+class FramePipeline:
+    """Deliver (frame, pose) packets from a camera and DLC runtime.
+
+    With `threaded=True`, capture and inference run on two daemon threads linked
+    by bounded FIFOs, so the caller's control/record/preview work overlaps with
+    inference on the next frame and capture of the one after. Throughput is then
+    bounded by the slowest stage instead of the sum of all stages. Frames are
+    never dropped, so file replays stay deterministic.
+
+    With `drain_to_latest=True` (threaded only), the inference stage skips any
+    frames that queued up while it was busy and processes only the newest one,
+    so control latency stays bounded when inference is slower than capture;
+    skipped frames are counted in `dropped_frames`.
+
+    With `idle_every_n > 1`, while the caller has marked the session idle via
+    `set_idle(True)` only every n-th frame is inferred; the frames in between
+    reuse the last pose (with `inference_ms` 0) as long as it is at most
+    `idle_max_stale_s` old. Reused frames are counted in `decimated_frames`.
+
+    With `threaded=False`, `get()` reads and infers inline (the original serial loop).
+    Exceptions raised on a worker thread are re-raised from `get()`.
+    """
+
+    def __init__(
+        self,
+        camera: CameraStream,
+        runtime: RuntimeBase,
+        threaded: bool = True,
+        queue_size: int = 2,
+        drain_to_latest: bool = False,
+        poll_interval_s: float = 0.1,
+        idle_every_n: int = 1,
+        idle_max_stale_s: float = 0.1,
+    ):
+        self.camera = camera
+        self.runtime = runtime
+        self.threaded = bool(threaded)
+        self.queue_size = max(1, int(queue_size))
+        self.drain_to_latest = bool(drain_to_latest)
+        self.poll_interval_s = float(poll_interval_s)
+        self.dropped_frames = 0
+        self.idle_every_n = max(1, int(idle_every_n))
+        self.idle_max_stale_s = float(idle_max_stale_s)
+        self.decimated_frames = 0
+        self._idle = False
+        self._idle_reused = 0
+        self._last_pose: Optional[PoseResult] = None
+        self._last_pose_wall = 0.0
+        self._capture_q: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        self._result_q: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._finished = False
+
+    @property
+    def frames_in_flight(self) -> int:
+        """Upper bound on frames held by the worker stages and their queues."""
+        # Both queues full, plus one frame in each stage's hands.
+        return 2 * self.queue_size + 2 if self.threaded else 0
+
+    def start(self) -> None:
+        if not self.threaded or self._threads:
+            return
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="cpp_dlc_live-capture", daemon=True),
+            threading.Thread(target=self._inference_loop, name="cpp_dlc_live-inference", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def get(self) -> Optional[FramePacket]:
+        """Return the next packet, or None once the camera stops delivering frames."""
+        if self._finished:
+            return None
+        if not self.threaded:
+            ok, frame = self.camera.read()
+            if not ok or frame is None:
+                self._finished = True
+                return None
+            t_wall = time.time()
+            return self._infer(frame, t_wall)
+
+        while True:
+            try:
+                # Timed wait keeps Ctrl-C responsive on platforms where a blocking get is not interruptible.
+                item = self._result_q.get(timeout=self.poll_interval_s)
+            except queue.Empty:
+                continue
+            if item is _EOS:
+                self._finished = True
+                return None
+            if isinstance(item, _StageFailure):
+                self._finished = True
+                raise item.exc
+            return item
+
+    def set_idle(self, idle: bool) -> None:
+        """Mark whether inference may be decimated (see `idle_every_n`); cheap enough to call per frame."""
+        self._idle = bool(idle)
+
+    def stop(self) -> None:
+        """Stop worker threads; must be called before releasing the camera."""
+        self._stop.set()
+        for q in (self._capture_q, self._result_q):
+            _drain(q)
+        for thread in self._threads:
+            thread.join(timeout=5.0)
+        self._threads = []
+
+    def _infer(self, frame: np.ndarray, t_wall: float) -> FramePacket:
+        if (
+            self._idle
+            and self._idle_reused < self.idle_every_n - 1
+            and self._last_pose is not None
+            and t_wall - self._last_pose_wall <= self.idle_max_stale_s
+        ):
+            self._idle_reused += 1
+            self.decimated_frames += 1
+            return FramePacket(frame=frame, t_wall=t_wall, pose=self._last_pose, inference_ms=0.0)
+        infer_t0 = time.perf_counter()
+        pose = self.runtime.infer(frame)
+        inference_ms = (time.perf_counter() - infer_t0) * 1000.0
+        if self.idle_every_n > 1:
+            self._idle_reused = 0
+            self._last_pose = pose
+            self._last_pose_wall = t_wall
+        return FramePacket(frame=frame, t_wall=t_wall, pose=pose, inference_ms=inference_ms)
+
+    def _capture_loop(self) -> None:
+        try:
+            while not self._stop.is_set():
+                ok, frame = self.camera.read()
+                if not ok or frame is None:
+                    self._put(self._capture_q, _EOS)
+                    return
+                if not self._put(self._capture_q, (time.time(), frame)):
+                    return
+        except BaseException as exc:
+            self._put(self._capture_q, _StageFailure(exc))
+
+    def _inference_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                item = self._capture_q.get(timeout=self.poll_interval_s)
+            except queue.Empty:
+                continue
+            pending_end: Any = None
+            if self.drain_to_latest and not _is_end(item):
+                item, pending_end = self._take_latest(item)
+            if _is_end(item):
+                self._put(self._result_q, item)
+                return
+            t_wall, frame = item
+            try:
+                packet: Any = self._infer(frame, t_wall)
+            except BaseException as exc:
+                packet = _StageFailure(exc)
+            if not self._put(self._result_q, packet) or isinstance(packet, _StageFailure):
+                return
+            if pending_end is not None:
+                self._put(self._result_q, pending_end)
+                return
+
+    def _take_latest(self, item: Any) -> Tuple[Any, Any]:
+        """Discard queued frames older than the newest; return (newest, end marker or None)."""
+        while True:
+            try:
+                newer = self._capture_q.get_nowait()
+            except queue.Empty:
+                return item, None
+            if _is_end(newer):
+                return item, newer
+            self.dropped_frames += 1
+            item = newer
+
+    def _put(self, q: "queue.Queue[Any]", item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=self.poll_interval_s)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+def _is_end(item: Any) -> bool:
+    return item is _EOS or isinstance(item, _StageFailure)
+
+
+def _drain(q: "queue.Queue[Any]") -> None:
+    while True:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            return
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import Callable, Optional, Union
+
+import cv2
+import numpy as np
+
+PreviewSource = Union[np.ndarray, Callable[[], np.ndarray]]
+
+
+def poll_key() -> int:
+    """Pump HighGUI events and return the pressed key (0-255), without the 1 ms wait of `waitKey(1)`.
+
+    Uses `cv2.pollKey()` (OpenCV >= 4.5) and falls back to `cv2.waitKey(1)` on older builds.
+    """
+    poll = getattr(cv2, "pollKey", None)
+    key = poll() if poll is not None else cv2.waitKey(1)
+    return key & 0xFF
+
+
+class PreviewWorker:
+    """Show preview frames on a dedicated thread so the control loop never waits on HighGUI.
+
+    `submit()` keeps only the newest pending frame (older ones are dropped), so a
+    slow display can never back-pressure the realtime loop. A submitted callable
+    is rendered on the preview thread, which also takes overlay drawing off the
+    critical path. Pressing `q`/`Esc` sets `exit_requested`.
+    """
+
+    def __init__(self, window_name: str = "cpp_dlc_live", logger: Optional[logging.Logger] = None):
+        self.window_name = window_name
+        self.logger = logger or logging.getLogger("cpp_dlc_live")
+        self.exit_requested = threading.Event()
+        self._queue: "queue.Queue[Optional[PreviewSource]]" = queue.Queue(maxsize=1)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="cpp_dlc_live-preview", daemon=True)
+        self._thread.start()
+
+    def submit(self, source: PreviewSource) -> None:
+        """Queue a frame (or a callable rendering one), replacing any frame not yet shown."""
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._queue.put_nowait(source)
+        except queue.Full:
+            pass
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.submit(None)  # type: ignore[arg-type]
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        shown = False
+        render_failed = False
+        while not self._stop.is_set():
+            try:
+                source = self._queue.get(timeout=0.05)
+            except queue.Empty:
+                if shown:
+                    self._poll_keys()
+                continue
+            if source is None:
+                break
+            try:
+                image = source() if callable(source) else source
+            except Exception:
+                if not render_failed:
+                    self.logger.exception("Preview rendering failed; further failures are not logged")
+                    render_failed = True
+                continue
+            cv2.imshow(self.window_name, image)
+            shown = True
+            self._poll_keys()
+
+        if shown:
+            try:
+                cv2.destroyWindow(self.window_name)
+            except Exception:
+                pass
+
+    def _poll_keys(self) -> None:
+        key = poll_key()
+        if key in (ord("q"), 27) and not self.exit_requested.is_set():
+            self.logger.info("Preview exit key pressed")
+            self.exit_requested.set()
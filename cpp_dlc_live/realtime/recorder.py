@@ -1,32 +1,80 @@
 from __future__ import annotations
 
 import csv
+import os
+import time
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
+
+# Matches csv.writer's defaults (QUOTE_MINIMAL, "\r\n" line terminator).
+_LINE_TERMINATOR = "\r\n"
+_QUOTE_TRIGGERS = (",", '"', "\r", "\n")
+
+
+def _format_field(value: object) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        if any(ch in value for ch in _QUOTE_TRIGGERS):
+            return '"' + value.replace('"', '""') + '"'
+        return value
+    return str(value)
 
 
 class CSVRecorder:
-    def __init__(self, path: Path, fieldnames: Iterable[str], flush_every: int = 200):
+    """Append rows to a CSV file, formatting them without csv.DictWriter.
+
+    Rows are rendered to text on `write_row` and written in one `write()` call
+    every `flush_every` rows (or once `flush_interval_s` has passed since the
+    last flush, so low frame rates do not leave minutes of rows in memory)
+    through a large file buffer; the output is byte-identical to csv.DictWriter
+    with default dialect settings.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fieldnames: Iterable[str],
+        flush_every: int = 200,
+        buffer_size: int = 128 * 1024,
+        flush_interval_s: Optional[float] = None,
+    ):
         self.path = Path(path)
         self.fieldnames = list(fieldnames)
         self.flush_every = int(flush_every)
-        self._file = self.path.open("w", newline="", encoding="utf-8")
-        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
-        self._writer.writeheader()
-        self._buffer: List[Dict[str, object]] = []
+        self._file = self.path.open("w", newline="", encoding="utf-8", buffering=int(buffer_size))
+        csv.writer(self._file).writerow(self.fieldnames)
+        self._pending: List[str] = []
+        self.flush_interval_s = flush_interval_s
+        self._next_flush_t = (time.monotonic() + flush_interval_s) if flush_interval_s else None
 
     def write_row(self, row: Dict[str, object]) -> None:
-        self._buffer.append({k: row.get(k) for k in self.fieldnames})
-        if len(self._buffer) >= self.flush_every:
+        self._append(",".join([_format_field(row.get(k)) for k in self.fieldnames]) + _LINE_TERMINATOR)
+
+    def write_values(self, *values: object) -> None:
+        """Like `write_row`, but take values positionally in `fieldnames` order (no per-row dict)."""
+        self._append(",".join([_format_field(v) for v in values]) + _LINE_TERMINATOR)
+
+    def _append(self, line: str) -> None:
+        self._pending.append(line)
+        if len(self._pending) >= self.flush_every or (
+            self._next_flush_t is not None and time.monotonic() >= self._next_flush_t
+        ):
             self.flush()
 
     def flush(self) -> None:
-        if not self._buffer:
+        if not self._pending:
             return
-        self._writer.writerows(self._buffer)
-        self._buffer.clear()
+        self._file.write("".join(self._pending))
+        self._pending.clear()
         self._file.flush()
+        if self.flush_interval_s:
+            self._next_flush_t = time.monotonic() + self.flush_interval_s
 
     def close(self) -> None:
         self.flush()
+        try:
+            os.fsync(self._file.fileno())
+        except OSError:
+            pass
         self._file.close()
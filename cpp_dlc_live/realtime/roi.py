@@ -1,15 +1,38 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
 
+try:
+    from numba import njit
+except Exception:  # pragma: no cover - optional runtime fallback
+    njit = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from cpp_dlc_live.realtime.camera import CameraStream
 
 Point = Tuple[float, float]
+# Polygon bounding boxes are padded by this much (pixels). Boundary hits are within
+# sqrt(1e-9) ~ 3.2e-5 of an edge, so the pre-check never rejects a point `contains` accepts.
+_BBOX_PAD = 1e-4
+
+
+class Chamber(IntEnum):
+    """Integer chamber codes used on the realtime hot path; index into CHAMBER_NAMES for labels."""
+
+    CHAMBER1 = 0
+    CHAMBER2 = 1
+    NEUTRAL = 2
+    UNKNOWN = 3
+
+
+CHAMBER_NAMES: Tuple[str, ...] = ("chamber1", "chamber2", "neutral", "unknown")
+# Plain-int aliases: IntEnum member access is an attribute lookup per use.
+_CHAMBER1, _CHAMBER2, _NEUTRAL, _UNKNOWN = (int(c) for c in Chamber)
 
 
 @dataclass
@@ -17,9 +40,21 @@ class ROI:
     def contains(self, x: float, y: float) -> bool:
         raise NotImplementedError
 
+    def contains_batch(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Vectorized `contains` over equal-length coordinate arrays; returns a bool array."""
+        raise NotImplementedError
+
     def as_points(self) -> List[Point]:
         raise NotImplementedError
 
+    @property
+    def cv_polyline(self) -> np.ndarray:
+        """Outline as the int32 (N, 1, 2) array cv2.polylines expects; built once per ROI."""
+        polyline = getattr(self, "_cv_polyline", None)
+        if polyline is None:
+            polyline = self._cv_polyline = _as_polyline(self.as_points())
+        return polyline
+
 
 @dataclass
 class RectROI(ROI):
@@ -31,10 +66,16 @@ class RectROI(ROI):
     def __post_init__(self) -> None:
         self.x1, self.x2 = sorted((float(self.x1), float(self.x2)))
         self.y1, self.y2 = sorted((float(self.y1), float(self.y2)))
+        self._cv_polyline = _as_polyline(self.as_points())
 
     def contains(self, x: float, y: float) -> bool:
         return self.x1 <= x <= self.x2 and self.y1 <= y <= self.y2
 
+    def contains_batch(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        return (xs >= self.x1) & (xs <= self.x2) & (ys >= self.y1) & (ys <= self.y2)
+
     def as_points(self) -> List[Point]:
         return [
             (self.x1, self.y1),
@@ -52,38 +93,35 @@ class PolygonROI(ROI):
         if len(self.points) < 3:
             raise ValueError("PolygonROI requires at least 3 points")
         self.points = [(float(x), float(y)) for x, y in self.points]
-
-    @staticmethod
-    def _point_on_segment(px: float, py: float, a: Point, b: Point, eps: float = 1e-9) -> bool:
-        ax, ay = a
-        bx, by = b
-        cross = (px - ax) * (by - ay) - (py - ay) * (bx - ax)
-        if abs(cross) > eps:
-            return False
-        dot = (px - ax) * (px - bx) + (py - ay) * (py - by)
-        return dot <= eps
+        self._cv_polyline = _as_polyline(self.points)
+        # contains() runs the shared polygon classifier on this polygon alone.
+        self._vertices, self._offsets, self._bboxes = _pack_polygons([self.points])
+        self._bbox = tuple(float(v) for v in self._bboxes[0])
+        # (ax, ay, bx, by, bx - ax, by - ay) per edge, closing edge included, for contains_batch.
+        a = np.array(self.points, dtype=np.float64)
+        b = np.roll(a, -1, axis=0)
+        self._edge_array = np.hstack((a, b, b - a))
 
     def contains(self, x: float, y: float) -> bool:
-        px = float(x)
-        py = float(y)
-
-        n = len(self.points)
-        for i in range(n):
-            a = self.points[i]
-            b = self.points[(i + 1) % n]
-            if self._point_on_segment(px, py, a, b):
-                return True
-
-        inside = False
-        for i in range(n):
-            x1, y1 = self.points[i]
-            x2, y2 = self.points[(i + 1) % n]
-            intersects = ((y1 > py) != (y2 > py)) and (
-                px < (x2 - x1) * (py - y1) / ((y2 - y1) + 1e-12) + x1
-            )
-            if intersects:
-                inside = not inside
-        return inside
+        return _polygon_classifier(float(x), float(y), self._vertices, self._offsets, self._bboxes) == 0
+
+    def contains_batch(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        qx = np.asarray(xs, dtype=np.float64).ravel()
+        qy = np.asarray(ys, dtype=np.float64).ravel()
+        bx1, by1, bx2, by2 = self._bbox
+        result = (qx >= bx1) & (qx <= bx2) & (qy >= by1) & (qy <= by2)
+        cand = np.flatnonzero(result)
+        # (M, 1) candidate points against (E,) edges; same arithmetic as `contains`, evaluated for every pair.
+        px = qx[cand].reshape(-1, 1)
+        py = qy[cand].reshape(-1, 1)
+        ax, ay, bx, by, dx, dy = self._edge_array.T
+        on_edge = (np.abs((px - ax) * dy - (py - ay) * dx) <= 1e-9) & (
+            (px - ax) * (px - bx) + (py - ay) * (py - by) <= 1e-9
+        )
+        crossings = ((ay > py) != (by > py)) & (px < dx * (py - ay) / (dy + 1e-12) + ax)
+        inside = (np.count_nonzero(crossings, axis=1) % 2).astype(bool)
+        result[cand] = inside | on_edge.any(axis=1)
+        return result.reshape(np.shape(xs))
 
     def as_points(self) -> List[Point]:
         return list(self.points)
@@ -97,32 +135,78 @@ class ChamberROI:
     strategy_on_neutral: str = "off"
     roi_type: str = "polygon"
 
+    def __post_init__(self) -> None:
+        # All-polygon layouts are classified by one classifier call over packed
+        # vertices (ROIs in priority order). Rect checks are already a single
+        # comparison chain, so they stay on ROI.contains.
+        self._poly_packed: Optional[Tuple[Any, Any, Any]] = None
+        self._poly_codes: Tuple[int, ...] = ()
+        ordered: List[Tuple[int, ROI]] = [(Chamber.NEUTRAL, self.neutral)] if self.neutral is not None else []
+        ordered += [(Chamber.CHAMBER1, self.chamber1), (Chamber.CHAMBER2, self.chamber2)]
+        if not all(isinstance(roi, PolygonROI) for _, roi in ordered):
+            return
+        self._poly_packed = _pack_polygons([roi.as_points() for _, roi in ordered])
+        self._poly_codes = tuple(int(code) for code, _ in ordered)
+        # Compile (or load the cached kernel) now, not on the first realtime frame.
+        _polygon_classifier(0.0, 0.0, *self._poly_packed)
+
     def classify(self, x: float, y: float) -> str:
+        return CHAMBER_NAMES[self.classify_code(x, y)]
+
+    def classify_code(self, x: float, y: float) -> int:
+        """Like `classify`, but return the `Chamber` code as a plain int."""
+        if self._poly_packed is not None:
+            idx = _polygon_classifier(float(x), float(y), *self._poly_packed)
+            return self._poly_codes[idx] if idx >= 0 else _UNKNOWN
         if self.neutral is not None and self.neutral.contains(x, y):
-            return "neutral"
+            return _NEUTRAL
         if self.chamber1.contains(x, y):
-            return "chamber1"
+            return _CHAMBER1
         if self.chamber2.contains(x, y):
-            return "chamber2"
-        return "unknown"
-
-    def draw(self, frame: np.ndarray) -> np.ndarray:
-        out = frame.copy()
-        _draw_roi(out, self.chamber1, (0, 255, 0), "ch1")
-        _draw_roi(out, self.chamber2, (0, 128, 255), "ch2")
+            return _CHAMBER2
+        return _UNKNOWN
+
+    def classify_batch(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Classify many points at once; returns an int8 array of `Chamber` codes.
+
+        Matches `classify_code` point by point (NaN coordinates are UNKNOWN). Meant
+        for offline analysis of whole trajectories; the realtime loop classifies
+        one point per frame with `classify_code`.
+        """
+        labels = np.full(np.shape(xs), _UNKNOWN, dtype=np.int8)
+        # Lowest priority first, so higher-priority ROIs overwrite the overlap.
+        labels[self.chamber2.contains_batch(xs, ys)] = _CHAMBER2
+        labels[self.chamber1.contains_batch(xs, ys)] = _CHAMBER1
+        if self.neutral is not None:
+            labels[self.neutral.contains_batch(xs, ys)] = _NEUTRAL
+        return labels
+
+    def draw(self, frame: np.ndarray, out: Optional[np.ndarray] = None, scale: float = 1.0) -> np.ndarray:
+        """Return `frame` with ROI outlines drawn on it.
+
+        Draws into `out` (same shape/dtype as `frame`) when given, so callers can
+        reuse one buffer across frames; `out=frame` draws in place. `scale` maps
+        ROI coordinates onto a resized frame.
+        """
+        if out is None:
+            out = frame.copy()
+        elif out is not frame:
+            np.copyto(out, frame)
+        _draw_roi(out, self.chamber1, (0, 255, 0), "ch1", scale)
+        _draw_roi(out, self.chamber2, (0, 128, 255), "ch2", scale)
         if self.neutral is not None:
-            _draw_roi(out, self.neutral, (255, 255, 0), "neutral")
+            _draw_roi(out, self.neutral, (255, 255, 0), "neutral", scale)
         return out
 
     def to_dict(self) -> Dict[str, object]:
         data: Dict[str, object] = {
             "type": self.roi_type,
-            "chamber1": [[float(x), float(y)] for x, y in self.chamber1.as_points()],
-            "chamber2": [[float(x), float(y)] for x, y in self.chamber2.as_points()],
+            "chamber1": _points_to_list(self.chamber1),
+            "chamber2": _points_to_list(self.chamber2),
             "strategy_on_neutral": self.strategy_on_neutral,
         }
         if self.neutral is not None:
-            data["neutral"] = [[float(x), float(y)] for x, y in self.neutral.as_points()]
+            data["neutral"] = _points_to_list(self.neutral)
         return data
 
     @classmethod
@@ -142,6 +226,71 @@ class ChamberROI:
         )
 
 
+def _classify_polygons_py(x: float, y: float, vertices: Any, offsets: Any, bboxes: Any) -> int:
+    """Return the index of the first polygon containing (x, y), or -1.
+
+    Polygon k owns `vertices[offsets[k]:offsets[k + 1]]` and is skipped when the
+    point falls outside `bboxes[k]` (see `_pack_polygons`). Boundary points count
+    as inside. This is the only scalar point-in-polygon test; PolygonROI.contains
+    and ChamberROI.classify_code both call it through `_polygon_classifier`.
+    """
+    for k in range(len(offsets) - 1):
+        box = bboxes[k]
+        if not (box[0] <= x <= box[2] and box[1] <= y <= box[3]):
+            continue
+        start = offsets[k]
+        n = offsets[k + 1] - start
+        # One pass over the edges: a boundary hit returns at once, otherwise the
+        # ray-cast parity is the same as scanning all edges for the boundary first.
+        hit = False
+        for i in range(n):
+            a = vertices[start + i]
+            b = vertices[start + (i + 1) % n]
+            ax = a[0]
+            ay = a[1]
+            bx = b[0]
+            by = b[1]
+            dx = bx - ax
+            dy = by - ay
+            if abs((x - ax) * dy - (y - ay) * dx) <= 1e-9 and (x - ax) * (x - bx) + (y - ay) * (y - by) <= 1e-9:
+                return k
+            if ((ay > y) != (by > y)) and x < dx * (y - ay) / (dy + 1e-12) + ax:
+                hit = not hit
+        if hit:
+            return k
+    return -1
+
+
+_classify_polygons = njit(cache=True)(_classify_polygons_py) if njit is not None else None
+_polygon_classifier = _classify_polygons if _classify_polygons is not None else _classify_polygons_py
+
+
+def _pack_polygons(polygons: Sequence[Sequence[Point]]) -> Tuple[Any, Any, Any]:
+    """Pack polygons into the (vertices, offsets, bboxes) layout `_classify_polygons_py` reads.
+
+    Bounding boxes are padded by _BBOX_PAD. Returns numpy arrays for the compiled
+    kernel and plain tuples for the pure-Python one, where tuple indexing is much
+    cheaper than numpy scalar indexing.
+    """
+    vertices: List[Point] = []
+    offsets = [0]
+    bboxes: List[Tuple[float, float, float, float]] = []
+    for poly in polygons:
+        pts = [(float(x), float(y)) for x, y in poly]
+        vertices.extend(pts)
+        offsets.append(len(vertices))
+        xs = [x for x, _ in pts]
+        ys = [y for _, y in pts]
+        bboxes.append((min(xs) - _BBOX_PAD, min(ys) - _BBOX_PAD, max(xs) + _BBOX_PAD, max(ys) + _BBOX_PAD))
+    if _classify_polygons is None:
+        return tuple(vertices), tuple(offsets), tuple(bboxes)
+    return (
+        np.array(vertices, dtype=np.float64),
+        np.array(offsets, dtype=np.int64),
+        np.array(bboxes, dtype=np.float64),
+    )
+
+
 def _build_roi(raw_points: object, roi_type: str) -> ROI:
     if raw_points is None:
         raise ValueError("ROI points are required")
@@ -178,13 +327,43 @@ def _as_points(raw_points: object) -> List[Point]:
     return points
 
 
-def _draw_roi(frame: np.ndarray, roi: ROI, color: Tuple[int, int, int], label: str) -> None:
-    pts = np.array(roi.as_points(), dtype=np.int32).reshape((-1, 1, 2))
+def _points_to_list(roi: ROI) -> List[List[float]]:
+    return np.asarray(roi.as_points(), dtype=np.float64).tolist()
+
+
+def _as_polyline(points: Sequence[Point]) -> np.ndarray:
+    return np.array(points, dtype=np.int32).reshape((-1, 1, 2))
+
+
+def _draw_roi(frame: np.ndarray, roi: ROI, color: Tuple[int, int, int], label: str, scale: float = 1.0) -> None:
+    if scale == 1.0:
+        # Cached on the ROI; drawing at full size is the per-frame case.
+        pts = roi.cv_polyline
+    else:
+        pts = _as_polyline([(x * scale, y * scale) for x, y in roi.as_points()])
     cv2.polylines(frame, [pts], isClosed=True, color=color, thickness=2)
     x0, y0 = pts[0, 0, 0], pts[0, 0, 1]
     cv2.putText(frame, label, (int(x0), int(y0) - 6), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
 
 
+def _completed_outlines(
+    points_by_roi: Dict[str, List[Tuple[int, int]]]
+) -> Tuple[List[np.ndarray], List[Tuple[str, Tuple[int, int]]]]:
+    contours = [_as_polyline(pts) for pts in points_by_roi.values()]
+    labels = [(name, (int(c[0, 0, 0]), int(c[0, 0, 1]) - 6)) for name, c in zip(points_by_roi, contours)]
+    return contours, labels
+
+
+def _draw_completed_outlines(
+    canvas: np.ndarray, contours: List[np.ndarray], labels: List[Tuple[str, Tuple[int, int]]]
+) -> None:
+    # One polylines call for every finished ROI, then their labels on top.
+    if contours:
+        cv2.polylines(canvas, contours, True, (0, 255, 0), 2)
+    for name, org in labels:
+        cv2.putText(canvas, name, org, cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+
+
 def calibrate_roi_with_frame(frame: np.ndarray, with_neutral: bool = True) -> Dict[str, List[List[int]]]:
     names = ["chamber1", "chamber2"] + (["neutral"] if with_neutral else [])
     points_by_roi: Dict[str, List[Tuple[int, int]]] = {}
@@ -200,41 +379,44 @@ def calibrate_roi_with_frame(frame: np.ndarray, with_neutral: bool = True) -> Di
     cv2.namedWindow(win, cv2.WINDOW_NORMAL)
     cv2.setMouseCallback(win, on_mouse)
 
+    # The frame is static, so the canvas is redrawn only when clicks/keys changed the state.
+    canvas = np.empty_like(frame)
+    drawn_state: Optional[Tuple[int, Tuple[Tuple[int, int], ...]]] = None
     while True:
-        canvas = frame.copy()
+        state = (current_idx, tuple(current_points))
+        if state != drawn_state:
+            drawn_state = state
+            np.copyto(canvas, frame)
 
-        for name, pts in points_by_roi.items():
-            arr = np.array(pts, dtype=np.int32).reshape((-1, 1, 2))
-            cv2.polylines(canvas, [arr], True, (0, 255, 0), 2)
-            cv2.putText(canvas, name, (arr[0, 0, 0], arr[0, 0, 1] - 6), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-
-        if current_idx < len(names):
-            if len(current_points) > 1:
-                arr = np.array(current_points, dtype=np.int32).reshape((-1, 1, 2))
-                cv2.polylines(canvas, [arr], False, (0, 0, 255), 2)
-            for x, y in current_points:
-                cv2.circle(canvas, (x, y), 3, (0, 0, 255), -1)
-            cv2.putText(
-                canvas,
-                f"ROI: {names[current_idx]} | click:add u:undo r:reset n:next s:save q:quit",
-                (10, 25),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.6,
-                (255, 255, 255),
-                2,
-            )
-        else:
-            cv2.putText(
-                canvas,
-                "All ROI done | s:save q:quit",
-                (10, 25),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.7,
-                (255, 255, 255),
-                2,
-            )
+            _draw_completed_outlines(canvas, *_completed_outlines(points_by_roi))
 
-        cv2.imshow(win, canvas)
+            if current_idx < len(names):
+                if len(current_points) > 1:
+                    arr = np.array(current_points, dtype=np.int32).reshape((-1, 1, 2))
+                    cv2.polylines(canvas, [arr], False, (0, 0, 255), 2)
+                for x, y in current_points:
+                    cv2.circle(canvas, (x, y), 3, (0, 0, 255), -1)
+                cv2.putText(
+                    canvas,
+                    f"ROI: {names[current_idx]} | click:add u:undo r:reset n:next s:save q:quit",
+                    (10, 25),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.6,
+                    (255, 255, 255),
+                    2,
+                )
+            else:
+                cv2.putText(
+                    canvas,
+                    "All ROI done | s:save q:quit",
+                    (10, 25),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.7,
+                    (255, 255, 255),
+                    2,
+                )
+
+            cv2.imshow(win, canvas)
         key = cv2.waitKey(20) & 0xFF
 
         if key in (ord("q"), 27):
@@ -295,6 +477,8 @@ def calibrate_roi_with_camera(
     cv2.namedWindow(win, cv2.WINDOW_NORMAL)
     cv2.setMouseCallback(win, on_mouse)
 
+    done_contours: List[np.ndarray] = []
+    done_labels: List[Tuple[str, Tuple[int, int]]] = []
     while True:
         ok, frame = camera.read()
         if not ok or frame is None:
@@ -302,10 +486,10 @@ def calibrate_roi_with_camera(
             raise RuntimeError("Failed to read camera frame during ROI calibration")
         canvas = frame.copy()
 
-        for name, pts in points_by_roi.items():
-            arr = np.array(pts, dtype=np.int32).reshape((-1, 1, 2))
-            cv2.polylines(canvas, [arr], True, (0, 255, 0), 2)
-            cv2.putText(canvas, name, (arr[0, 0, 0], arr[0, 0, 1] - 6), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+        # Finished ROIs never change, so their outlines are rebuilt only when one is added.
+        if len(done_labels) != len(points_by_roi):
+            done_contours, done_labels = _completed_outlines(points_by_roi)
+        _draw_completed_outlines(canvas, done_contours, done_labels)
 
         if current_idx < len(names):
             if len(current_points) > 1:
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+
+@dataclass
+class RollingMeanXY:
+    """Moving average of the last `window` (x, y) points with O(1) updates.
+
+    Running sums are adjusted as points enter and leave a fixed ring buffer, so
+    each update is a few float operations regardless of window size. Sums are
+    recomputed exactly (math.fsum) from the buffer every `resum_every` updates
+    to bound drift.
+    """
+
+    window: int
+    resum_every: int = 10000
+    _xs: List[float] = field(init=False, repr=False)
+    _ys: List[float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.window < 1:
+            raise ValueError("window must be >= 1")
+        self._xs = [0.0] * self.window
+        self._ys = [0.0] * self.window
+        self._next = 0
+        self._count = 0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def update(self, x: float, y: float) -> Tuple[float, float]:
+        """Add a point and return the mean of the current window."""
+        i = self._next
+        if self._count == self.window:
+            self._sum_x -= self._xs[i]
+            self._sum_y -= self._ys[i]
+        else:
+            self._count += 1
+        self._xs[i] = x
+        self._ys[i] = y
+        self._sum_x += x
+        self._sum_y += y
+        self._next = i + 1 if i + 1 < self.window else 0
+
+        self._updates += 1
+        if self._updates >= self.resum_every:
+            self._updates = 0
+            # Unfilled slots hold 0.0, so the whole buffer can be summed either way.
+            self._sum_x = math.fsum(self._xs)
+            self._sum_y = math.fsum(self._ys)
+
+        n = self._count
+        return self._sum_x / n, self._sum_y / n
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# hwaccel name -> (ffmpeg args before `-i`, encoder args after it)
+HW_ENCODERS: Dict[str, Tuple[List[str], List[str]]] = {
+    "nvenc": ([], ["-c:v", "h264_nvenc", "-preset", "p1", "-tune", "ll", "-pix_fmt", "yuv420p"]),
+    "vaapi": (
+        ["-vaapi_device", "/dev/dri/renderD128"],
+        ["-vf", "format=nv12,hwupload", "-c:v", "h264_vaapi"],
+    ),
+    "videotoolbox": ([], ["-c:v", "h264_videotoolbox", "-realtime", "1", "-pix_fmt", "yuv420p"]),
+}
+_HW_PROBE_CACHE: Dict[Tuple[str, str], bool] = {}
+
+FrameRenderer = Callable[..., np.ndarray]
+
+
+class AsyncVideoWriter:
+    """Run `cv2.VideoWriter.write` on a background thread.
+
+    `write()` copies the frame into one of `queue_size` writer-owned buffers and
+    returns, so encoding overlaps the realtime loop and callers may reuse their
+    frame immediately. Frames are written in order and never dropped: when every
+    buffer is still waiting to be encoded, `write()` blocks. An error raised by
+    the encoder thread is re-raised from the next `write()` or from `release()`.
+
+    `write(frame, render=...)` also moves overlay drawing onto the encoder
+    thread: `render(frame=copy)` is called there with the writer-owned copy
+    (which it may draw on in place) and its result is encoded instead.
+    """
+
+    def __init__(self, writer: Any, queue_size: int = 4, name: str = "cpp_dlc_live-encoder"):
+        self.writer = writer
+        self.queue_size = max(1, int(queue_size))
+        self._free: "queue.Queue[np.ndarray]" = queue.Queue()
+        self._pending: "queue.Queue[Optional[Tuple[np.ndarray, Optional[FrameRenderer]]]]" = queue.Queue()
+        self._allocated = 0
+        self._error: Optional[BaseException] = None
+        self._released = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def isOpened(self) -> bool:
+        return bool(self.writer.isOpened())
+
+    def write(self, frame: np.ndarray, render: Optional[FrameRenderer] = None) -> None:
+        self._raise_error()
+        buf = self._acquire()
+        if buf is None or buf.shape != frame.shape or buf.dtype != frame.dtype:
+            buf = np.empty_like(frame)
+        np.copyto(buf, frame)
+        self._pending.put((buf, render))
+
+    def release(self) -> None:
+        """Write all queued frames, stop the thread and release the wrapped writer."""
+        if self._released:
+            return
+        self._released = True
+        self._pending.put(None)
+        self._thread.join()
+        self.writer.release()
+        self._raise_error()
+
+    def _acquire(self) -> Optional[np.ndarray]:
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            pass
+        if self._allocated < self.queue_size:
+            self._allocated += 1
+            return None
+        return self._free.get()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            buf, render = item
+            if self._error is None:
+                try:
+                    self.writer.write(render(frame=buf) if render is not None else buf)
+                except BaseException as exc:
+                    self._error = exc
+            # Recycle even after a failure so write() never waits on a dead encoder.
+            self._free.put(buf)
+
+
+class FFmpegPipeWriter:
+    """`cv2.VideoWriter`-compatible writer that pipes raw BGR frames into an ffmpeg encoder.
+
+    Used for hardware H.264 encoders (see `HW_ENCODERS`), so encoding runs on the
+    GPU/media engine instead of the CPU. `isOpened()` is false when ffmpeg could
+    not be started; `release()` raises if ffmpeg exits with an error.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fps: float,
+        frame_size: Tuple[int, int],
+        hwaccel: str,
+        ffmpeg_bin: str = "ffmpeg",
+    ):
+        self.path = Path(path)
+        self.hwaccel = hwaccel
+        input_args, output_args = HW_ENCODERS[hwaccel]
+        w, h = int(frame_size[0]), int(frame_size[1])
+        cmd = [
+            ffmpeg_bin, "-hide_banner", "-loglevel", "error", "-y",
+            *input_args,
+            "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{w}x{h}", "-r", f"{float(fps)}",
+            "-i", "pipe:0",
+            *output_args,
+            str(self.path),
+        ]
+        try:
+            self._proc: Optional[subprocess.Popen] = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            self._proc = None
+
+    def isOpened(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def write(self, frame: np.ndarray) -> None:
+        if self._proc is None or self._proc.stdin is None:
+            raise RuntimeError(f"ffmpeg writer for {self.path} is not open")
+        self._proc.stdin.write(memoryview(np.ascontiguousarray(frame)))
+
+    def release(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        if proc.stdin is not None:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+        returncode = proc.wait()
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg ({self.hwaccel}) exited with code {returncode} while writing {self.path}")
+
+
+def resolve_hw_encoder(hwaccel: Any, ffmpeg_bin: str = "ffmpeg") -> Optional[str]:
+    """Return a usable `HW_ENCODERS` key for the `hwaccel` setting, or None for software encoding.
+
+    `auto` tries the platform's encoders in order; an explicit name is used only
+    if it passes the probe. Each probe encodes a single synthetic frame with
+    ffmpeg and is cached per process, so call this during setup, not per frame.
+    """
+    name = str(hwaccel or "off").strip().lower()
+    if name in ("", "off", "none", "false"):
+        return None
+    if name == "auto":
+        candidates = ["videotoolbox"] if sys.platform == "darwin" else ["nvenc", "vaapi"]
+    elif name in HW_ENCODERS:
+        candidates = [name]
+    else:
+        return None
+    if shutil.which(ffmpeg_bin) is None:
+        return None
+    for candidate in candidates:
+        if _probe_hw_encoder(candidate, ffmpeg_bin):
+            return candidate
+    return None
+
+
+def _probe_hw_encoder(hwaccel: str, ffmpeg_bin: str) -> bool:
+    key = (ffmpeg_bin, hwaccel)
+    if key not in _HW_PROBE_CACHE:
+        input_args, output_args = HW_ENCODERS[hwaccel]
+        cmd = [
+            ffmpeg_bin, "-hide_banner", "-loglevel", "error",
+            *input_args,
+            "-f", "lavfi", "-i", "color=c=black:s=256x256:r=1",
+            "-frames:v", "1",
+            *output_args,
+            "-f", "null", "-",
+        ]
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10.0)
+            _HW_PROBE_CACHE[key] = result.returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            _HW_PROBE_CACHE[key] = False
+    return _HW_PROBE_CACHE[key]
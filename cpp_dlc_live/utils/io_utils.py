@@ -1,18 +1,41 @@
 from __future__ import annotations
 
+import copy
 import hashlib
-import json
+import importlib.util
+import os
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 
+from cpp_dlc_live.utils.json_utils import json_dumps_indented
 from cpp_dlc_live.utils.session_prompt import normalize_laser_on_chambers
 from cpp_dlc_live.utils.time_utils import make_session_id
 
+# libyaml's C loader/dumper when PyYAML was built with it (~10x faster); same output either way.
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# pandas imports pyarrow itself when writing Parquet; only probe for it here so
+# importing this module (and the CLI) stays cheap.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
 PathLike = Union[str, Path]
 
+_YAML_CACHE_MAX_ENTRIES = 100
+# Parsed YAML keyed by (resolved path, mtime_ns, size); values are never handed out directly.
+_YAML_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_SHA256_CACHE_MAX_ENTRIES = 256
+# Hex digests keyed the same way as _YAML_CACHE.
+_SHA256_CACHE: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+
 
 def ensure_dir(path: PathLike) -> Path:
     out = Path(path)
@@ -21,29 +44,96 @@ def ensure_dir(path: PathLike) -> Path:
 
 
 def load_yaml(path: PathLike) -> Dict[str, Any]:
-    with Path(path).open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    """Load a YAML mapping, reusing the parsed result while the file is unchanged.
+
+    Callers always receive a deep copy, so mutating the returned dict never
+    leaks into later loads of the same file.
+    """
+    p = Path(path)
+    st = p.stat()
+    key = (str(p.resolve()), st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    with p.open("r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader) or {}
     if not isinstance(data, dict):
         raise ValueError(f"YAML root must be mapping: {path}")
-    return data
+
+    _YAML_CACHE[key] = data
+    while len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+def _clear_yaml_cache() -> None:
+    _YAML_CACHE.clear()
+
+
+load_yaml.cache_clear = _clear_yaml_cache  # type: ignore[attr-defined]
 
 
 def save_yaml(data: Dict[str, Any], path: PathLike) -> None:
     with Path(path).open("w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+        yaml.dump(data, f, Dumper=_YamlDumper, sort_keys=False, allow_unicode=True)
 
 
 def save_json(data: Dict[str, Any], path: PathLike) -> None:
-    with Path(path).open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    Path(path).write_bytes(json_dumps_indented(data))
+
+
+def save_parquet_if_available(df: Any, path: PathLike) -> Optional[Path]:
+    """Write a zstd-compressed Parquet copy of `df` when pyarrow is installed.
+
+    Returns the written path, or None when Parquet output is unavailable.
+    """
+    if not _HAS_PYARROW:
+        return None
+    out = Path(path)
+    df.to_parquet(out, index=False, compression="zstd")
+    return out
 
 
 def file_sha256(path: PathLike) -> str:
-    h = hashlib.sha256()
-    with Path(path).open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    """Return the SHA-256 hex digest of a file, memoized while it is unchanged."""
+    p = Path(path)
+    st = p.stat()
+    key = (str(p.resolve()), st.st_mtime_ns, st.st_size)
+    cached = _SHA256_CACHE.get(key)
+    if cached is not None:
+        _SHA256_CACHE.move_to_end(key)
+        return cached
+
+    with p.open("rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            # Whole-file sequential read: let the kernel read ahead aggressively.
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: hashing loop runs in C
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        else:
+            h = hashlib.sha256()
+            # One reused 1 MiB buffer instead of a new bytes object per chunk.
+            buf = memoryview(bytearray(1024 * 1024))
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                h.update(buf[:n])
+            digest = h.hexdigest()
+
+    _SHA256_CACHE[key] = digest
+    while len(_SHA256_CACHE) > _SHA256_CACHE_MAX_ENTRIES:
+        _SHA256_CACHE.popitem(last=False)
+    return digest
+
+
+def _clear_sha256_cache() -> None:
+    _SHA256_CACHE.clear()
+
+
+file_sha256.cache_clear = _clear_sha256_cache  # type: ignore[attr-defined]
 
 
 def prepare_session_dir(config: Dict[str, Any], out_dir_override: Optional[str] = None) -> Path:
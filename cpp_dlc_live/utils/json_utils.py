@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Union
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional runtime fallback
+    orjson = None  # type: ignore[assignment]
+
+# Both orjson.JSONDecodeError and json.JSONDecodeError derive from this.
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse one JSON document, using orjson when it is installed.
+
+    Documents orjson rejects are retried with the stdlib, which also accepts the
+    `NaN`/`Infinity` literals that `json.dumps` writes (e.g. older issue logs).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def json_dumps_sorted(obj: Any) -> str:
+    """Serialize `obj` compactly with sorted keys, using orjson when it is installed.
+
+    Output uses `,`/`:` separators and keeps non-ASCII text. Non-finite floats
+    are written as `null` before either serializer sees them, so the text does
+    not depend on whether orjson is installed. Values orjson refuses (e.g.
+    integers beyond 64 bits) fall back to the stdlib.
+    """
+    obj = _finite_or_none(obj)
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize `obj` to compact UTF-8 JSON bytes, using orjson when it is installed.
+
+    Non-finite floats are written as `null` on both paths, so the output does not
+    depend on whether orjson is installed. numpy scalars are accepted on the
+    orjson path; values orjson refuses fall back to the stdlib.
+    """
+    obj = _finite_or_none(obj)
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_dumps_indented(obj: Any) -> bytes:
+    """Serialize `obj` as 2-space indented UTF-8 JSON bytes, using orjson when it is installed.
+
+    Layout matches `json.dump(..., indent=2, ensure_ascii=False)`. Non-finite
+    floats are written as `null` on both paths, so the output does not depend on
+    whether orjson is installed. The orjson path also accepts numpy values;
+    values orjson refuses fall back to the stdlib.
+    """
+    obj = _finite_or_none(obj)
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _finite_or_none(value: Any) -> Any:
+    """Return `value` with NaN/Infinity floats inside dicts and lists replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite_or_none(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(v) for v in value]
+    return value
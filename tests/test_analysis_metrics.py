@@ -1,6 +1,14 @@
+import numpy as np
 import pandas as pd
+import pytest
 
-from cpp_dlc_live.analysis.metrics import compute_summary
+from cpp_dlc_live.analysis import metrics
+from cpp_dlc_live.analysis.metrics import (
+    AnalysisView,
+    compute_speed_series,
+    compute_summary,
+    compute_summary_streaming,
+)
 
 
 def test_compute_summary_basic() -> None:
@@ -67,3 +75,91 @@ def test_compute_summary_maps_unknown_to_neutral() -> None:
     assert summary["time_ch1_s"] == 1.0
     assert summary["time_ch2_s"] == 0.0
     assert summary["time_neutral_s"] == 1.0
+
+
+def test_precomputed_step_distance_matches_default() -> None:
+    df = pd.DataFrame(
+        {
+            "t_wall": [0.0, 1.0, 2.0, 3.0],
+            "x": [0.0, 3.0, np.nan, 3.0],
+            "y": [0.0, 4.0, 4.0, 8.0],
+            "chamber": ["chamber1", "chamber1", "chamber2", "neutral"],
+            "laser_state": [0, 1, 1, 0],
+        }
+    )
+
+    step_dist = AnalysisView.from_frame(df).step_distance()
+    assert step_dist.shape == (3,)
+    assert step_dist[0] == 5.0
+
+    assert compute_summary(df, step_dist=step_dist) == compute_summary(df)
+    pd.testing.assert_frame_equal(
+        compute_speed_series(df, step_dist=step_dist),
+        compute_speed_series(df),
+    )
+
+
+def test_compute_summary_streaming_matches_in_memory() -> None:
+    df = pd.DataFrame(
+        {
+            "t_wall": [0.0, 1.0, 2.5, np.nan, 4.0, 3.5, 5.0],
+            "x": [0.0, 3.0, 3.0, 6.0, np.nan, 6.0, 9.0],
+            "y": [0.0, 4.0, 4.0, 8.0, 8.0, 8.0, 12.0],
+            "chamber": ["chamber1", "chamber1", "unknown", "chamber2", "chamber2", "neutral", "chamber1"],
+            "laser_state": [1, 1, 0, 0, 1, 0, 1],
+        }
+    )
+
+    for fixed_fps_hz in (None, 4.0):
+        expected = compute_summary(df, cm_per_px=0.5, fixed_fps_hz=fixed_fps_hz)
+        for chunk_rows in (1, 2, 3, len(df)):
+            chunks = (df.iloc[i : i + chunk_rows] for i in range(0, len(df), chunk_rows))
+            got = compute_summary_streaming(chunks, cm_per_px=0.5, fixed_fps_hz=fixed_fps_hz)
+            assert got.keys() == expected.keys()
+            for key, value in expected.items():
+                assert np.isclose(got[key], value), (fixed_fps_hz, chunk_rows, key)
+
+
+def test_fused_summary_kernel_matches_numpy_path(monkeypatch) -> None:
+    df = pd.DataFrame(
+        {
+            "t_wall": [0.0, 0.5, 0.4, np.nan, 2.0, 2.5],
+            "x": [0.0, 3.0, 3.0, np.nan, 6.0, 6.0],
+            "y": [0.0, 4.0, 4.0, 4.0, 8.0, 9.0],
+            "chamber": ["chamber2", "chamber1", "netural", "chamber2", "bad", "chamber1"],
+            "laser_state": [1, 0, 1, np.nan, 1, 1],
+        }
+    )
+
+    for fixed_fps_hz in (None, 5.0):
+        monkeypatch.setattr(metrics, "_summary_kernel", None)
+        expected = compute_summary(df, cm_per_px=2.0, fixed_fps_hz=fixed_fps_hz)
+        # Exercise the pure-Python kernel so the fused path is covered without numba installed.
+        monkeypatch.setattr(metrics, "_summary_kernel", metrics._summary_kernel_py)
+        got = compute_summary(df, cm_per_px=2.0, fixed_fps_hz=fixed_fps_hz)
+        for key, value in expected.items():
+            assert np.isclose(got[key], value), (fixed_fps_hz, key)
+
+
+def test_compiled_summary_kernel_matches_numpy_path(monkeypatch) -> None:
+    pytest.importorskip("numba")
+    assert metrics._summary_kernel is not metrics._summary_kernel_py
+    df = pd.DataFrame(
+        {
+            "t_wall": [0.0, 0.5, 0.4, np.nan, 2.0, 2.5, 3.0],
+            "x": [0.0, 3.0, 3.0, np.nan, 6.0, 6.0, 7.0],
+            "y": [0.0, 4.0, 4.0, 4.0, 8.0, 9.0, 9.0],
+            "chamber": ["chamber2", "chamber1", "netural", "chamber2", "bad", "chamber1", "neutral"],
+            "laser_state": [1, 0, 1, np.nan, 1, 1, 0],
+        }
+    )
+    step_dist = np.array([1.0, 2.0, np.nan, 4.0, 5.0, 6.0])
+
+    for fixed_fps_hz in (None, 5.0):
+        for dist in (None, step_dist):
+            got = compute_summary(df, cm_per_px=2.0, fixed_fps_hz=fixed_fps_hz, step_dist=dist)
+            with monkeypatch.context() as m:
+                m.setattr(metrics, "_summary_kernel", None)
+                expected = compute_summary(df, cm_per_px=2.0, fixed_fps_hz=fixed_fps_hz, step_dist=dist)
+            for key, value in expected.items():
+                assert np.isclose(got[key], value, equal_nan=True), (fixed_fps_hz, dist is None, key)
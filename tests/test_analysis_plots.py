@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import json
 
+import numpy as np
 import pandas as pd
 
 from cpp_dlc_live.analysis.analyze import analyze_session
-from cpp_dlc_live.analysis.plots import _resolve_spatial_limits
+from cpp_dlc_live.analysis.plots import _peak_preserving_indices, _resolve_spatial_limits, _stride_indices
 
 
 def test_analyze_session_generates_figure1_to_5_with_prefix(tmp_path) -> None:
@@ -84,3 +85,20 @@ def test_analyze_session_time_range_outputs_to_subdir(tmp_path) -> None:
     assert summary_path.parent.name == "analysis_range_2s_to_5s"
     assert summary_path.exists()
     assert (summary_path.parent / f"{prefix}_occupancy_over_time.png").exists()
+
+
+def test_plot_downsampling_keeps_endpoints_and_peaks() -> None:
+    idx = _stride_indices(25_001, max_points=1_000)
+    assert idx[0] == 0
+    assert idx[-1] == 25_000
+    assert len(idx) <= 1_001
+
+    values = np.zeros(50_000)
+    values[12_345] = 99.0
+    values[40_000] = -5.0
+    values[:10] = np.nan
+    keep = _peak_preserving_indices(values, max_points=1_000)
+    assert len(keep) <= 1_000
+    assert 12_345 in keep
+    assert 40_000 in keep
+    assert np.all(np.diff(keep) > 0)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from argparse import Namespace
+from pathlib import Path
 
 import pandas as pd
 
@@ -58,3 +59,28 @@ def test_cmd_analyze_batch_writes_report(tmp_path) -> None:
     report = pd.read_csv(tmp_path / "batch_analysis_report.csv")
     assert len(report) == 2
     assert set(report["status"]) == {"ok"}
+
+
+def test_cmd_analyze_batch_parallel_workers_keep_order(tmp_path) -> None:
+    names = ["session_a", "session_b", "session_c"]
+    for name in names:
+        (tmp_path / name).mkdir()
+        _write_minimal_log(tmp_path / name / "cpp_realtime_log.csv")
+
+    args = Namespace(
+        root_dir=str(tmp_path),
+        recursive=False,
+        cm_per_px=None,
+        fixed_fps=None,
+        fixed_fps_hz=None,
+        no_plots=True,
+        include_issues=False,
+        fail_fast=False,
+        workers=2,
+        report_name="batch_analysis_report.csv",
+    )
+    _cmd_analyze_batch(args)
+
+    report = pd.read_csv(tmp_path / "batch_analysis_report.csv")
+    assert [Path(p).name for p in report["session_dir"]] == names
+    assert set(report["status"]) == {"ok"}
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+import pytest
+
+from cpp_dlc_live.realtime.camera import CameraConfig, CameraStream
+
+
+def _write_video(path, frames: int = 6, width: int = 32, height: int = 24) -> None:
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 20.0, (width, height))
+    if not writer.isOpened():
+        pytest.skip("OpenCV video writer is unavailable in test environment")
+    for i in range(frames):
+        writer.write(np.full((height, width, 3), 30 * i, dtype=np.uint8))
+    writer.release()
+
+
+@pytest.mark.parametrize("flip,rotate_deg", [(False, 0), (True, 90), (True, 30)])
+def test_camera_frame_pool_reuses_buffers_without_changing_frames(tmp_path, flip, rotate_deg) -> None:
+    path = tmp_path / "in.avi"
+    _write_video(path)
+
+    def read_all(pool_size: int) -> list:
+        camera = CameraStream(
+            CameraConfig(source=str(path), file_realtime_throttle=False, flip=flip, rotate_deg=rotate_deg)
+        )
+        camera.set_frame_pool(pool_size)
+        frames = []
+        try:
+            while True:
+                ok, frame = camera.read()
+                if not ok:
+                    return frames
+                frames.append((frame, frame.copy()))
+        finally:
+            camera.release()
+
+    plain = read_all(0)
+    pooled = read_all(2)
+    assert len(pooled) == len(plain) == 6
+    assert pooled[2][0] is pooled[0][0]
+    for (_, expected), (_, got) in zip(plain, pooled):
+        assert np.array_equal(got, expected)
+
+
+@pytest.mark.parametrize("flip", [False, True])
+@pytest.mark.parametrize("rotate_deg", [30, 180, 270])
+def test_camera_flip_and_rotation_match_two_pass_reference(tmp_path, flip, rotate_deg) -> None:
+    path = tmp_path / "in.avi"
+    _write_video(path, frames=2, width=64, height=48)
+    camera = CameraStream(CameraConfig(source=str(path), file_realtime_throttle=False, flip=flip, rotate_deg=rotate_deg))
+    raw = cv2.VideoCapture(str(path))
+    codes = {180: cv2.ROTATE_180, 270: cv2.ROTATE_90_COUNTERCLOCKWISE}
+    try:
+        for _ in range(2):
+            ok, frame = camera.read()
+            ok_raw, raw_frame = raw.read()
+            assert ok and ok_raw
+            expected = cv2.flip(raw_frame, 1) if flip else raw_frame
+            if rotate_deg in codes:
+                expected = cv2.rotate(expected, codes[rotate_deg])
+            else:
+                m = cv2.getRotationMatrix2D((32, 24), rotate_deg, 1.0)
+                expected = cv2.warpAffine(expected, m, (64, 48))
+            assert frame.shape == expected.shape
+            assert int(cv2.absdiff(frame, expected).max()) <= (0 if rotate_deg in codes else 8)
+    finally:
+        raw.release()
+        camera.release()
+
+
+def test_camera_rejects_unknown_backend(tmp_path) -> None:
+    path = tmp_path / "in.avi"
+    _write_video(path, frames=1, width=32, height=24)
+    with pytest.raises(ValueError, match="camera.backend"):
+        CameraStream(CameraConfig(source=str(path), backend="nope"))
+
+
+def test_camera_opens_file_with_explicit_backend(tmp_path) -> None:
+    path = tmp_path / "in.avi"
+    _write_video(path, frames=2, width=32, height=24)
+    camera = CameraStream(CameraConfig(source=str(path), file_realtime_throttle=False, backend="ffmpeg", hw_decode=True))
+    try:
+        ok, frame = camera.read()
+        assert ok and frame.shape == (24, 32, 3)
+    finally:
+        camera.release()
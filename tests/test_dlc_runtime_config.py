@@ -2,9 +2,16 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import yaml
 
-from cpp_dlc_live.realtime.dlc_runtime import _extract_bodyparts, _load_model_cfg
+from cpp_dlc_live.realtime.dlc_runtime import (
+    _extract_bodyparts,
+    _extract_keypoints,
+    _load_model_cfg,
+    _resolve_bodypart_rows,
+    _select_bodypart,
+)
 
 
 def test_extract_bodyparts_reads_dlc3_metadata_bodyparts() -> None:
@@ -30,3 +37,18 @@ def test_load_model_cfg_reads_pytorch_config_next_to_pt(tmp_path: Path) -> None:
 
     cfg = _load_model_cfg(str(model_pt))
     assert _extract_bodyparts(cfg) == ["head", "tail", "center"]
+
+
+def test_resolve_bodypart_rows_handles_direct_midpoint_and_fallback() -> None:
+    assert _resolve_bodypart_rows(["nose", "center"], " center ") == ((1,), "center")
+    assert _resolve_bodypart_rows(["tailbase", "ear", "nose"], "center") == ((2, 0), "nose_tailbase_midpoint")
+    assert _resolve_bodypart_rows(["ear"], "tail") == ((0,), "ear")
+    assert _resolve_bodypart_rows([], "tail") == ((0,), "index0")
+
+
+def test_select_bodypart_midpoint_and_keypoints() -> None:
+    pose = np.array([[10.0, 20.0, 0.9], [30.0, 40.0, 0.5], [1.0, 2.0, 0.1]], dtype=np.float32)
+    assert _select_bodypart(pose, ["nose", "tailbase"], "center") == (20.0, 30.0, 0.5, "nose_tailbase_midpoint")
+    keypoints = _extract_keypoints(pose, ["nose", "tailbase"])
+    assert list(keypoints) == ["nose", "tailbase", "kp2"]
+    assert keypoints["kp2"] == (1.0, 2.0, float(np.float32(0.1)))
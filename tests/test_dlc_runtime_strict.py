@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from cpp_dlc_live.realtime import dlc_runtime
-from cpp_dlc_live.realtime.dlc_runtime import MockDLCRuntime, PoseResult, build_runtime
+from cpp_dlc_live.realtime.dlc_runtime import MockDLCRuntime, PoseCacheRuntime, PoseResult, build_runtime
 
 
 class _DummyRuntime:
@@ -69,3 +70,75 @@ def test_build_runtime_strict_success(monkeypatch: pytest.MonkeyPatch, tmp_path:
     monkeypatch.setattr(dlc_runtime, "DLCLiveRuntime", _ok)
     runtime = build_runtime({"model_path": str(model_path), "strict_runtime": True})
     assert isinstance(runtime, _DummyRuntime)
+
+
+class _CountingRuntime:
+    def __init__(self):
+        self.calls = 0
+
+    def infer(self, frame):
+        self.calls += 1
+        return PoseResult(x=float(self.calls), y=0.0, p=1.0, bodypart="center", keypoints={})
+
+    def model_info(self):
+        return {"runtime": "counting"}
+
+
+def test_pose_cache_reuses_pose_for_duplicate_frames_up_to_max_reuse() -> None:
+    inner = _CountingRuntime()
+    runtime = PoseCacheRuntime(inner, threshold=1.0, max_reuse=2)
+    frame = np.full((120, 160, 3), 80, dtype=np.uint8)
+
+    poses = [runtime.infer(frame) for _ in range(4)]
+    assert inner.calls == 2
+    assert [p.x for p in poses] == [1.0, 1.0, 1.0, 2.0]
+
+    changed = frame.copy()
+    changed[:60] = 200
+    assert runtime.infer(changed).x == 3.0
+    info = runtime.model_info()
+    assert info["runtime"] == "counting"
+    assert info["pose_cache"]["hits"] == 2
+    assert info["pose_cache"]["misses"] == 3
+
+
+def test_build_runtime_wraps_with_pose_cache_only_when_enabled() -> None:
+    assert isinstance(build_runtime({"model_path": ""}), MockDLCRuntime)
+    runtime = build_runtime({"model_path": "", "cache": {"enabled": True, "max_reuse": 5}})
+    assert isinstance(runtime, PoseCacheRuntime)
+    assert isinstance(runtime.runtime, MockDLCRuntime)
+    assert runtime.max_reuse == 5
+
+
+def test_mock_runtime_downsampled_centroid_matches_full_resolution() -> None:
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    frame[380:421, 660:741] = 200
+
+    full = MockDLCRuntime(downsample=1).infer(frame)
+    auto = MockDLCRuntime().infer(frame)
+    assert (full.x, full.y) == (700.0, 400.0)
+    assert abs(auto.x - full.x) <= 0.5
+    assert abs(auto.y - full.y) <= 0.5
+    assert auto.p == 1.0
+
+
+def test_mock_runtime_maps_centroid_with_real_ratio_on_uneven_width() -> None:
+    # 1918 // 4 = 479 columns, so each small pixel spans 1918 / 479 ~ 4.004 full-res pixels.
+    frame = np.zeros((1080, 1918, 3), dtype=np.uint8)
+    frame[500:541, 1900:1918] = 200
+
+    full = MockDLCRuntime(downsample=1).infer(frame)
+    auto = MockDLCRuntime().infer(frame)
+    assert full.x == 1908.5
+    # Thresholding the area-averaged edge columns costs about one small pixel's worth of accuracy at most.
+    assert abs(auto.x - full.x) <= 1.5
+    assert abs(auto.y - full.y) <= 1.5
+
+
+def test_mock_runtime_downsample_larger_than_frame_is_clamped() -> None:
+    frame = np.zeros((6, 6, 3), dtype=np.uint8)
+    frame[1:3, 1:3] = 200
+
+    pose = MockDLCRuntime(downsample=8).infer(frame)
+    assert pose.p == 1.0
+    assert 0.0 <= pose.x < 6.0 and 0.0 <= pose.y < 6.0
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pytest
+
+from cpp_dlc_live.realtime import pipeline as pipeline_module
+from cpp_dlc_live.realtime.dlc_runtime import PoseResult, RuntimeBase
+from cpp_dlc_live.realtime.pipeline import FramePipeline
+
+
+class _FakeCamera:
+    def __init__(self, n_frames: int):
+        self.n_frames = n_frames
+        self.reads = 0
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.reads >= self.n_frames:
+            return False, None
+        frame = np.full((4, 4, 3), self.reads, dtype=np.uint8)
+        self.reads += 1
+        return True, frame
+
+
+class _FakeRuntime(RuntimeBase):
+    def __init__(self, fail_at: Optional[int] = None):
+        self.fail_at = fail_at
+
+    def infer(self, frame: np.ndarray) -> PoseResult:
+        idx = int(frame[0, 0, 0])
+        if self.fail_at is not None and idx == self.fail_at:
+            raise RuntimeError("inference failed")
+        return PoseResult(x=float(idx), y=0.0, p=1.0, bodypart="center", keypoints={})
+
+    def model_info(self) -> Dict[str, Any]:
+        return {"runtime": "fake"}
+
+
+@pytest.mark.parametrize("threaded", [True, False])
+def test_frame_pipeline_keeps_frame_order_until_end_of_stream(threaded: bool) -> None:
+    pipeline = FramePipeline(_FakeCamera(25), _FakeRuntime(), threaded=threaded, queue_size=2)
+    pipeline.start()
+    try:
+        xs = []
+        while True:
+            packet = pipeline.get()
+            if packet is None:
+                break
+            xs.append(packet.pose.x)
+        assert xs == [float(i) for i in range(25)]
+        assert pipeline.get() is None
+    finally:
+        pipeline.stop()
+
+
+def test_frame_pipeline_reraises_worker_exception() -> None:
+    pipeline = FramePipeline(_FakeCamera(10), _FakeRuntime(fail_at=3), threaded=True)
+    pipeline.start()
+    try:
+        for _ in range(3):
+            assert pipeline.get() is not None
+        with pytest.raises(RuntimeError, match="inference failed"):
+            pipeline.get()
+    finally:
+        pipeline.stop()
+
+
+def test_frame_pipeline_drain_to_latest_skips_queued_frames() -> None:
+    camera = _FakeCamera(6)
+    pipeline = FramePipeline(camera, _FakeRuntime(), threaded=True, queue_size=8, drain_to_latest=True)
+    # Pre-fill the capture stage as if inference had fallen behind, then let the worker run.
+    for _ in range(6):
+        ok, frame = camera.read()
+        pipeline._capture_q.put((0.0, frame))
+    pipeline._capture_q.put(pipeline_module._EOS)
+    worker = threading.Thread(target=pipeline._inference_loop, daemon=True)
+    worker.start()
+    try:
+        packet = pipeline.get()
+        assert packet is not None and packet.pose.x == 5.0
+        assert pipeline.get() is None
+        assert pipeline.dropped_frames == 5
+    finally:
+        pipeline.stop()
+        worker.join(timeout=2.0)
+
+
+def test_frame_pipeline_idle_decimation_reuses_pose_between_inferences() -> None:
+    pipeline = FramePipeline(_FakeCamera(7), _FakeRuntime(), threaded=False, idle_every_n=3, idle_max_stale_s=1.0)
+    xs = []
+    for i in range(7):
+        pipeline.set_idle(i < 5)
+        packet = pipeline.get()
+        assert packet is not None
+        xs.append(packet.pose.x)
+    assert xs == [0.0, 0.0, 0.0, 3.0, 3.0, 5.0, 6.0]
+    assert pipeline.decimated_frames == 3
+
+
+def test_frame_pipeline_idle_decimation_respects_max_stale(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = iter([0.0, 0.05, 0.5, 0.55])
+    monkeypatch.setattr(pipeline_module.time, "time", lambda: next(clock))
+    pipeline = FramePipeline(_FakeCamera(4), _FakeRuntime(), threaded=False, idle_every_n=4, idle_max_stale_s=0.1)
+    pipeline.set_idle(True)
+    xs = [pipeline.get().pose.x for _ in range(4)]
+    assert xs == [0.0, 0.0, 2.0, 2.0]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pytest
+
+from cpp_dlc_live.utils import json_utils
+from cpp_dlc_live.utils.io_utils import file_sha256, load_yaml, save_json
+from cpp_dlc_live.utils.json_utils import json_loads
+
+
+def test_load_yaml_cache_returns_independent_copies(tmp_path) -> None:
+    load_yaml.cache_clear()
+    path = tmp_path / "config.yaml"
+    path.write_text("analysis:\n  cm_per_px: 0.5\n", encoding="utf-8")
+
+    first = load_yaml(path)
+    first["analysis"]["cm_per_px"] = 9.0
+    second = load_yaml(path)
+
+    assert second == {"analysis": {"cm_per_px": 0.5}}
+
+
+def test_load_yaml_cache_invalidates_on_change(tmp_path) -> None:
+    load_yaml.cache_clear()
+    path = tmp_path / "config.yaml"
+    path.write_text("fixed_fps: 10\n", encoding="utf-8")
+    assert load_yaml(path) == {"fixed_fps": 10}
+
+    path.write_text("fixed_fps: 25\n", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert load_yaml(path) == {"fixed_fps": 25}
+
+
+def test_file_sha256_matches_hashlib_and_tracks_changes(tmp_path) -> None:
+    file_sha256.cache_clear()
+    path = tmp_path / "config_used.yaml"
+    path.write_bytes(b"camera:\n  fps_target: 30\n")
+    assert file_sha256(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    path.write_bytes(b"camera:\n  fps_target: 60\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert file_sha256(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_file_sha256_readinto_fallback(tmp_path, monkeypatch) -> None:
+    file_sha256.cache_clear()
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    path = tmp_path / "model.pt"
+    path.write_bytes(os.urandom(1024 * 1024 * 2 + 123))
+    assert file_sha256(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_save_json_layout_matches_stdlib_indent(tmp_path) -> None:
+    data = {"session": "测试", "fps": 29.97, "counts": {"frames": 10}, "empty": [], "ok": True, "none": None}
+    path = tmp_path / "metadata.json"
+    save_json(data, path)
+    assert path.read_text(encoding="utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_save_json_accepts_numpy_values(tmp_path) -> None:
+    pytest.importorskip("orjson")
+    path = tmp_path / "report.json"
+    save_json({"frame_idx": np.int64(3), "x": np.float32(1.5), "xy": np.array([1.0, 2.0]), 7: "seven"}, path)
+    assert json_loads(path.read_bytes()) == {"frame_idx": 3, "x": 1.5, "xy": [1.0, 2.0], "7": "seven"}
+
+
+def test_save_json_writes_non_finite_floats_as_null_without_orjson(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(json_utils, "orjson", None)
+    path = tmp_path / "summary.json"
+    save_json({"x": float("nan"), "rows": [1.0, float("inf")], "nested": {"y": np.float64("nan")}}, path)
+    assert path.read_text(encoding="utf-8") == json.dumps(
+        {"x": None, "rows": [1.0, None], "nested": {"y": None}}, indent=2, ensure_ascii=False
+    )
+
+
+def test_save_json_output_does_not_depend_on_orjson(tmp_path, monkeypatch) -> None:
+    data = {"summary": {"time_in_a_s": float("nan"), "bouts": [2, -float("inf")]}, "name": "sessão"}
+    with_default = tmp_path / "default.json"
+    save_json(data, with_default)
+    monkeypatch.setattr(json_utils, "orjson", None)
+    stdlib_only = tmp_path / "stdlib.json"
+    save_json(data, stdlib_only)
+    assert with_default.read_bytes() == stdlib_only.read_bytes()
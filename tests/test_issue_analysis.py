@@ -1,8 +1,11 @@
+import hashlib
 import json
 
 import pandas as pd
+import pytest
 
-from cpp_dlc_live.analysis.issues import analyze_issues
+from cpp_dlc_live.analysis.issues import _build_issue_summary, _build_timeline, analyze_issues
+from cpp_dlc_live.utils import json_utils
 
 
 def test_analyze_issues_outputs_summary_and_incidents(tmp_path) -> None:
@@ -69,3 +72,133 @@ def test_analyze_issues_handles_missing_issue_file(tmp_path) -> None:
     assert summary_df.empty
     assert timeline_df.empty
     assert incident_df.empty
+
+
+def test_issue_summary_reports_first_last_per_event_level() -> None:
+    timeline_df = _build_timeline(
+        [
+            {"t_wall": 5.0, "event": "fps_warning", "level": "WARNING", "frame_idx": 50},
+            {"t_wall": None, "event": "jsonl_parse_error", "level": "ERROR"},
+            {"t_wall": 2.0, "event": "fps_warning", "level": "WARNING", "frame_idx": 20},
+            {"t_wall": 3.0, "event": "fps_warning", "level": "INFO"},
+        ]
+    )
+
+    summary_df = _build_issue_summary(timeline_df)
+
+    assert summary_df["event"].tolist() == ["fps_warning", "fps_warning", "jsonl_parse_error"]
+    assert summary_df["level"].tolist() == ["WARNING", "INFO", "ERROR"]
+    assert summary_df["count"].tolist() == [2, 1, 1]
+    assert summary_df.loc[0, "first_t_wall"] == 2.0
+    assert summary_df.loc[0, "last_t_wall"] == 5.0
+    assert summary_df.loc[0, "first_frame_idx"] == 20
+    assert summary_df.loc[0, "last_frame_idx"] == 50
+    assert pd.isna(summary_df.loc[2, "first_t_wall"])
+
+
+def test_analyze_issues_records_invalid_jsonl_lines(tmp_path) -> None:
+    issue_file = tmp_path / "issue_events.jsonl"
+    issue_file.write_text(
+        '{"t_wall": 1.0, "event": "session_start", "level": "INFO"}\n'
+        "{not json\n"
+        "\n"
+        "[1, 2]\n",
+        encoding="utf-8",
+    )
+
+    outputs = analyze_issues(session_dir=tmp_path)
+
+    timeline_df = pd.read_csv(outputs["issue_timeline"])
+    assert timeline_df["event"].tolist() == ["session_start", "jsonl_parse_error", "jsonl_non_object_record"]
+
+
+def test_analyze_issues_reads_lines_with_nan_values(tmp_path) -> None:
+    # json.dumps writes NaN literals, e.g. last_context x/y before the first pose.
+    (tmp_path / "issue_events.jsonl").write_text(
+        '{"t_wall": 1.0, "event": "runtime_exception", "level": "ERROR", "frame_idx": 3, "x": NaN}\n',
+        encoding="utf-8",
+    )
+
+    outputs = analyze_issues(session_dir=tmp_path)
+
+    timeline_df = pd.read_csv(outputs["issue_timeline"])
+    assert timeline_df["event"].tolist() == ["runtime_exception"]
+    assert timeline_df["details_json"].tolist() == ['{"x":null}']
+
+
+def test_timeline_t_utc_tolerates_epochs_outside_pandas_range() -> None:
+    events = [{"t_wall": t, "event": "frame_drop", "level": "WARN"} for t in (1.5, 1e11, 1e12, 1e20, -1.0)]
+
+    timeline_df = _build_timeline(events)
+
+    assert timeline_df["t_utc"].tolist() == [
+        "1970-01-01T00:00:01.500000+00:00",
+        "5138-11-16T09:46:40+00:00",
+        None,
+        None,
+        None,
+    ]
+
+
+def test_timeline_details_json_does_not_depend_on_orjson(monkeypatch) -> None:
+    events = [{"t_wall": 1.0, "event": "frame_drop", "level": "WARN", "x": float("nan"), "label": "câmara", "b": 1}]
+    expected = _build_timeline(events)["details_json"].tolist()
+    monkeypatch.setattr(json_utils, "orjson", None)
+    assert _build_timeline(events)["details_json"].tolist() == expected
+    assert expected == ['{"b":1,"label":"câmara","x":null}']
+
+
+def test_incident_summary_reads_nan_context_and_ignores_old_cache(tmp_path) -> None:
+    report = tmp_path / "incident_report_20260227_000000.json"
+    report.write_text(
+        '{"exception_type": "RuntimeError", "last_context": {"frame_idx": 7, "x": NaN, "y": NaN}}',
+        encoding="utf-8",
+    )
+    # Sidecar in the pre-version format, holding the parse-error row older code produced.
+    stale_key = {
+        "max_mtime_ns": report.stat().st_mtime_ns,
+        "names_sha1": hashlib.sha1(report.name.encode("utf-8")).hexdigest(),
+    }
+    columns = ["file", "time_utc", "exception_type", "exception_message", "frame_idx", "chamber", "laser_state"]
+    stale = {name: [None] for name in columns}
+    stale["file"] = [report.name]
+    stale["exception_type"] = ["JSONDecodeError"]
+    (tmp_path / ".incident_summary_cache.json").write_text(
+        json.dumps({"key": stale_key, "columns": stale}), encoding="utf-8"
+    )
+
+    incident_df = pd.read_csv(analyze_issues(session_dir=tmp_path)["incident_summary"])
+
+    assert incident_df["exception_type"].tolist() == ["RuntimeError"]
+    assert int(incident_df.loc[0, "frame_idx"]) == 7
+
+
+def test_incident_summary_cache_refreshes_when_reports_change(tmp_path) -> None:
+    report = tmp_path / "incident_report_20260227_000000.json"
+    report.write_text(json.dumps({"exception_type": "RuntimeError", "last_context": {"frame_idx": 1}}), encoding="utf-8")
+
+    first = pd.read_csv(analyze_issues(session_dir=tmp_path)["incident_summary"])
+    assert (tmp_path / ".incident_summary_cache.json").exists()
+
+    cached = pd.read_csv(analyze_issues(session_dir=tmp_path)["incident_summary"])
+    pd.testing.assert_frame_equal(first, cached)
+
+    (tmp_path / "incident_report_20260227_000100.json").write_text(
+        json.dumps({"exception_type": "ValueError", "last_context": {"frame_idx": 2}}),
+        encoding="utf-8",
+    )
+    refreshed = pd.read_csv(analyze_issues(session_dir=tmp_path)["incident_summary"])
+    assert refreshed["exception_type"].tolist() == ["RuntimeError", "ValueError"]
+
+
+def test_analyze_issues_writes_timeline_parquet_when_pyarrow_available(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    (tmp_path / "issue_events.jsonl").write_text(
+        '{"t_wall": 1.0, "event": "session_start", "level": "INFO", "frame_idx": 0}\n',
+        encoding="utf-8",
+    )
+
+    outputs = analyze_issues(session_dir=tmp_path)
+
+    parquet_df = pd.read_parquet(outputs["issue_timeline_parquet"])
+    assert parquet_df["event"].tolist() == ["session_start"]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+
+from cpp_dlc_live.realtime.issue_logger import SessionIssueLogger
+from cpp_dlc_live.utils import json_utils
+
+
+def test_issue_logger_writes_queued_events_in_order_on_close(tmp_path) -> None:
+    path = tmp_path / "issue_events.jsonl"
+    logger = SessionIssueLogger(path)
+    context = {"frame_idx": 0}
+    for i in range(50):
+        context["frame_idx"] = i
+        logger.log("heartbeat", context=context, frame_idx=i)
+    logger.close()
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [r["frame_idx"] for r in records] == list(range(50))
+    # Each record is a snapshot taken at log() time.
+    assert [r["context"]["frame_idx"] for r in records] == list(range(50))
+    assert records[0]["event"] == "heartbeat" and records[0]["level"] == "INFO"
+
+
+def test_issue_logger_disabled_writes_nothing(tmp_path) -> None:
+    path = tmp_path / "issue_events.jsonl"
+    logger = SessionIssueLogger(path, enabled=False)
+    logger.log("heartbeat")
+    logger.close()
+    assert not path.exists()
+
+
+def test_issue_logger_converts_non_scalar_fields(tmp_path) -> None:
+    path = tmp_path / "issue_events.jsonl"
+    logger = SessionIssueLogger(path)
+    logger.log("writer_started", level="info", path=tmp_path, size=(4, 3), fps=30.0)
+    logger.close()
+
+    record = json.loads(path.read_text(encoding="utf-8"))
+    assert record["level"] == "INFO"
+    assert record["path"] == str(tmp_path)
+    assert record["size"] == [4, 3]
+    assert record["fps"] == 30.0
+
+
+def test_issue_logger_lines_parse_with_project_json_loads(tmp_path) -> None:
+    from cpp_dlc_live.utils.json_utils import json_loads
+
+    path = tmp_path / "issue_events.jsonl"
+    logger = SessionIssueLogger(path)
+    logger.log("runtime_exception", level="ERROR", last_context={"x": float("nan"), "chamber": "chamber1"}, note="é")
+    logger.close()
+
+    record = json_loads(path.read_bytes().splitlines()[0])
+    assert record["last_context"]["chamber"] == "chamber1"
+    assert record["note"] == "é"
+
+
+def test_issue_logger_writes_nan_as_null_with_and_without_orjson(tmp_path, monkeypatch) -> None:
+    lines = []
+    for name, encoder in (("default", json_utils.orjson), ("stdlib", None)):
+        monkeypatch.setattr(json_utils, "orjson", encoder)
+        path = tmp_path / f"{name}.jsonl"
+        logger = SessionIssueLogger(path)
+        logger.log("runtime_exception", level="ERROR", last_context={"x": float("nan"), "y": float("inf")})
+        logger.close()
+        lines.append(json.loads(path.read_bytes())["last_context"])
+
+    assert lines == [{"x": None, "y": None}, {"x": None, "y": None}]
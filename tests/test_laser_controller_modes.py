@@ -86,3 +86,68 @@ def test_create_laser_controller_pulse_mode_validation() -> None:
                 "ctr_channel": "cDAQ1Mod4/ctr0",
             }
         )
+
+
+class _RecordingTask:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, value):
+        self.writes.append(value)
+
+
+def test_continuous_set_state_skips_unchanged_writes() -> None:
+    controller = NILaserControllerContinuous(line="Dev1/port0/line0")
+    task = _RecordingTask()
+    controller._do_task = task
+    controller.current_state = False
+
+    for on in (False, True, True, 1, False, 0):
+        controller.set_state(on)
+    assert task.writes == [True, False]
+    assert controller.current_state is False
+
+
+def test_gated_set_state_skips_unchanged_writes() -> None:
+    controller = NILaserControllerGated(
+        ctr_channel="Dev1/ctr0", pulse_term="/Dev1/PFI0", enable_line="Dev1/port0/line1", freq_hz=20.0, duty_cycle=0.5
+    )
+    task = _RecordingTask()
+    controller._enable_task = task
+    controller.current_state = False
+
+    for on in (False, True, True, False, False):
+        controller.set_state(on)
+    assert task.writes == [True, False]
+
+
+class _CounterTask:
+    def __init__(self):
+        self.calls = []
+
+    def start(self):
+        self.calls.append("start")
+
+    def stop(self):
+        self.calls.append("stop")
+
+
+def test_startstop_set_state_ignores_repeats_and_respects_min_hold(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("cpp_dlc_live.realtime.controller_ni.time.monotonic", lambda: now[0])
+    controller = NILaserControllerStartStop(
+        ctr_channel="Dev1/ctr0", pulse_term="/Dev1/PFI0", freq_hz=20.0, duty_cycle=0.5, min_on_s=1.0, min_off_s=0.0
+    )
+    task = _CounterTask()
+    controller._counter_task = task
+
+    controller.set_state(True)
+    controller.set_state(True)
+    now[0] += 0.5
+    controller.set_state(False)  # deferred: min_on_s not reached
+    assert controller.current_state is True
+    now[0] += 0.6
+    controller.set_state(False)
+    controller.set_state(False)
+    assert task.calls == ["start", "stop"]
+    assert controller.current_state is False
@@ -67,3 +67,17 @@ def test_laser_on_chambers_none_disables_all_chamber_triggers() -> None:
     assert not app._resolve_laser_target("chamber1", "unknown", on_chambers=on_chambers)
     assert not app._resolve_laser_target("chamber2", "unknown", on_chambers=on_chambers)
     assert not app._resolve_laser_target("neutral", "chamber1", on_chambers=on_chambers)
+
+
+def test_laser_target_table_matches_resolver() -> None:
+    from cpp_dlc_live.realtime.roi import CHAMBER_NAMES
+
+    laser_cfg = {"enabled": True, "on_chambers": ["chamber2"], "unknown_policy": "hold_last"}
+    app = _build_app(laser_cfg, {"strategy_on_neutral": "hold_last"})
+    on_chambers = app._resolve_laser_on_chambers(laser_cfg)
+    table = app._build_laser_target_table(on_chambers)
+    candidates = app._build_neutral_candidate_table()
+    for i, chamber in enumerate(CHAMBER_NAMES):
+        for j, last in enumerate(CHAMBER_NAMES):
+            assert table[i][j] == app._resolve_laser_target(chamber, last, on_chambers=on_chambers)
+            assert CHAMBER_NAMES[candidates[i][j]] == app._map_neutral_candidate(chamber, last)
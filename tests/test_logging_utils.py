@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from cpp_dlc_live.realtime.logging_utils import setup_logging, stop_logging
+
+
+def test_setup_logging_writes_queued_records_to_run_log(tmp_path) -> None:
+    logger = setup_logging(tmp_path, logger_name="cpp_dlc_live_test", file_prefix=None)
+    logger.debug("debug %d", 1)
+    logger.info("info line")
+    stop_logging("cpp_dlc_live_test")
+
+    text = (tmp_path / "run.log").read_text(encoding="utf-8")
+    assert "| DEBUG | cpp_dlc_live_test | debug 1" in text
+    assert "| INFO | cpp_dlc_live_test | info line" in text
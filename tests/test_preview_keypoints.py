@@ -1,9 +1,14 @@
+import numpy as np
+
 from cpp_dlc_live.realtime.app import (
+    RealtimeApp,
     _format_laser_mode_overlay,
     _parse_display_bodyparts,
     _resolve_acclimation_config,
     _resolve_preview_points,
+    _scaled_frame_size,
 )
+from cpp_dlc_live.realtime.roi import ChamberROI, RectROI
 
 
 def test_parse_display_bodyparts_normalization() -> None:
@@ -65,3 +70,33 @@ def test_resolve_acclimation_config() -> None:
     enabled2, duration2 = _resolve_acclimation_config({"session_info": {"acclimation_enabled": True, "acclimation_duration_s": 30}})
     assert enabled2 is True
     assert duration2 == 30.0
+
+
+def test_render_preview_frame_downscales_to_max_width() -> None:
+    assert _scaled_frame_size(1920, 1080, 640) == (640, 360)
+    assert _scaled_frame_size(320, 240, 640) == (320, 240)
+    assert _scaled_frame_size(1920, 1080, None) == (1920, 1080)
+
+    roi = ChamberROI(chamber1=RectROI(0, 0, 900, 1080), chamber2=RectROI(1000, 0, 1920, 1080), roi_type="rect")
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    vis = RealtimeApp._render_preview_frame(
+        frame=frame,
+        roi=roi,
+        x=1500.0,
+        y=900.0,
+        control_p=1.0,
+        control_bodypart="center",
+        keypoints={"center": (1500.0, 900.0, 1.0)},
+        display_bodyparts=None,
+        chamber="chamber2",
+        laser_state=0,
+        laser_mode_text="dryrun",
+        fps_est=30.0,
+        inference_ms=5.0,
+        elapsed_s=1.0,
+        max_width=640,
+    )
+    assert vis.shape == (360, 640, 3)
+    # Control point is drawn at the scaled position (white filled circle).
+    assert tuple(vis[300, 500]) == (255, 255, 255)
+    assert not frame.any()
@@ -0,0 +1,42 @@
+import threading
+
+import numpy as np
+
+from cpp_dlc_live.realtime import preview as preview_module
+from cpp_dlc_live.realtime.preview import PreviewWorker
+
+
+def test_preview_worker_renders_latest_frame_and_reports_exit_key(monkeypatch) -> None:
+    shown = []
+    displayed = threading.Event()
+
+    def fake_imshow(_name, image):
+        shown.append(int(image[0, 0]))
+        displayed.set()
+
+    monkeypatch.setattr(preview_module.cv2, "imshow", fake_imshow)
+    monkeypatch.setattr(preview_module.cv2, "pollKey", lambda: ord("q"), raising=False)
+    monkeypatch.setattr(preview_module.cv2, "destroyWindow", lambda _name: None)
+
+    worker = PreviewWorker()
+    # Submitted before start: only the newest frame survives.
+    worker.submit(np.full((2, 2), 1, dtype=np.uint8))
+    worker.submit(lambda: np.full((2, 2), 2, dtype=np.uint8))
+    worker.start()
+    try:
+        assert displayed.wait(timeout=2.0)
+        assert worker.exit_requested.wait(timeout=2.0)
+    finally:
+        worker.stop()
+    assert shown == [2]
+
+
+def test_poll_key_prefers_pollkey_and_falls_back_to_waitkey(monkeypatch) -> None:
+    monkeypatch.setattr(preview_module.cv2, "pollKey", lambda: -1, raising=False)
+    assert preview_module.poll_key() == 255
+
+    monkeypatch.delattr(preview_module.cv2, "pollKey", raising=False)
+    delays = []
+    monkeypatch.setattr(preview_module.cv2, "waitKey", lambda delay: delays.append(delay) or 27)
+    assert preview_module.poll_key() == 27
+    assert delays == [1]
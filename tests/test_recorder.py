@@ -0,0 +1,55 @@
+import csv
+import io
+
+import numpy as np
+
+from cpp_dlc_live.realtime.recorder import CSVRecorder
+
+
+def test_csv_recorder_matches_dictwriter_output(tmp_path) -> None:
+    fieldnames = ["t_wall", "frame_idx", "x", "p", "chamber", "note"]
+    rows = [
+        {"t_wall": 1772150400.123456, "frame_idx": 0, "x": float("nan"), "p": np.float64(0.25), "chamber": "chamber1"},
+        {"t_wall": 1.0, "frame_idx": 1, "x": 12.5, "p": 1.0, "chamber": "neutral", "note": 'a,"b"\nc'},
+        {"t_wall": 2.0, "frame_idx": 2, "x": None, "p": True, "chamber": "", "note": "plain", "extra": 1},
+    ]
+
+    path = tmp_path / "log.csv"
+    recorder = CSVRecorder(path, fieldnames=fieldnames, flush_every=2)
+    for row in rows:
+        recorder.write_row(row)
+    recorder.close()
+
+    expected = io.StringIO(newline="")
+    writer = csv.DictWriter(expected, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+    assert path.read_bytes() == expected.getvalue().encode("utf-8")
+
+
+def test_csv_recorder_write_values_matches_write_row(tmp_path) -> None:
+    fieldnames = ["t_wall", "frame_idx", "x", "chamber"]
+    row = {"t_wall": 1.5, "frame_idx": 3, "x": float("nan"), "chamber": "chamber2"}
+
+    by_row = CSVRecorder(tmp_path / "row.csv", fieldnames=fieldnames)
+    by_row.write_row(row)
+    by_row.close()
+    by_values = CSVRecorder(tmp_path / "values.csv", fieldnames=fieldnames)
+    by_values.write_values(*(row[k] for k in fieldnames))
+    by_values.close()
+    assert (tmp_path / "values.csv").read_bytes() == (tmp_path / "row.csv").read_bytes()
+
+
+def test_csv_recorder_flushes_on_interval(tmp_path, monkeypatch) -> None:
+    from cpp_dlc_live.realtime import recorder as recorder_module
+
+    now = [100.0]
+    monkeypatch.setattr(recorder_module.time, "monotonic", lambda: now[0])
+    path = tmp_path / "log.csv"
+    recorder = CSVRecorder(path, fieldnames=["a"], flush_every=1000, flush_interval_s=1.0)
+    recorder.write_values(1)
+    assert b"1\r\n" not in path.read_bytes()
+    now[0] += 1.5
+    recorder.write_values(2)
+    assert path.read_bytes() == b"a\r\n1\r\n2\r\n"
+    recorder.close()
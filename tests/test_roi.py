@@ -1,4 +1,7 @@
-from cpp_dlc_live.realtime.roi import ChamberROI, PolygonROI, RectROI
+import numpy as np
+
+from cpp_dlc_live.realtime import roi as roi_module
+from cpp_dlc_live.realtime.roi import ROI, ChamberROI, PolygonROI, RectROI
 
 
 def test_polygon_contains_inside_outside_boundary() -> None:
@@ -26,3 +29,86 @@ def test_neutral_has_priority() -> None:
     assert chamber.classify(7, 5) == "neutral"
     assert chamber.classify(2, 5) == "chamber1"
     assert chamber.classify(27, 5) == "chamber2"
+    assert chamber.classify_code(7, 5) == roi_module.Chamber.NEUTRAL
+    assert chamber.classify_code(40, 5) == roi_module.Chamber.UNKNOWN
+
+
+def test_packed_polygon_classifier_matches_contains() -> None:
+    ch1 = PolygonROI(points=[(0, 0), (10, 0), (10, 10), (0, 10)])
+    ch2 = PolygonROI(points=[(20, 0), (30, 0), (28, 12), (20, 10)])
+    neutral = PolygonROI(points=[(5, 0), (25, 0), (25, 10), (5, 10)])
+    packed = roi_module._pack_polygons([neutral.points, ch1.points, ch2.points])
+    labels = ("neutral", "chamber1", "chamber2")
+
+    for x in np.arange(-2.0, 33.0, 0.5):
+        for y in np.arange(-2.0, 14.0, 0.5):
+            idx = roi_module._classify_polygons_py(float(x), float(y), *packed)
+            expected = next((name for name, r in zip(labels, (neutral, ch1, ch2)) if r.contains(x, y)), "unknown")
+            assert (labels[idx] if idx >= 0 else "unknown") == expected
+
+
+def test_draw_into_reused_buffer_matches_copy() -> None:
+    chamber = ChamberROI(chamber1=RectROI(2, 2, 20, 20), chamber2=RectROI(30, 2, 50, 20))
+    frame = np.zeros((32, 64, 3), dtype=np.uint8)
+    out = np.full_like(frame, 7)
+
+    result = chamber.draw(frame, out=out)
+
+    assert result is out
+    assert np.array_equal(result, chamber.draw(frame))
+    assert not frame.any()
+
+
+def test_classify_batch_matches_classify_code() -> None:
+    ch1 = PolygonROI(points=[(0, 0), (10, 0), (10, 10), (0, 10)])
+    ch2 = PolygonROI(points=[(20, 0), (30, 0), (28, 12), (20, 10)])
+    neutral = PolygonROI(points=[(5, 0), (25, 0), (25, 10), (5, 10)])
+    rect = ChamberROI(chamber1=RectROI(0, 0, 10, 10), chamber2=RectROI(20, 0, 30, 10), roi_type="rect")
+    xs, ys = np.meshgrid(np.arange(-2.0, 33.0, 0.5), np.arange(-2.0, 14.0, 0.5))
+    xs = np.append(xs.ravel(), np.nan)
+    ys = np.append(ys.ravel(), 5.0)
+
+    for chamber in (ChamberROI(chamber1=ch1, chamber2=ch2, neutral=neutral), rect):
+        labels = chamber.classify_batch(xs, ys)
+        assert labels.dtype == np.int8
+        assert labels.tolist() == [chamber.classify_code(x, y) for x, y in zip(xs, ys)]
+
+
+def test_polygon_contains_classifier_paths_and_batch_agree() -> None:
+    roi = PolygonROI(points=[(20, 0), (30, 0), (28, 12), (20, 10), (24, 5)])
+    pts = np.array(roi.points)
+    ends = np.roll(pts, -1, axis=0)
+    rng = np.random.default_rng(0)
+    t = rng.random((len(pts), 8, 1))
+    on_edges = (pts[:, None, :] + t * (ends - pts)[:, None, :]).reshape(-1, 2)
+    grid = np.stack(np.meshgrid(np.arange(18.0, 32.0, 0.5), np.arange(-2.0, 14.0, 0.5)), axis=-1).reshape(-1, 2)
+    near = pts[rng.integers(len(pts), size=200)] + rng.normal(scale=1e-3, size=(200, 2))
+    query = np.vstack((pts, on_edges, grid, near, rng.uniform((15, -5), (35, 15), size=(500, 2)), [[np.nan, 5.0]]))
+
+    packed = (
+        np.asarray(roi._vertices, dtype=np.float64),
+        np.asarray(roi._offsets, dtype=np.int64),
+        np.asarray(roi._bboxes, dtype=np.float64),
+    )
+    scalar = np.array([roi.contains(x, y) for x, y in query])
+    python = np.array([roi_module._classify_polygons_py(x, y, *packed) == 0 for x, y in query])
+    batch = roi.contains_batch(query[:, 0], query[:, 1])
+
+    assert np.array_equal(scalar, python)
+    assert np.array_equal(scalar, batch)
+    assert scalar[: len(pts) + len(on_edges)].all()
+    assert not scalar[-1]
+    if roi_module._classify_polygons is not None:
+        compiled = np.array([roi_module._classify_polygons(x, y, *packed) == 0 for x, y in query])
+        assert np.array_equal(compiled, python)
+
+
+def test_cv_polyline_matches_points_for_every_roi_type() -> None:
+    class TriangleROI(ROI):
+        def as_points(self):
+            return [(1.0, 1.0), (9.0, 1.0), (5.0, 7.0)]
+
+    for roi in (RectROI(2, 3, 20, 10), PolygonROI(points=[(0, 0), (10.4, 0), (10, 10.6)]), TriangleROI()):
+        expected = np.array(roi.as_points(), dtype=np.int32).reshape(-1, 1, 2)
+        assert np.array_equal(roi.cv_polyline, expected)
+        assert roi.cv_polyline is roi.cv_polyline
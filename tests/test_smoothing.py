@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from cpp_dlc_live.realtime.smoothing import RollingMeanXY
+
+
+@pytest.mark.parametrize("window", [5, 64])
+def test_rolling_mean_matches_windowed_numpy_mean(window: int) -> None:
+    rng = np.random.default_rng(0)
+    pts = rng.uniform(0, 640, size=(200, 2))
+    smoother = RollingMeanXY(window=window, resum_every=17)
+
+    for i, (x, y) in enumerate(pts):
+        mx, my = smoother.update(float(x), float(y))
+        recent = pts[max(0, i - window + 1) : i + 1]
+        assert np.isclose(mx, recent[:, 0].mean(), rtol=0, atol=1e-9)
+        assert np.isclose(my, recent[:, 1].mean(), rtol=0, atol=1e-9)
+    assert len(smoother) == window
+
+
+def test_rolling_mean_window_one_is_identity() -> None:
+    smoother = RollingMeanXY(window=1)
+    assert smoother.update(3.0, 4.0) == (3.0, 4.0)
+    assert smoother.update(7.5, -1.0) == (7.5, -1.0)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import sys
+import threading
+from typing import List
+
+import numpy as np
+import pytest
+
+from cpp_dlc_live.realtime.video_writer import AsyncVideoWriter, FFmpegPipeWriter, resolve_hw_encoder
+
+
+class _FakeWriter:
+    def __init__(self, fail_at: int = -1):
+        self.frames: List[np.ndarray] = []
+        self.fail_at = fail_at
+        self.released = False
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def isOpened(self) -> bool:
+        return True
+
+    def write(self, frame: np.ndarray) -> None:
+        self.gate.wait()
+        if len(self.frames) == self.fail_at:
+            raise RuntimeError("encode failed")
+        self.frames.append(frame.copy())
+
+    def release(self) -> None:
+        self.released = True
+
+
+def test_async_video_writer_writes_every_frame_in_order() -> None:
+    fake = _FakeWriter()
+    fake.gate.clear()  # hold the encoder so writes pile up and buffers are recycled
+    writer = AsyncVideoWriter(fake, queue_size=2)
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    feeder = threading.Thread(target=lambda: [writer.write(np.full_like(frame, i)) for i in range(6)])
+    feeder.start()
+    fake.gate.set()
+    feeder.join(timeout=5.0)
+    writer.release()
+
+    assert fake.released
+    assert [int(f[0, 0, 0]) for f in fake.frames] == list(range(6))
+
+
+def test_async_video_writer_copies_caller_frame() -> None:
+    fake = _FakeWriter()
+    fake.gate.clear()
+    writer = AsyncVideoWriter(fake)
+    frame = np.zeros((2, 2, 3), dtype=np.uint8)
+    writer.write(frame)
+    frame[:] = 255
+    fake.gate.set()
+    writer.release()
+    assert int(fake.frames[0].max()) == 0
+
+
+def test_async_video_writer_reraises_encoder_error_on_release() -> None:
+    fake = _FakeWriter(fail_at=1)
+    writer = AsyncVideoWriter(fake, queue_size=2)
+    for _ in range(4):
+        try:
+            writer.write(np.zeros((2, 2, 3), dtype=np.uint8))
+        except RuntimeError:
+            break
+    with pytest.raises(RuntimeError, match="encode failed"):
+        writer.release()
+    assert fake.released
+
+
+def test_resolve_hw_encoder_off_and_unknown_use_software() -> None:
+    assert resolve_hw_encoder("off") is None
+    assert resolve_hw_encoder(False) is None
+    assert resolve_hw_encoder("not-an-encoder") is None
+    assert resolve_hw_encoder("nvenc", ffmpeg_bin="definitely-missing-ffmpeg") is None
+
+
+def test_ffmpeg_pipe_writer_missing_binary_is_not_opened(tmp_path) -> None:
+    writer = FFmpegPipeWriter(tmp_path / "out.mp4", 30.0, (8, 4), "nvenc", ffmpeg_bin=str(tmp_path / "missing"))
+    assert not writer.isOpened()
+    writer.release()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as a stand-in for ffmpeg")
+def test_ffmpeg_pipe_writer_streams_raw_bgr_frames(tmp_path) -> None:
+    fake_ffmpeg = tmp_path / "ffmpeg"
+    fake_ffmpeg.write_text('#!/bin/sh\nfor a; do out="$a"; done\ncat > "$out"\n')
+    fake_ffmpeg.chmod(0o755)
+    out = tmp_path / "out.mp4"
+
+    writer = FFmpegPipeWriter(out, 30.0, (8, 4), "nvenc", ffmpeg_bin=str(fake_ffmpeg))
+    assert writer.isOpened()
+    frames = [np.full((4, 8, 3), i, dtype=np.uint8) for i in range(3)]
+    for frame in frames:
+        writer.write(frame)
+    writer.release()
+
+    assert out.read_bytes() == b"".join(f.tobytes() for f in frames)
+
+
+def test_async_writer_renders_on_encoder_thread_from_its_own_copy() -> None:
+    inner = _FakeWriter()
+    writer = AsyncVideoWriter(inner, queue_size=2)
+    render_threads = []
+
+    def render(frame):
+        render_threads.append(threading.current_thread().name)
+        frame[0, 0] = 255
+        return frame
+
+    source = np.zeros((2, 2), dtype=np.uint8)
+    writer.write(source, render=render)
+    writer.release()
+
+    assert render_threads == ["cpp_dlc_live-encoder"]
+    assert inner.frames[0][0, 0] == 255
+    assert source[0, 0] == 0